@@ -0,0 +1,167 @@
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from functools import partial
+
+import numpy as np
+
+import algorithm_engine
+from scheduler_registry import available_algorithms, get_algorithm
+
+DISK_SIZE = 200
+START_HEAD = 53
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+DISTRIBUTIONS = ["uniform", "sorted", "hotspot"]
+
+# (name, function, input kind, largest request count worth timing)
+ENGINES = [
+    ("fcfs", algorithm_engine.fcfs, "list", None),
+    ("sstf", algorithm_engine.sstf, "list", 2 * 10 ** 4),
+    ("sstf_fast", algorithm_engine.sstf_fast, "list", None),
+    ("scan", partial(algorithm_engine.scan, diskSize=DISK_SIZE), "list", None),
+    ("c_scan", partial(algorithm_engine.c_scan, diskSize=DISK_SIZE), "list", None),
+] + [
+    # Every registered algorithm's vectorized engine, full and metrics-only
+    (f"{mode}.{name}", partial(get_algorithm(name).run, diskSize=DISK_SIZE, keepOrder=keep), "array", None)
+    for name in available_algorithms()
+    for mode, keep in (("vector", True), ("summary", False))
+]
+
+def make_workload(distribution, size, diskSize=DISK_SIZE, seed=0):
+    """
+    Build a reproducible request array.
+    Args:
+        distribution (str): One of DISTRIBUTIONS.
+        size (int): Number of requests.
+        diskSize (int): Max disk track num.
+        seed (int): RNG seed.
+    Returns:
+        ndarray: int64 request tracks.
+    """
+    rng = np.random.default_rng(seed)
+    if distribution == "uniform":
+        return rng.integers(0, diskSize, size, dtype=np.int64)
+    if distribution == "sorted":
+        return np.sort(rng.integers(0, diskSize, size, dtype=np.int64))
+    if distribution == "hotspot":
+        centres = rng.integers(0, diskSize, 4)
+        picks = rng.normal(centres[rng.integers(0, 4, size)], diskSize * 0.02)
+        return np.clip(np.rint(picks), 0, diskSize - 1).astype(np.int64)
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+def time_engine(func, reqs, repeat=3):
+    """Best wall time in seconds over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(reqs, START_HEAD)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def peak_memory(func, reqs):
+    """Peak bytes allocated during one run, measured with tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(reqs, START_HEAD)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_benchmarks(sizes=DEFAULT_SIZES, distributions=DISTRIBUTIONS, engines=ENGINES,
+                   repeat=3, measureMemory=True, log=print):
+    """
+    Time every engine over every (distribution, size) pair.
+    Returns:
+        dict: Baseline document with run metadata and one entry per measurement.
+    """
+    results = []
+    for distribution in distributions:
+        for size in sizes:
+            data = make_workload(distribution, size)
+            asList = None
+            for name, func, kind, maxSize in engines:
+                if maxSize is not None and size > maxSize:
+                    continue
+                if kind == "list":
+                    asList = data.tolist() if asList is None else asList
+                    reqs = asList
+                else:
+                    reqs = data
+                seconds = time_engine(func, reqs, repeat if size < 10 ** 6 else 1)
+                entry = {
+                    "engine": name,
+                    "distribution": distribution,
+                    "size": size,
+                    "seconds": seconds,
+                    "requestsPerSecond": size / seconds if seconds else None,
+                    "peakBytes": peak_memory(func, reqs) if measureMemory else None
+                }
+                results.append(entry)
+                if log:
+                    log(f"{name:<14} {distribution:<8} {size:>9} {seconds:10.4f}s")
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "results": results
+    }
+
+def compare(baseline, current, threshold=0.2, minSeconds=0.001):
+    """
+    Compare a run against a baseline.
+    Entries faster than minSeconds in the baseline are ignored as timer noise.
+    Returns:
+        list: (entry, baselineSeconds, ratio) for every slowdown above threshold.
+    """
+    previous = {(e["engine"], e["distribution"], e["size"]): e["seconds"] for e in baseline["results"]}
+    regressions = []
+    for entry in current["results"]:
+        old = previous.get((entry["engine"], entry["distribution"], entry["size"]))
+        if old is None or old < minSeconds:
+            continue
+        ratio = entry["seconds"] / old
+        if ratio > 1 + threshold:
+            regressions.append((entry, old, ratio))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark disk scheduling engines.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--distributions", nargs="+", default=DISTRIBUTIONS, choices=DISTRIBUTIONS)
+    parser.add_argument("--engines", nargs="+", help="Engine names to run (default: all).")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass.")
+    parser.add_argument("--save", help="Write this run as a baseline JSON file.")
+    parser.add_argument("--compare", help="Baseline JSON file to check this run against.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown (0.2 = 20%%).")
+    args = parser.parse_args(argv)
+
+    engines = [e for e in ENGINES if not args.engines or e[0] in args.engines]
+    current = run_benchmarks(args.sizes, args.distributions, engines, args.repeat, not args.no_memory)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(current, file, indent=2)
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            baseline = json.load(file)
+        regressions = compare(baseline, current, args.threshold)
+        for entry, old, ratio in regressions:
+            print(f"REGRESSION {entry['engine']} {entry['distribution']} n={entry['size']}: "
+                  f"{old:.4f}s -> {entry['seconds']:.4f}s ({ratio:.2f}x)")
+        if regressions:
+            return 1
+        print("No regressions above threshold.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from trace_loader import iter_trace_chunks
+
+# Layout: 64-byte header | tracks (count x int32/int64) | timestamps (count x float64, optional)
+MAGIC = b"DSKTRACE"
+VERSION = 1
+FLAG_TIMESTAMPS = 1
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("flags", "<u4"),
+    ("itemSize", "<u4"),
+    ("reserved", "<u4"),
+    ("diskSize", "<u8"),
+    ("count", "<u8"),
+    ("padding", "V24"),
+])
+HEADER_SIZE = HEADER_DTYPE.itemsize
+TRACK_DTYPES = {4: np.dtype("<i4"), 8: np.dtype("<i8")}
+
+def is_binary_trace(path):
+    """True if path starts with the binary trace magic bytes."""
+    with open(path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+class BinaryTrace:
+    """
+    A memory-mapped binary trace.
+    tracks (and timestamps, when present) are read-only numpy.memmap views,
+    so opening is O(1) and every process shares the same page-cached data.
+    """
+
+    def __init__(self, path):
+        header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+        if header.size != 1 or header["magic"][0] != MAGIC:
+            raise ValueError(f"{path} is not a binary disk trace.")
+        header = header[0]
+        if header["version"] != VERSION:
+            raise ValueError(f"Unsupported trace version {header['version']}.")
+        self.path = path
+        self.diskSize = int(header["diskSize"])
+        self.count = int(header["count"])
+        trackDtype = TRACK_DTYPES[int(header["itemSize"])]
+        self.tracks = self._map(trackDtype, HEADER_SIZE)
+        self.timestamps = None
+        if header["flags"] & FLAG_TIMESTAMPS:
+            self.timestamps = self._map(np.dtype("<f8"), HEADER_SIZE + self.count * trackDtype.itemsize)
+
+    def _map(self, dtype, offset):
+        if self.count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode='r', offset=offset, shape=(self.count,))
+
+    def __len__(self):
+        return self.count
+
+    def arrivals(self):
+        """Iterate (timestamp, track) pairs for event_engine."""
+        if self.timestamps is None:
+            raise ValueError("Trace has no timestamps.")
+        for start in range(0, self.count, 1 << 16):
+            stop = start + (1 << 16)
+            yield from zip(self.timestamps[start:stop].tolist(), self.tracks[start:stop].tolist())
+
+def open_trace(path):
+    """Open a binary trace as memory-mapped arrays."""
+    return BinaryTrace(path)
+
+class TraceWriter:
+    """
+    Stream request chunks into a binary trace file.
+    The header's count is patched in on close, so the total need not be known
+    up front. Use as a context manager.
+    """
+
+    def __init__(self, path, diskSize, dtype="int32", timestamps=False):
+        self.path = path
+        self.diskSize = diskSize
+        self.trackDtype = np.dtype(dtype).newbyteorder("<")
+        if self.trackDtype.itemsize not in TRACK_DTYPES or self.trackDtype.kind != "i":
+            raise ValueError("Track dtype must be int32 or int64.")
+        self.count = 0
+        self._file = open(path, 'wb')
+        self._file.write(bytes(HEADER_SIZE))
+        # Timestamps follow all tracks, so spool them until close()
+        self._times = tempfile.TemporaryFile() if timestamps else None
+
+    def write(self, tracks, timestamps=None):
+        """Append a chunk of tracks (and matching timestamps)."""
+        tracks = np.asarray(tracks)
+        if (timestamps is None) != (self._times is None):
+            raise ValueError("Timestamps must be given for every chunk or for none.")
+        if tracks.size:
+            info = np.iinfo(self.trackDtype)
+            if tracks.min() < 0 or tracks.max() > info.max:
+                raise ValueError(f"Tracks must be between 0 and {info.max}.")
+        self._file.write(tracks.astype(self.trackDtype, copy=False).tobytes())
+        if self._times is not None:
+            timestamps = np.asarray(timestamps, dtype="<f8")
+            if timestamps.size != tracks.size:
+                raise ValueError("Timestamps and tracks must have the same length.")
+            self._times.write(timestamps.tobytes())
+        self.count += int(tracks.size)
+
+    def close(self):
+        if self._file is None:
+            return
+        if self._times is not None:
+            self._times.seek(0)
+            shutil.copyfileobj(self._times, self._file)
+            self._times.close()
+        header = np.zeros(1, dtype=HEADER_DTYPE)
+        header["magic"] = MAGIC
+        header["version"] = VERSION
+        header["flags"] = FLAG_TIMESTAMPS if self._times is not None else 0
+        header["itemSize"] = self.trackDtype.itemsize
+        header["diskSize"] = self.diskSize
+        header["count"] = self.count
+        self._file.seek(0)
+        self._file.write(header.tobytes())
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        self.close()
+        if excType is not None:
+            os.remove(self.path)
+
+def write_trace(path, tracks, diskSize, timestamps=None, dtype="int32"):
+    """Write in-memory arrays as a binary trace."""
+    with TraceWriter(path, diskSize, dtype, timestamps is not None) as writer:
+        writer.write(tracks, timestamps)
+
+def convert_csv(csvPath, outPath, diskSize, dtype="int32", timestamped=False, progress=None):
+    """
+    Convert a CSV/text trace to the binary format in a single streaming pass.
+    Args:
+        csvPath (str): Source trace (may be gzip-compressed).
+        outPath (str): Destination binary trace.
+        diskSize (int): Disk size recorded in the header.
+        dtype (str): Track storage type, int32 or int64.
+        timestamped (bool): Source holds "timestamp, track" pairs.
+        progress (callable): Optional callback(bytesRead, totalBytes).
+    Returns:
+        int: Number of requests written.
+    """
+    with TraceWriter(outPath, diskSize, dtype, timestamped) as writer:
+        if not timestamped:
+            for chunk in iter_trace_chunks(csvPath, progress=progress):
+                writer.write(chunk)
+            return writer.count
+
+        leftover = np.empty(0, dtype=np.float64)
+        for chunk in iter_trace_chunks(csvPath, dtype=np.float64, progress=progress):
+            values = np.concatenate((leftover, chunk))
+            pairs = values.size // 2 * 2
+            leftover = values[pairs:]
+            times, tracks = values[0:pairs:2], values[1:pairs:2]
+            if np.any(tracks != np.floor(tracks)):
+                raise ValueError("Track numbers must be integers.")
+            writer.write(tracks.astype(np.int64), times)
+        if leftover.size:
+            raise ValueError("Timestamped trace has an odd number of values.")
+        return writer.count
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert a CSV/text trace to the binary trace format.")
+    parser.add_argument("source", help="CSV or text trace (may be .gz).")
+    parser.add_argument("dest", help="Output binary trace.")
+    parser.add_argument("--disk-size", type=int, required=True)
+    parser.add_argument("--dtype", choices=["int32", "int64"], default="int32")
+    parser.add_argument("--timestamped", action="store_true", help="Source holds 'timestamp, track' pairs.")
+    args = parser.parse_args(argv)
+    count = convert_csv(args.source, args.dest, args.disk_size, args.dtype, args.timestamped)
+    print(f"Wrote {count} requests to {args.dest}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# cli.py - headless entry point. Algorithms with a pure-Python reference
+# engine never pay for tkinter, matplotlib or numpy start-up.
+
+import argparse
+import contextlib
+import csv
+import json
+import logging
+import os
+import sys
+
+import instrumentation
+from input_module import parse_requests, read_requests
+from scheduler_registry import available_algorithms, get_algorithm
+
+logger = logging.getLogger(__name__)
+
+SEEK_FIELDS = ["p50", "p90", "p99", "p99.9", "max"]
+SUMMARY_FIELDS = (["source", "algorithm", "requests", "head Movement", "average Seek", "throughput"]
+                  + [f"{key} Seek" for key in SEEK_FIELDS])
+
+def summarize(source, reqs, head, diskSize, algorithms, includeOrder=False, driveModel=None):
+    """
+    Run the chosen algorithms on one request list.
+    With a drive model, average Seek is in ms and throughput in IOPS; the
+    seek Stats distribution stays in tracks.
+    Returns:
+        list: One summary dict per algorithm.
+    """
+    rows = []
+    for name in algorithms:
+        result = get_algorithm(name).run_reference(reqs, head, diskSize)
+        row = {
+            "source": source,
+            "algorithm": name,
+            "requests": len(reqs),
+            "head Movement": result["head Movement"],
+            "average Seek": result["average Seek"],
+            "throughput": result["throughput"],
+            "seek Stats": result["seek Stats"]
+        }
+        if driveModel is not None:
+            with instrumentation.timer("model.drive"):
+                timing = driveModel.evaluate(head, result["order"], len(reqs))
+            row["average Seek"] = timing["average Seek"]
+            row["throughput"] = timing["throughput"]
+            row["timing"] = timing
+        if includeOrder:
+            row["order"] = result["order"]
+        rows.append(row)
+    return rows
+
+def _csv_row(row):
+    """Flatten the seek percentiles into "p50 Seek"... columns."""
+    stats = row["seek Stats"]
+    return {**row, **{f"{key} Seek": stats[key] for key in SEEK_FIELDS}}
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run disk scheduling simulations without the GUI.")
+    parser.add_argument("files", nargs="*", help="Request files (CSV or text); reads stdin when omitted or '-'.")
+    parser.add_argument("--head", type=int, required=True, help="Initial head position.")
+    parser.add_argument("--disk-size", type=int, default=200, help="Number of tracks (default: 200).")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=[a for a in available_algorithms() if get_algorithm(a).hasReference],
+                        choices=available_algorithms())
+    parser.add_argument("-f", "--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--order", action="store_true", help="Include the service order (JSON only).")
+    parser.add_argument("--drive-model", metavar="PRESET",
+                        help="Report ms and IOPS with a drive model preset (hdd5400, hdd7200, hdd15k).")
+    parser.add_argument("--plot", metavar="PATH",
+                        help="Write a comparison plot (.png/.svg/.pdf); '{source}' expands to the input name.")
+    parser.add_argument("--animate", metavar="PATH",
+                        help="Encode the animation (.mp4, .gif or frame_%%05d.png); '{source}' expands as for --plot.")
+    parser.add_argument("--instrument", action="store_true",
+                        help="Record per-phase timings and operation counters (added to JSON output, or to stderr for CSV).")
+    parser.add_argument("--profile", metavar="FILE", help="Run under cProfile and write the stats to FILE.")
+    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], default="WARNING")
+    return parser
+
+def _output_path(pattern, source):
+    stem = "stdin" if source == "-" else os.path.basename(source).split(".")[0]
+    return pattern.replace("{source}", stem)
+
+def main(argv=None, stdin=None, stdout=None):
+    args = build_parser().parse_args(argv)
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    logging.basicConfig(level=args.log_level, format="%(levelname)s %(name)s: %(message)s")
+    if args.instrument:
+        instrumentation.reset()
+        instrumentation.enable()
+    if args.head < 0 or args.disk_size <= 0:
+        print("error: --head must be non-negative and --disk-size positive", file=sys.stderr)
+        return 2
+
+    driveModel = None
+    if args.drive_model:
+        from drive_model import preset  # Needs numpy; only loaded on request
+        try:
+            driveModel = preset(args.drive_model, args.disk_size)
+        except ValueError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+
+    sources = args.files or ["-"]
+    rendering = args.plot or args.animate
+    if len(sources) > 1 and any(p and "{source}" not in p for p in (args.plot, args.animate)):
+        print("error: --plot/--animate need '{source}' in the path when given several inputs", file=sys.stderr)
+        return 2
+
+    with contextlib.ExitStack() as stack:
+        if args.profile:
+            stack.enter_context(instrumentation.profile(args.profile))
+        rows = []
+        for source in sources:
+            try:
+                with instrumentation.timer("parse.requests"):
+                    reqs = parse_requests(stdin.read()) if source == "-" else read_requests(source)
+            except (OSError, ValueError) as e:
+                print(f"error: {source}: {e}", file=sys.stderr)
+                return 1
+            logger.info("%s: %d requests", source, len(reqs))
+            sourceRows = summarize(source, reqs, args.head, args.disk_size, args.algorithms,
+                                   args.order or rendering, driveModel)
+            if rendering:
+                import render_module  # Agg only; loads numpy and matplotlib on request
+
+                results = {row["algorithm"]: row for row in sourceRows}
+                try:
+                    if args.plot:
+                        render_module.render_comparison(results, args.head, _output_path(args.plot, source), args.disk_size)
+                    if args.animate:
+                        render_module.render_animation(results, args.head, _output_path(args.animate, source), args.disk_size)
+                except (OSError, ValueError, RuntimeError) as e:
+                    print(f"error: {source}: {e}", file=sys.stderr)
+                    return 1
+                if not args.order:
+                    for row in sourceRows:
+                        del row["order"]
+            rows.extend(sourceRows)
+
+    if args.format == "csv":
+        writer = csv.DictWriter(stdout, fieldnames=SUMMARY_FIELDS, extrasaction="ignore", lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(_csv_row(row) for row in rows)
+        if args.instrument:
+            json.dump(instrumentation.snapshot(), sys.stderr, indent=2)
+            sys.stderr.write("\n")
+    else:
+        json.dump({"results": rows, "instrumentation": instrumentation.snapshot()} if args.instrument else rows,
+                  stdout, indent=2)
+        stdout.write("\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+import math
+
+import numpy as np
+
+from instrumentation import timer
+
+_BLOCK = 1 << 20
+
+class DriveModel:
+    """
+    Physical service-time model for a single disk head.
+    Seek time for a distance d (in tracks) is 0 for d == 0, otherwise
+        settleMs + sqrtCoeff * sqrt(d)                               for d <= boundary
+        settleMs + sqrtCoeff * sqrt(boundary) + linearCoeff * (d - boundary)  beyond it
+    i.e. acceleration-dominated short seeks and coast-dominated long ones,
+    continuous at the boundary. Every request also pays rotational latency
+    and a transfer time.
+    Args:
+        settleMs (float): Head settle time added to every non-zero seek.
+        sqrtCoeff (float): ms per sqrt(track) for short seeks.
+        linearCoeff (float): ms per track beyond the boundary.
+        boundary (float): Distance (tracks) where the curve turns linear.
+        rpm (int): Spindle speed.
+        transferMBps (float): Sustained media transfer rate.
+        blockBytes (int): Bytes transferred per request.
+        rotation (str): "expected" charges half a revolution per request;
+            "random" draws a uniform latency per request (seeded).
+        seed (int): RNG seed for rotation="random".
+    """
+
+    def __init__(self, settleMs=0.5, sqrtCoeff=0.3, linearCoeff=0.002, boundary=400,
+                 rpm=7200, transferMBps=200.0, blockBytes=4096, rotation="expected", seed=0):
+        if rotation not in ("expected", "random"):
+            raise ValueError("rotation must be 'expected' or 'random'.")
+        if min(settleMs, sqrtCoeff, linearCoeff, boundary) < 0 or rpm <= 0 or transferMBps <= 0:
+            raise ValueError("Drive model parameters must be non-negative (rpm and transfer rate positive).")
+        self.settleMs = settleMs
+        self.sqrtCoeff = sqrtCoeff
+        self.linearCoeff = linearCoeff
+        self.boundary = boundary
+        self.rpm = rpm
+        self.transferMBps = transferMBps
+        self.blockBytes = blockBytes
+        self.rotation = rotation
+        self.seed = seed
+
+    @classmethod
+    def from_specs(cls, cylinders, trackToTrackMs, fullStrokeMs, settleMs=None,
+                   boundaryFraction=0.3, **kwargs):
+        """
+        Fit the seek curve to datasheet figures for a disk of `cylinders` tracks.
+        Args:
+            cylinders (int): Number of tracks (the simulator's diskSize).
+            trackToTrackMs (float): Seek time for a distance of one track.
+            fullStrokeMs (float): Seek time across the whole disk.
+            settleMs (float): Settle time (defaults to half the track-to-track time).
+            boundaryFraction (float): Where the curve turns linear, as a fraction of the stroke.
+            **kwargs: rpm, transferMBps, blockBytes, rotation, seed.
+        """
+        settleMs = trackToTrackMs / 2 if settleMs is None else settleMs
+        sqrtCoeff = trackToTrackMs - settleMs
+        stroke = max(cylinders - 1, 1)
+        boundary = max(1.0, boundaryFraction * stroke)
+        if sqrtCoeff > 0:
+            # On wide disks keep the sqrt part under ~70% of the full-stroke time
+            boundary = max(1.0, min(boundary, ((fullStrokeMs - settleMs) / sqrtCoeff) ** 2 / 2))
+        atBoundary = settleMs + sqrtCoeff * math.sqrt(boundary)
+        if stroke <= boundary:
+            linearCoeff = 0.0
+        else:
+            linearCoeff = (fullStrokeMs - atBoundary) / (stroke - boundary)
+        if linearCoeff < 0:
+            raise ValueError("Full-stroke time is too short for the track-to-track time.")
+        return cls(settleMs, sqrtCoeff, linearCoeff, boundary, **kwargs)
+
+    @property
+    def revolutionMs(self):
+        return 60000.0 / self.rpm
+
+    @property
+    def transferMs(self):
+        return self.blockBytes / (self.transferMBps * 1e6) * 1000.0
+
+    def seek_time(self, distance):
+        """Vectorized seek time in ms for an array (or scalar) of distances."""
+        d = np.asarray(distance, dtype=np.float64)
+        short = self.settleMs + self.sqrtCoeff * np.sqrt(np.minimum(d, self.boundary))
+        longExtra = self.linearCoeff * np.maximum(d - self.boundary, 0.0)
+        return np.where(d > 0, short + longExtra, 0.0)
+
+    def service_time(self, distance):
+        """Scalar service time in ms (seek + expected rotation + transfer), e.g. for event_engine."""
+        seekMs = 0.0
+        if distance > 0:
+            seekMs = self.settleMs + self.sqrtCoeff * math.sqrt(min(distance, self.boundary))
+            seekMs += self.linearCoeff * max(distance - self.boundary, 0)
+        return seekMs + self.revolutionMs / 2 + self.transferMs
+
+    def evaluate(self, startHead, order, requests=None):
+        """
+        Time a whole schedule.
+        Seeks are charged for every leg of the path (including SCAN/C-SCAN
+        travel to the disk edge); rotation and transfer only for real requests.
+        Args:
+            startHead (int): Initial head pos.
+            order (array-like): Service order as returned by an engine.
+            requests (int): Number of real requests (defaults to len(order)).
+        Returns:
+            dict: seek/rotation/transfer/total times in ms, average Seek (ms) and throughput (IOPS).
+        """
+        order = np.asarray(order)
+        requests = order.size if requests is None else requests
+        seekMs = 0.0
+        previous = startHead
+        for i in range(0, order.size, _BLOCK):
+            block = order[i:i + _BLOCK].astype(np.int64)
+            distances = np.abs(np.diff(block, prepend=previous))
+            seekMs += float(self.seek_time(distances).sum())
+            previous = int(block[-1])
+
+        if self.rotation == "expected":
+            rotationMs = requests * self.revolutionMs / 2
+        else:
+            rng = np.random.default_rng(self.seed)
+            rotationMs = float(rng.uniform(0, self.revolutionMs, requests).sum())
+        transferMs = requests * self.transferMs
+        totalMs = seekMs + rotationMs + transferMs
+        return {
+            "seek Time": seekMs,
+            "rotational Latency": rotationMs,
+            "transfer Time": transferMs,
+            "total Time": totalMs,
+            "average Seek": seekMs / requests if requests else 0,
+            "average Access": totalMs / requests if requests else 0,
+            "throughput": requests / (totalMs / 1000.0) if totalMs else 0
+        }
+
+# Datasheet-style presets: (trackToTrackMs, fullStrokeMs, rpm, transferMBps)
+PRESETS = {
+    "hdd5400": (1.0, 22.0, 5400, 120.0),
+    "hdd7200": (0.8, 16.0, 7200, 200.0),
+    "hdd15k": (0.4, 7.5, 15000, 250.0),
+}
+
+def preset(name, cylinders, **kwargs):
+    """Build a DriveModel from a named preset for a disk of `cylinders` tracks."""
+    try:
+        trackToTrackMs, fullStrokeMs, rpm, transferMBps = PRESETS[name]
+    except KeyError:
+        raise ValueError(f"Unknown drive model: {name}. Available: {', '.join(PRESETS)}") from None
+    kwargs.setdefault("rpm", rpm)
+    kwargs.setdefault("transferMBps", transferMBps)
+    return DriveModel.from_specs(cylinders, trackToTrackMs, fullStrokeMs, **kwargs)
+
+def apply_drive_model(result, startHead, model):
+    """
+    Re-express a SimulationResult in physical units.
+    averageSeek becomes milliseconds and throughput IOPS; the full breakdown
+    is stored in result.timing. The result must carry its service order.
+    Returns:
+        SimulationResult: The same object, updated in place.
+    """
+    if result.order is None:
+        raise ValueError("A drive model needs the service order; run with keepOrder=True.")
+    with timer("model.drive"):
+        timing = model.evaluate(startHead, result.order, result.requests)
+    result.averageSeek = timing["average Seek"]
+    result.throughput = timing["throughput"]
+    result.timing = timing
+    return result
@@ -0,0 +1,347 @@
+import heapq
+from bisect import bisect_left, insort
+from collections import deque
+
+from instrumentation import count, timer
+from stats_module import LogHistogram, SeekStats
+
+# Event kinds; at equal timestamps completions run first, then arrivals, and
+# the dispatch decision comes last so it sees every request queued at that time.
+COMPLETION = 0
+ARRIVAL = 1
+DISPATCH = 2
+
+class FCFSPolicy:
+    """Serve queued requests in arrival order."""
+
+    def __init__(self, diskSize=200):
+        self.queue = deque()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def add(self, req):
+        self.queue.append(req)
+
+    def pop_next(self, head):
+        """Return (req, distance) for the next request to service."""
+        req = self.queue.popleft()
+        return req, abs(req[1] - head)
+
+class _SortedPolicy:
+    """Base for policies that keep pending requests sorted by track."""
+
+    def __init__(self, diskSize=200):
+        self.diskSize = diskSize
+        self.queue = []  # (track, seq, arrival), sorted
+
+    def __len__(self):
+        return len(self.queue)
+
+    def add(self, req):
+        arrival, track, seq = req
+        insort(self.queue, (track, seq, arrival))
+
+    def _take(self, idx):
+        # Among equal tracks, serve the earliest request first
+        track = self.queue[idx][0]
+        idx = bisect_left(self.queue, (track,))
+        track, seq, arrival = self.queue.pop(idx)
+        return arrival, track, seq
+
+    def _first_at_or_above(self, head):
+        idx = bisect_left(self.queue, (head,))
+        return idx if idx < len(self.queue) else None
+
+class SSTFPolicy(_SortedPolicy):
+    """Serve the pending request closest to the head."""
+
+    def pop_next(self, head):
+        split = bisect_left(self.queue, (head,))
+        if split == 0:
+            idx = split
+        elif split == len(self.queue):
+            idx = split - 1
+        else:
+            leftTrack = self.queue[split - 1][0]
+            rightDist = self.queue[split][0] - head
+            leftDist = head - leftTrack
+            if leftDist != rightDist:
+                idx = split if rightDist < leftDist else split - 1
+            else:
+                leftSeq = self.queue[bisect_left(self.queue, (leftTrack,))][1]
+                idx = split if self.queue[split][1] < leftSeq else split - 1
+        req = self._take(idx)
+        return req, abs(req[1] - head)
+
+class SCANPolicy(_SortedPolicy):
+    """
+    Elevator: sweep up to the last track, then down to track 0.
+    The trip to the disk edge is only made on the way to a request behind
+    the head. A head whose queue drains while moving up stays at the last
+    request, so even with every request arriving at t=0 the head movement
+    is smaller than vector_engine.scan's whenever no request lies below the
+    start head (the batch engine always finishes the sweep at the edge).
+    """
+
+    def __init__(self, diskSize=200):
+        super().__init__(diskSize)
+        self.movingUp = True
+
+    def pop_next(self, head):
+        end = self.diskSize - 1
+        if self.movingUp:
+            idx = self._first_at_or_above(head)
+            if idx is not None:
+                req = self._take(idx)
+                return req, req[1] - head
+            self.movingUp = False
+            req = self._take(len(self.queue) - 1)
+            return req, abs(end - head) + (end - req[1])
+        idx = bisect_left(self.queue, (head + 1,)) - 1
+        if idx >= 0:
+            req = self._take(idx)
+            return req, head - req[1]
+        self.movingUp = True
+        req = self._take(0)
+        return req, head + req[1]
+
+class CSCANPolicy(_SortedPolicy):
+    """
+    Sweep up to the last track, jump back to track 0, repeat.
+    As with SCANPolicy, the edge and the wrap are only travelled to reach a
+    request below the head; vector_engine.c_scan always adds both, so the
+    two differ when no request lies below the start head.
+    """
+
+    def pop_next(self, head):
+        end = self.diskSize - 1
+        idx = self._first_at_or_above(head)
+        if idx is not None:
+            req = self._take(idx)
+            return req, req[1] - head
+        req = self._take(0)
+        return req, abs(end - head) + end + req[1]
+
+class LOOKPolicy(SCANPolicy):
+    """Elevator that reverses at the last pending request, not the disk edge."""
+
+    def pop_next(self, head):
+        if self.movingUp:
+            idx = self._first_at_or_above(head)
+            if idx is None:
+                self.movingUp = False
+                idx = len(self.queue) - 1
+        else:
+            idx = bisect_left(self.queue, (head + 1,)) - 1
+            if idx < 0:
+                self.movingUp = True
+                idx = 0
+        req = self._take(idx)
+        return req, abs(req[1] - head)
+
+class CLOOKPolicy(_SortedPolicy):
+    """Sweep up to the last pending request, then jump to the lowest one."""
+
+    def pop_next(self, head):
+        idx = self._first_at_or_above(head)
+        req = self._take(0 if idx is None else idx)
+        return req, abs(req[1] - head)
+
+class NStepSCANPolicy:
+    """
+    Serve the queue in batches of batchSize arrivals, one LOOK pass each.
+    Requests arriving during a pass wait for a later batch.
+    """
+
+    def __init__(self, diskSize=200, batchSize=10):
+        self.pending = deque()
+        self.batch = LOOKPolicy(diskSize)
+        self.batchSize = batchSize
+
+    def __len__(self):
+        return len(self.pending) + len(self.batch)
+
+    def add(self, req):
+        self.pending.append(req)
+
+    def pop_next(self, head):
+        if not len(self.batch):
+            for _ in range(min(self.batchSize, len(self.pending))):
+                self.batch.add(self.pending.popleft())
+        return self.batch.pop_next(head)
+
+class FSCANPolicy:
+    """
+    Two queues: a frozen one served by SCAN and one collecting new arrivals,
+    swapped whenever the frozen queue empties. Sweeps end like SCANPolicy's,
+    so with every request arriving at t=0 it differs from vector_engine.fscan
+    in the same cases.
+    """
+
+    def __init__(self, diskSize=200):
+        self.waiting = []
+        self.active = SCANPolicy(diskSize)
+
+    def __len__(self):
+        return len(self.waiting) + len(self.active)
+
+    def add(self, req):
+        self.waiting.append(req)
+
+    def pop_next(self, head):
+        if not len(self.active):
+            for req in self.waiting:
+                self.active.add(req)
+            self.waiting = []
+        return self.active.pop_next(head)
+
+POLICIES = {
+    "FCFS": FCFSPolicy,
+    "SSTF": SSTFPolicy,
+    "SCAN": SCANPolicy,
+    "C-SCAN": CSCANPolicy,
+    "LOOK": LOOKPolicy,
+    "C-LOOK": CLOOKPolicy,
+    "N-STEP-SCAN": NStepSCANPolicy,
+    "FSCAN": FSCANPolicy
+}
+
+def run_events(arrivals, policy="FCFS", startHead=0, diskSize=200,
+               msPerTrack=1.0, overheadMs=0.0, serviceTime=None):
+    """
+    Event-driven simulation of a single disk head.
+    Requests only become visible to the policy once they have arrived.
+    Args:
+        arrivals (iterable): (arrival time in ms, track) pairs in non-decreasing time order.
+        policy (str or class): Queue policy name from POLICIES, or a policy class.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num.
+        msPerTrack (float): Seek time per track travelled.
+        overheadMs (float): Fixed service time added to every request.
+        serviceTime (callable): Optional distance -> ms function (e.g.
+            DriveModel.service_time); replaces msPerTrack and overheadMs.
+    Yields:
+        tuple: (seq, track, arrival, start, completion, distance) per serviced request.
+    """
+    policyCls = POLICIES[policy] if isinstance(policy, str) else policy
+    queue = policyCls(diskSize)
+    source = iter(arrivals)
+    events = []
+    seq = 0
+    lastArrival = None
+    head = startHead
+    busy = False
+    dispatchPending = False
+
+    def push_next_arrival():
+        nonlocal seq, lastArrival
+        for arrival, track in source:
+            if lastArrival is not None and arrival < lastArrival:
+                raise ValueError("Arrival times must be non-decreasing.")
+            lastArrival = arrival
+            heapq.heappush(events, (arrival, ARRIVAL, seq, (arrival, track, seq)))
+            seq += 1
+            return
+
+    handled = 0
+    dispatched = 0
+    push_next_arrival()
+    try:
+        while events:
+            now, kind, _, payload = heapq.heappop(events)
+            handled += 1
+            if kind == ARRIVAL:
+                queue.add(payload)
+                push_next_arrival()
+                if not busy and not dispatchPending:
+                    heapq.heappush(events, (now, DISPATCH, -1, None))
+                    dispatchPending = True
+            elif kind == COMPLETION:
+                busy = False
+                yield payload
+                if len(queue):
+                    heapq.heappush(events, (now, DISPATCH, -1, None))
+                    dispatchPending = True
+            else:
+                dispatchPending = False
+                if busy or not len(queue):
+                    continue
+                (arrival, track, reqSeq), distance = queue.pop_next(head)
+                dispatched += 1
+                if serviceTime is None:
+                    done = now + distance * msPerTrack + overheadMs
+                else:
+                    done = now + serviceTime(distance)
+                record = (reqSeq, track, arrival, now, done, distance)
+                heapq.heappush(events, (done, COMPLETION, reqSeq, record))
+                head = track
+                busy = True
+    finally:
+        # Every handled event was pushed once and popped once
+        count("event.heapOps", 2 * handled)
+        count("event.queueAdds", seq)
+        count("event.queuePops", dispatched)
+
+def simulate(arrivals, policy="FCFS", startHead=0, diskSize=200,
+             msPerTrack=1.0, overheadMs=0.0, onComplete=None, serviceTime=None):
+    """
+    Run run_events() and aggregate latency statistics in bounded memory.
+    Args:
+        arrivals (iterable): (arrival time in ms, track) pairs in non-decreasing time order.
+        policy (str or class): Queue policy name from POLICIES, or a policy class.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num.
+        msPerTrack (float): Seek time per track travelled.
+        overheadMs (float): Fixed service time added to every request.
+        onComplete (callable): Optional callback receiving each request's
+            (seq, track, arrival, start, completion, distance) record.
+        serviceTime (callable): Optional distance -> ms function; see run_events().
+    Returns:
+        dict: Completed count, head movement, mean/p95/p99 wait and response
+              times in ms, makespan, sustained IOPS and the seek-distance
+              summary (see stats_module.SeekStats).
+    """
+    waits = LogHistogram()
+    responses = LogHistogram()
+    seeks = SeekStats(diskSize - 1)
+    completed = 0
+    headMovement = 0
+    waitTotal = 0.0
+    responseTotal = 0.0
+    firstArrival = None
+    lastCompletion = 0.0
+
+    policyName = policy if isinstance(policy, str) else policy.__name__
+    with timer("schedule.events." + policyName):
+        for record in run_events(arrivals, policy, startHead, diskSize, msPerTrack, overheadMs, serviceTime):
+            _, _, arrival, start, done, distance = record
+            if firstArrival is None or arrival < firstArrival:
+                firstArrival = arrival
+            wait = start - arrival
+            response = done - arrival
+            waits.add(wait)
+            responses.add(response)
+            seeks.add(distance)
+            waitTotal += wait
+            responseTotal += response
+            headMovement += distance
+            completed += 1
+            lastCompletion = max(lastCompletion, done)
+            if onComplete is not None:
+                onComplete(record)
+
+    makespan = lastCompletion - firstArrival if completed else 0
+    return {
+        "completed": completed,
+        "head Movement": headMovement,
+        "mean Wait": waitTotal / completed if completed else 0,
+        "p95 Wait": waits.quantile(0.95),
+        "p99 Wait": waits.quantile(0.99),
+        "mean Response": responseTotal / completed if completed else 0,
+        "p95 Response": responses.quantile(0.95),
+        "p99 Response": responses.quantile(0.99),
+        "makespan": makespan,
+        "iops": completed / (makespan / 1000) if makespan else 0,
+        "seek Stats": seeks.summary()
+    }
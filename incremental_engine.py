@@ -0,0 +1,242 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from instrumentation import count
+from result_module import SimulationResult
+from stats_module import SeekStats
+
+_BLOCK = 1 << 20
+
+def _as_batch(reqs):
+    batch = np.asarray(reqs).ravel()
+    if batch.dtype.kind not in "iu":
+        batch = batch.astype(np.int64)
+    if batch.size and batch.min() < 0:
+        raise ValueError("Disk requests must be non-negative integers.")
+    return batch.astype(np.int64, copy=False)
+
+class SortedRuns:
+    """
+    Sorted multiset supporting batch inserts, kept as a log-structured stack
+    of sorted runs. A run is merged into the one below it only while that
+    one is no bigger, so each value is merged O(log n) times and an insert
+    costs O(b log n) amortized instead of the O(n) of re-sorting everything.
+    """
+
+    def __init__(self):
+        self.runs = []
+        self.size = 0
+
+    def insert(self, values):
+        if not values.size:
+            return
+        run = np.sort(values)
+        while self.runs and self.runs[-1].size <= run.size:
+            run = self._merge(self.runs.pop(), run)
+        self.runs.append(run)
+        self.size += values.size
+
+    @staticmethod
+    def _merge(a, b):
+        count("incremental.mergedElements", a.size + b.size)
+        merged = np.concatenate((a, b))
+        merged.sort(kind="stable")  # Timsort/radix: linear on two sorted runs
+        return merged
+
+    def to_array(self):
+        """All values in ascending order (compacts the runs into one)."""
+        if not self.runs:
+            return np.empty(0, dtype=np.int64)
+        while len(self.runs) > 1:
+            top = self.runs.pop()
+            self.runs[-1] = self._merge(self.runs[-1], top)
+        return self.runs[0]
+
+class IncrementalScheduler(ABC):
+    """
+    Base for stateful schedulers fed in batches.
+    At any time result() equals running the batch engine on every request
+    added so far, but add() only does work proportional to the new batch.
+    Metrics are kept up to date on every add; the service order and the
+    seek statistics are only assembled when result() is asked for.
+    Args:
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num.
+    """
+
+    name = None
+
+    def __init__(self, startHead, diskSize=200):
+        if startHead < 0 or diskSize <= 0:
+            raise ValueError("startHead must be non-negative and diskSize positive.")
+        self.startHead = int(startHead)
+        self.diskSize = int(diskSize)
+        self.requests = 0
+
+    def add(self, reqs):
+        """Add a batch of requests; returns self."""
+        batch = _as_batch(reqs)
+        if batch.size:
+            self._add(batch)
+            self.requests += batch.size
+        return self
+
+    def __len__(self):
+        return self.requests
+
+    @abstractmethod
+    def _add(self, batch):
+        """Fold a non-empty int64 batch into the schedule."""
+
+    @property
+    @abstractmethod
+    def headMovement(self):
+        """Total head movement for every request added so far."""
+
+    def metrics(self):
+        """Current totals in the algorithm_engine result layout (without the order or the seek statistics)."""
+        return SimulationResult(None, self.headMovement, self.requests).to_dict()
+
+    @abstractmethod
+    def order(self):
+        """Service order of every request added so far."""
+
+    def result(self, keepOrder=True):
+        """
+        Current SimulationResult with the seek statistics. The order is
+        assembled to walk them either way; keepOrder=False drops it afterwards.
+        """
+        order = self.order()
+        seekStats = SeekStats(self.diskSize - 1)
+        seekStats.add_path(self.startHead, order)
+        return SimulationResult(order if keepOrder else None, self.headMovement, self.requests, seekStats)
+
+class IncrementalFCFS(IncrementalScheduler):
+    """FCFS: new requests are simply served after the existing ones."""
+
+    name = "FCFS"
+
+    def __init__(self, startHead, diskSize=200):
+        super().__init__(startHead, diskSize)
+        self._movement = 0
+        self._last = self.startHead
+        self._chunks = []
+
+    def _add(self, batch):
+        for i in range(0, batch.size, _BLOCK):
+            block = batch[i:i + _BLOCK]
+            self._movement += int(np.abs(np.diff(block, prepend=self._last)).sum())
+            self._last = int(block[-1])
+        self._chunks.append(batch)
+
+    @property
+    def headMovement(self):
+        return self._movement
+
+    def order(self):
+        if len(self._chunks) > 1:
+            self._chunks = [np.concatenate(self._chunks)]
+        return self._chunks[0] if self._chunks else np.empty(0, dtype=np.int64)
+
+class _IncrementalElevator(IncrementalScheduler):
+    """
+    Elevator schedules split requests at the start head. The cost depends
+    only on the counts and extremes of each side, so metrics update in O(b);
+    each side's tracks go into SortedRuns for the order.
+    """
+
+    def __init__(self, startHead, diskSize=200):
+        super().__init__(startHead, diskSize)
+        self.right = SortedRuns()  # Tracks >= startHead
+        self.left = SortedRuns()   # Tracks < startHead
+        self.rightMax = None
+        self.leftMin = None
+        self.leftMax = None
+
+    def _add(self, batch):
+        goesRight = batch >= self.startHead
+        right, left = batch[goesRight], batch[~goesRight]
+        if right.size:
+            top = int(right.max())
+            self.rightMax = top if self.rightMax is None else max(self.rightMax, top)
+            self.right.insert(right)
+        if left.size:
+            low, high = int(left.min()), int(left.max())
+            self.leftMin = low if self.leftMin is None else min(self.leftMin, low)
+            self.leftMax = high if self.leftMax is None else max(self.leftMax, high)
+            self.left.insert(left)
+
+    def _lastRight(self):
+        return self.rightMax if self.rightMax is not None else self.startHead
+
+class IncrementalSCAN(_IncrementalElevator):
+    """SCAN: sweep up to the disk end, then down through the left requests."""
+
+    name = "SCAN"
+
+    @property
+    def headMovement(self):
+        end = self.diskSize - 1
+        lastRight = self._lastRight()
+        movement = (lastRight - self.startHead) + abs(end - lastRight)
+        if self.leftMax is not None:
+            movement += abs(end - self.leftMax) + self.leftMax - self.leftMin
+        return movement
+
+    def order(self):
+        end = self.diskSize - 1
+        endStop = [end] if self._lastRight() != end else []
+        return np.concatenate((self.right.to_array(), np.array(endStop, dtype=np.int64),
+                               self.left.to_array()[::-1]))
+
+class IncrementalCSCAN(_IncrementalElevator):
+    """C-SCAN: sweep up to the disk end, jump to track 0, then climb through the left requests."""
+
+    name = "C-SCAN"
+
+    @property
+    def headMovement(self):
+        end = self.diskSize - 1
+        lastRight = self._lastRight()
+        movement = (lastRight - self.startHead) + abs(end - lastRight) + end
+        if self.leftMax is not None:
+            movement += self.leftMax
+        return movement
+
+    def order(self):
+        end = self.diskSize - 1
+        wrap = [end, 0] if self._lastRight() != end else [0]
+        return np.concatenate((self.right.to_array(), np.array(wrap, dtype=np.int64), self.left.to_array()))
+
+class IncrementalLOOK(_IncrementalElevator):
+    """LOOK: sweep up to the last request, then down through the left requests."""
+
+    name = "LOOK"
+
+    @property
+    def headMovement(self):
+        turn = self._lastRight()
+        movement = turn - self.startHead
+        if self.leftMin is not None:
+            movement += turn - self.leftMin
+        return movement
+
+    def order(self):
+        return np.concatenate((self.right.to_array(), self.left.to_array()[::-1]))
+
+class IncrementalCLOOK(_IncrementalElevator):
+    """C-LOOK: sweep up to the last request, jump to the lowest one, climb again."""
+
+    name = "C-LOOK"
+
+    @property
+    def headMovement(self):
+        turn = self._lastRight()
+        movement = turn - self.startHead
+        if self.leftMin is not None:
+            movement += (turn - self.leftMin) + (self.leftMax - self.leftMin)
+        return movement
+
+    def order(self):
+        return np.concatenate((self.right.to_array(), self.left.to_array()))
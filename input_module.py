@@ -1,32 +1,76 @@
-def get_input():
-    """
-    This function is for getting user input for disk requests and the starting head position.
-    It gives back:
-        - disk_reqs (list): A list of disk requests
-        - start_head (int): The starting position of the head
-    """
-    while True:
-        try:
-            # Prompt user to enter disk requests
-            reqs_raw = input("Enter the disk requests (comma-separated): ")
-            reqs_list = [int(x.strip()) for x in reqs_raw.split(',')]
-            
-            # Prompt user to enter head position
-            head_start = int(input("Enter the starting head position: "))
-            
-            # Check if all inputs are positive
-            if any(r < 0 for r in reqs_list) or head_start < 0:
-                print("Error: Only positive numbers are allowed. Please try again.")
-                continue
-            
-            # Return 
-            return reqs_list, head_start
-        
-        except ValueError:
-            #invalid input
-            print("Invalid input. Please enter numbers only, separated by commas.")
-
-# Test
-# if __name__ == "__main__":
-#     requests, head = get_input()
-#     print(requests, head)
+import re
+
+def get_input():
+    """
+    This function is for getting user input for disk requests and the starting head position.
+    It gives back:
+        - disk_reqs (list): A list of disk requests
+        - start_head (int): The starting position of the head
+    """
+    while True:
+        try:
+            # Prompt user to enter disk requests
+            reqs_raw = input("Enter the disk requests (comma-separated): ")
+            reqs_list = [int(x.strip()) for x in reqs_raw.split(',')]
+            
+            # Prompt user to enter head position
+            head_start = int(input("Enter the starting head position: "))
+            
+            # Check if all inputs are positive
+            if any(r < 0 for r in reqs_list) or head_start < 0:
+                print("Error: Only positive numbers are allowed. Please try again.")
+                continue
+            
+            # Return 
+            return reqs_list, head_start
+        
+        except ValueError:
+            #invalid input
+            print("Invalid input. Please enter numbers only, separated by commas.")
+
+_SEPARATORS = str.maketrans(",;\t\r", "    ")
+_NUMBER = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
+def is_header(line):
+    """
+    This function is for spotting a CSV header line (same rule as trace_loader).
+    A header line has fields but none of them is a number.
+    """
+    fields = line.translate(_SEPARATORS).split()
+    return bool(fields) and not any(_NUMBER.fullmatch(f) for f in fields)
+
+def parse_requests(text):
+    """
+    This function is for turning text into a list of disk requests.
+    Values may be separated by commas, semicolons, tabs, whitespace or newlines,
+    and a text header line (e.g. "track") is skipped.
+    It gives back:
+        - reqs_list (list): A list of non-negative disk requests
+    """
+    first_line, _, rest = text.lstrip().partition('\n')
+    if is_header(first_line):
+        text = rest
+    reqs_list = [int(x) for x in text.translate(_SEPARATORS).split()]
+    if any(r < 0 for r in reqs_list):
+        raise ValueError("Disk requests must be non-negative integers.")
+    return reqs_list
+
+def read_requests(path):
+    """
+    This function is for reading disk requests from a text or CSV file.
+    Every row is read, so both single-row and single-column files work.
+    Binary traces are read through binary_trace (which needs numpy).
+    It gives back:
+        - reqs_list (list): A list of non-negative disk requests
+    """
+    with open(path, 'rb') as file:
+        if file.read(8) == b"DSKTRACE":
+            from binary_trace import open_trace
+            return open_trace(path).tracks.tolist()
+    with open(path, 'r') as file:
+        return parse_requests(file.read())
+
+# Test
+# if __name__ == "__main__":
+#     requests, head = get_input()
+#     print(requests, head)
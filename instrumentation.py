@@ -0,0 +1,109 @@
+# instrumentation.py - timers and counters for finding where a run spends
+# its time (parsing, scheduling, plotting). Standard library only, so the
+# CLI can use it without importing numpy. Disabled by default; while
+# disabled, timer() hands back a shared no-op context and count() returns
+# at once.
+
+import cProfile
+import threading
+import time
+from contextlib import contextmanager
+
+_enabled = False
+_lock = threading.Lock()
+_timers = {}    # name -> [calls, seconds]
+_counters = {}  # name -> total
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        with _lock:
+            entry = _timers.setdefault(self.name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+        return False
+
+def enable(flag=True):
+    """Switch recording on (or off with flag=False)."""
+    global _enabled
+    _enabled = bool(flag)
+
+def is_enabled():
+    return _enabled
+
+def timer(name):
+    """
+    Context manager adding the wall time of its block to timer `name`.
+    Names are dotted by phase, e.g. "parse.trace", "schedule.SCAN", "plot.render".
+    """
+    return _Timer(name) if _enabled else _NULL_TIMER
+
+def count(name, amount=1):
+    """Add amount to counter `name` (comparisons, data-structure operations, allocated bytes...)."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+def reset():
+    """Clear all recorded timers and counters."""
+    with _lock:
+        _timers.clear()
+        _counters.clear()
+
+def snapshot():
+    """
+    Recorded values as plain data (JSON-serializable).
+    Returns:
+        dict: "timers" (name -> {"calls", "seconds"}), "counters" (name -> total)
+            and "phases" (seconds summed by the first part of each timer name).
+    """
+    with _lock:
+        timers = {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in _timers.items()}
+        counters = dict(_counters)
+    phases = {}
+    for name, entry in timers.items():
+        phase = name.split(".", 1)[0]
+        phases[phase] = phases.get(phase, 0.0) + entry["seconds"]
+    return {"timers": timers, "counters": counters, "phases": phases}
+
+def format_report(data=None):
+    """Human-readable snapshot, slowest timers first."""
+    data = snapshot() if data is None else data
+    lines = []
+    for name, entry in sorted(data["timers"].items(), key=lambda item: -item[1]["seconds"]):
+        lines.append(f"{name:<28} {entry['seconds'] * 1000:>10.2f} ms  x{entry['calls']}")
+    if data["counters"]:
+        lines.append("")
+    for name, total in sorted(data["counters"].items()):
+        lines.append(f"{name:<28} {total:>14,}")
+    return "\n".join(lines) if lines else "(nothing recorded)"
+
+@contextmanager
+def profile(path):
+    """Run the block under cProfile and write the stats to path (readable with pstats/snakeviz)."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
@@ -1,393 +1,625 @@
-# gui_disk_scheduler.py (Version 8 - Added Accessibility Options)
-
-import tkinter as tk
-from tkinter import ttk, messagebox, font, filedialog
-from algorithm_engine import fcfs, sstf, scan, c_scan
-import csv
-
-from visualization_module import show_combined_disk_movement
-
-import matplotlib.pyplot as plt
-import matplotlib
-
-matplotlib.use('TkAgg')
-
-import sv_ttk
-
-class DiskSchedulerGUI:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Disk Scheduling Algorithm Simulator")
-        self.root.geometry("1200x700")  # Further increased window width
-        sv_ttk.set_theme("dark")  # Apply the Sun Valley dark theme
-
-        self.all_results = None
-        self.initial_head_pos = None
-        self.disk_requests_list = None
-        self.algo_vars = {}
-        self.algo_checkbuttons = {}
-
-        self.create_widgets()
-
-    def create_widgets(self):
-        main_frame = ttk.Frame(self.root, padding="20 20 20 20")
-        main_frame.pack(fill=tk.BOTH, expand=True)
-
-        header = ttk.Label(main_frame, text="DISK SCHEDULING SIMULATOR", font=("Segoe UI", 18, "bold"), anchor=tk.CENTER)
-        header.pack(pady=(0, 20), fill=tk.X)
-
-        # Left side (existing content)
-        left_frame = ttk.Frame(main_frame)
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 20))
-
-        # --- Input Frame ---
-        input_outer_frame = ttk.Frame(left_frame)
-        input_outer_frame.pack(fill=tk.X, pady=5)
-        
-        # Input frame for disk requests with import button
-        input_frame = ttk.Frame(input_outer_frame)
-        input_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Disk Requests row with import button
-        disk_requests_frame = ttk.Frame(input_frame)
-        disk_requests_frame.grid(row=0, column=0, columnspan=2, sticky=tk.EW, pady=5)
-        
-        ttk.Label(disk_requests_frame, text="Disk Requests:", font=("Segoe UI", 11)).pack(side=tk.LEFT, padx=(0, 5))
-        self.requests_entry = ttk.Entry(disk_requests_frame, font=("Segoe UI", 11), width=50)
-        self.requests_entry.pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
-        self.requests_entry.insert(0, "98, 183, 37, 122, 14, 124, 65, 67")
-        
-        import_btn = ttk.Button(disk_requests_frame, text="Import CSV", command=self.import_csv)
-        import_btn.pack(side=tk.LEFT, padx=5)
-
-        ttk.Label(input_frame, text="Initial Head Pos:", font=("Segoe UI", 11)).grid(row=1, column=0, padx=(0, 5), pady=5, sticky=tk.W)
-        self.head_entry = ttk.Entry(input_frame, font=("Segoe UI", 11), width=15)
-        self.head_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
-        self.head_entry.insert(0, "53")
-
-        buttons_frame = ttk.Frame(input_outer_frame)
-        buttons_frame.pack(side=tk.RIGHT, padx=10)
-
-        clear_data_button = ttk.Button(buttons_frame, text="Clear All Data", command=self.clear_input_fields)
-        clear_data_button.pack(pady=5, fill=tk.X)
-
-        run_button_frame = ttk.Frame(left_frame)
-        run_button_frame.pack(pady=(15, 10), fill=tk.X)
-        self.run_button = ttk.Button(run_button_frame, text="RUN SIMULATION & COMPARE", command=self.run_simulation, style="Accent.TButton")
-        self.run_button.pack(expand=True, fill=tk.X)
-
-        # --- Results Frame ---
-        results_frame = ttk.LabelFrame(left_frame, text="Simulation Comparison Results")
-        results_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-
-        # Create the text widget with scrollbar
-        self.result_text = tk.Text(results_frame, height=10, wrap=tk.WORD, 
-                                 font=("Consolas", 16), bg="#1a1a1a", fg="white",
-                                 insertbackground="white", selectbackground="#4ECDC4",
-                                 padx=10, pady=10)
-        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.result_text.yview)
-        self.result_text.configure(yscrollcommand=scrollbar.set)
-
-        self.result_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        self.result_text.insert(tk.END, ">> Waiting for simulation...\n")
-        self.result_text.config(state=tk.DISABLED)
-
-        # Right side (Track Positions) with increased width
-        right_frame = ttk.Frame(main_frame)
-        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, padx=(20, 0))
-
-        # Configure weight for the frames
-        main_frame.columnconfigure(0, weight=2)  # Left frame takes 2 parts
-        main_frame.columnconfigure(1, weight=3)  # Right frame takes 3 parts
-
-        # Track Positions Frame with increased width
-        track_frame = ttk.LabelFrame(right_frame, text="Track Positions")
-        track_frame.pack(fill=tk.BOTH, expand=True)
-
-        # Create the track positions text widget with increased width
-        self.track_text = tk.Text(track_frame, height=10, wrap=tk.WORD,
-                                font=("Consolas", 12), bg="#1a1a1a", fg="white",
-                                insertbackground="white", selectbackground="#4ECDC4",
-                                padx=10, pady=10, width=60)  # Increased width from 45 to 60
-        track_scrollbar = ttk.Scrollbar(track_frame, orient=tk.VERTICAL, command=self.track_text.yview)
-        self.track_text.configure(yscrollcommand=track_scrollbar.set)
-
-        self.track_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        track_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        self.track_text.insert(tk.END, ">> Track positions will appear here after simulation...\n")
-        self.track_text.config(state=tk.DISABLED)
-
-        # --- Visualization Selection Frame ---
-        vis_select_outer_frame = ttk.Frame(left_frame)
-        vis_select_outer_frame.pack(fill=tk.X, pady=5)
-
-        vis_select_frame = ttk.LabelFrame(vis_select_outer_frame, text="Select Algorithms to Visualize")
-        vis_select_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        vis_buttons_frame = ttk.Frame(vis_select_outer_frame)
-        vis_buttons_frame.pack(side=tk.RIGHT, padx=10, fill=tk.Y)
-
-        algorithms = ["FCFS", "SSTF", "SCAN", "C-SCAN"]
-        num_cols = 4
-        for i, algo in enumerate(algorithms):
-            self.algo_vars[algo] = tk.IntVar()
-            cb = ttk.Checkbutton(vis_select_frame, text=algo, variable=self.algo_vars[algo], state='disabled')
-            col = i % num_cols
-            row = i // num_cols
-            cb.grid(row=row, column=col, padx=15, pady=5, sticky=tk.W)
-            self.algo_checkbuttons[algo] = cb
-
-        for i in range(num_cols):
-            vis_select_frame.columnconfigure(i, weight=1)
-
-        select_all_button = ttk.Button(vis_buttons_frame, text="Select All", command=self.select_all_algorithms)
-        select_all_button.pack(pady=5, fill=tk.X)
-
-        clear_selection_button = ttk.Button(vis_buttons_frame, text="Clear Selection", command=self.clear_all_algorithm_selections)
-        clear_selection_button.pack(pady=5, fill=tk.X)
-
-        vis_button_frame = ttk.Frame(left_frame)
-        vis_button_frame.pack(pady=(10, 0), fill=tk.X)
-        self.visualize_button = ttk.Button(vis_button_frame, text="VISUALIZE SELECTED", command=self.show_visualization, state='disabled', style="Accent.TButton")
-        self.visualize_button.pack(expand=True, fill=tk.X)
-
-    def clear_input_fields(self):
-        """Clears the disk requests and initial head position input fields."""
-        self.requests_entry.delete(0, tk.END)
-        self.head_entry.delete(0, tk.END)
-
-    def select_all_algorithms(self):
-        """Selects all available disk scheduling algorithms for visualization."""
-        for algo in self.algo_vars:
-            if algo in self.all_results:  # Only select if results are available
-                self.algo_vars[algo].set(1)
-
-    def clear_all_algorithm_selections(self):
-        """Clears the selection of all disk scheduling algorithms for visualization."""
-        for algo in self.algo_vars:
-            self.algo_vars[algo].set(0)
-
-    def import_csv(self):
-        try:
-            file_path = filedialog.askopenfilename(
-                title="Select CSV File",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-            )
-            
-            if not file_path:  # User cancelled the dialog
-                return
-                
-            with open(file_path, 'r') as file:
-                csv_reader = csv.reader(file)
-                # Read the first row and join the values with commas
-                for row in csv_reader:
-                    # Filter out any empty strings and convert to integers to validate
-                    values = [int(val.strip()) for val in row if val.strip()]
-                    # Convert back to strings and join with commas
-                    disk_requests = ", ".join(map(str, values))
-                    self.requests_entry.delete(0, tk.END)
-                    self.requests_entry.insert(0, disk_requests)
-                    break  # Only read the first row
-                    
-        except ValueError as e:
-            messagebox.showerror("Import Error", "Invalid data in CSV file. Please ensure all values are integers.")
-        except Exception as e:
-            messagebox.showerror("Import Error", f"Error reading CSV file:\n{str(e)}")
-
-    def update_track_positions(self):
-        """Update the track positions display with the current results."""
-        if not self.all_results:
-            return
-
-        self.track_text.config(state=tk.NORMAL)
-        self.track_text.delete(1.0, tk.END)
-
-        # Configure text tags
-        self.track_text.tag_configure("header", foreground="#4ECDC4", font=("Consolas", 12, "bold"))
-        self.track_text.tag_configure("algo_name", foreground="#FF6B6B", font=("Consolas", 12, "bold"))
-        self.track_text.tag_configure("positions", foreground="white", font=("Consolas", 12))
-        self.track_text.tag_configure("separator", foreground="#444444", font=("Consolas", 12))
-
-        self.track_text.insert(tk.END, "Track Positions by Algorithm:\n\n", "header")
-
-        # Display track positions for each algorithm
-        for algo_name, result in self.all_results.items():
-            # Get the movement path including initial head position
-            path = [self.initial_head_pos] + result.get("order", [])
-            
-            # Insert algorithm name
-            self.track_text.insert(tk.END, f"{algo_name}:\n", "algo_name")
-            
-            # Format positions in rows of 5
-            positions = [str(pos).rjust(4) for pos in path]
-            for i in range(0, len(positions), 5):
-                row = positions[i:i+5]
-                self.track_text.insert(tk.END, " ".join(row) + "\n", "positions")
-            
-            # Use a shorter separator that won't wrap
-            self.track_text.insert(tk.END, "\n" + "-"*25 + "\n\n", "separator")
-
-        self.track_text.config(state=tk.DISABLED)
-
-    def run_simulation(self):
-        try:
-            requests_str = self.requests_entry.get()
-            if not requests_str: raise ValueError("Disk Requests cannot be empty.")
-            self.disk_requests_list = [int(x.strip()) for x in requests_str.split(',')]
-            if not self.disk_requests_list: raise ValueError("No valid disk requests entered.")
-            if any(r < 0 for r in self.disk_requests_list): raise ValueError("Disk Requests must be non-negative integers.")
-            head_str = self.head_entry.get()
-            if not head_str: raise ValueError("Initial Head Position cannot be empty.")
-            self.initial_head_pos = int(head_str)
-            if self.initial_head_pos < 0: raise ValueError("Initial Head Position must be non-negative.")
-
-            self.all_results = {
-                "FCFS": fcfs(self.disk_requests_list, self.initial_head_pos),
-                "SSTF": sstf(self.disk_requests_list, self.initial_head_pos),
-                "SCAN": scan(self.disk_requests_list, self.initial_head_pos),
-                "C-SCAN": c_scan(self.disk_requests_list, self.initial_head_pos)
-            }
-
-            # Update both results displays
-            self.update_results_display()  # Update main results
-            self.update_track_positions()  # Update track positions
-
-            self.visualize_button.config(state='normal')
-            for algo, cb in self.algo_checkbuttons.items():
-                if algo in self.all_results:
-                    cb.config(state='normal')
-                else:
-                    cb.config(state='disabled')
-
-        except ValueError as e:
-            messagebox.showerror("Input Error", f"Invalid input:\n{e}\nPlease enter comma-separated non-negative integers for requests and a non-negative integer for the head position.")
-            self.reset_visualization_options()
-        except Exception as e:
-            messagebox.showerror("Simulation Error", f"An unexpected error occurred during simulation:\n{e}")
-            self.reset_visualization_options()
-
-    def update_results_display(self):
-        """Update the main results display."""
-        self.result_text.config(state=tk.NORMAL)
-        self.result_text.delete(1.0, tk.END)
-
-        # Insert results with enhanced formatting
-        self.result_text.insert(tk.END, ">> Simulation Comparison Complete:\n\n", "header")
-        
-        # Configure text tags with larger fonts and modern colors
-        self.result_text.tag_configure("header_cyan", foreground="#4ECDC4", font=("Consolas", 16, "bold"))
-        self.result_text.tag_configure("value_color", foreground="#FF6B6B", font=("Consolas", 16))
-        self.result_text.tag_configure("separator", foreground="#444444", font=("Consolas", 16))
-        
-        # Calculate column widths
-        algo_width = 12
-        move_width = 16
-        seek_width = 14
-        thpt_width = 12
-        
-        # Create header with proper spacing
-        header = (
-            f"{'Algorithm':<{algo_width}} "
-            f"{'Total Movement':<{move_width}} "
-            f"{'Average Seek':<{seek_width}} "
-            f"{'Throughput':<{thpt_width}}"
-        )
-        
-        # Insert header with extra spacing for readability
-        self.result_text.insert(tk.END, "\n")  # Extra space at top
-        self.result_text.insert(tk.END, header + "\n", "header_cyan")
-        
-        # Create separator line
-        separator = "-" * (algo_width + move_width + seek_width + thpt_width + 3)
-        self.result_text.insert(tk.END, separator + "\n", "separator")
-
-        # Sort algorithms by total movement
-        sorted_results = sorted(self.all_results.items(), 
-                             key=lambda x: x[1]['head Movement'])
-
-        # Format and insert values with extra line spacing
-        for algo_name, result in sorted_results:
-            mov = str(result.get('head Movement', 'N/A'))
-            seek = f"{result.get('average Seek', 0):.2f}"
-            thpt = f"{result.get('throughput', 0):.4f}"
-            
-            # Format each row with proper spacing and left alignment
-            row = (
-                f"{algo_name:<{algo_width}} "
-                f"{mov:<{move_width}} "
-                f"{seek:<{seek_width}} "
-                f"{thpt:<{thpt_width}}"
-            )
-            self.result_text.insert(tk.END, row + "\n", "value_color")
-            self.result_text.insert(tk.END, "\n")  # Add extra line spacing between rows
-
-        # Bottom separator
-        self.result_text.insert(tk.END, separator + "\n", "separator")
-        self.result_text.insert(tk.END, "\n")  # Extra space at bottom
-
-        self.result_text.config(state=tk.DISABLED)
-
-    def show_visualization(self):
-        if not self.all_results:
-            messagebox.showwarning("No Data", "Please run the simulation first.")
-            return
-
-        selected_algos = [algo for algo, var in self.algo_vars.items() if var.get() == 1]
-
-        if not selected_algos:
-            messagebox.showwarning("No Selection", "Please select at least one algorithm to visualize using the checkboxes.")
-            return
-
-        results_to_plot = {}
-        for algo_name in selected_algos:
-            if algo_name in self.all_results:
-                if 'order' in self.all_results[algo_name]:
-                    results_to_plot[algo_name] = self.all_results[algo_name]
-                else:
-                    print(f"Warning: Results for {algo_name} missing 'order' data, skipping.")
-                    messagebox.showwarning("Missing Data", f"Plotting data ('order') missing for {algo_name}. Skipping.")
-            else:
-                print(f"Warning: Results for {algo_name} not found, skipping.")
-
-        if not results_to_plot:
-            messagebox.showerror("Error", "Could not find valid plot data for any selected algorithm.")
-            return
-
-        try:
-            print(f"Creating plot for: {', '.join(results_to_plot.keys())}")
-            plt.style.use('dark_background')
-            fig, ax = plt.subplots(figsize=(12, 7))
-            # Use self.root to get the background color
-            bg_color_hex = self.root.cget("bg")
-            r, g, b = self.root.winfo_rgb(bg_color_hex)
-            fig.patch.set_facecolor((r / 65535.0, g / 65535.0, b / 65535.0))
-            ax.set_facecolor((r / 65535.0, g / 65535.0, b / 65535.0))
-
-            # Get the animation object
-            ani = show_combined_disk_movement(results_to_plot, self.initial_head_pos, ax)
-
-            fig.tight_layout(pad=1.5)
-            plt.show()
-            print("plt.show() finished.")
-
-        except Exception as e:
-            messagebox.showerror("Visualization Error", f"An error occurred while generating the combined plot:\n{e}")
-
-    def reset_visualization_options(self):
-        self.visualize_button.config(state='disabled')
-        for algo, cb in self.algo_checkbuttons.items():
-            cb.config(state='disabled')
-            if algo in self.algo_vars:
-                self.algo_vars[algo].set(0)
-        self.all_results = None
-        self.initial_head_pos = None
-        self.disk_requests_list = None
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = DiskSchedulerGUI(root)
-    root.mainloop()
-
+# gui_disk_scheduler.py (Version 8 - Added Accessibility Options)
+
+import tkinter as tk
+from tkinter import ttk, messagebox, font, filedialog
+from scheduler_registry import available_algorithms, get_algorithm
+from drive_model import PRESETS, preset, apply_drive_model
+from result_cache import ResultCache, fingerprint
+from shared_results import iter_shared
+from trace_loader import load_trace
+from track_view import TrackPositionsView
+import instrumentation
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+import numpy as np
+
+from visualization_module import show_combined_disk_movement
+
+import matplotlib.pyplot as plt
+import matplotlib
+
+matplotlib.use('TkAgg')
+
+import sv_ttk
+
+LINEAR_MODEL = "Linear (tracks)"  # time = head movement, as in algorithm_engine
+DISK_SIZE = 200
+POLL_MS = 50  # How often the Tk loop drains the simulation and import workers' queues
+PARALLEL_MIN_REQUESTS = 1 << 20  # From this size, algorithms run in worker processes via shared memory
+
+logger = logging.getLogger(__name__)
+
+class DiskSchedulerGUI:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Disk Scheduling Algorithm Simulator")
+        self.root.geometry("1200x700")  # Further increased window width
+        sv_ttk.set_theme("dark")  # Apply the Sun Valley dark theme
+
+        self.all_results = None
+        self.initial_head_pos = None
+        self.disk_requests_list = None
+        self.imported_requests = None  # Array loaded by import_csv, never sent through the Entry
+        self.imported_label = None
+        self.imported_fingerprint = None
+        self.result_cache = ResultCache()  # Reruns with unchanged inputs come straight from here
+        self.worker = None
+        self.importer = None  # Thread parsing a trace for import_csv
+        self.import_queue = queue.Queue()
+        self.import_path = None
+        self.process_pool = None  # Started on the first large run
+        self.worker_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.pending_algorithms = []
+        self.algo_vars = {}
+        self.algo_checkbuttons = {}
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        main_frame = ttk.Frame(self.root, padding="20 20 20 20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        header = ttk.Label(main_frame, text="DISK SCHEDULING SIMULATOR", font=("Segoe UI", 18, "bold"), anchor=tk.CENTER)
+        header.pack(pady=(0, 20), fill=tk.X)
+
+        # Left side (existing content)
+        left_frame = ttk.Frame(main_frame)
+        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 20))
+
+        # --- Input Frame ---
+        input_outer_frame = ttk.Frame(left_frame)
+        input_outer_frame.pack(fill=tk.X, pady=5)
+        
+        # Input frame for disk requests with import button
+        input_frame = ttk.Frame(input_outer_frame)
+        input_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Disk Requests row with import button
+        disk_requests_frame = ttk.Frame(input_frame)
+        disk_requests_frame.grid(row=0, column=0, columnspan=2, sticky=tk.EW, pady=5)
+        
+        ttk.Label(disk_requests_frame, text="Disk Requests:", font=("Segoe UI", 11)).pack(side=tk.LEFT, padx=(0, 5))
+        self.requests_entry = ttk.Entry(disk_requests_frame, font=("Segoe UI", 11), width=50)
+        self.requests_entry.pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+        self.requests_entry.insert(0, "98, 183, 37, 122, 14, 124, 65, 67")
+        
+        self.import_button = ttk.Button(disk_requests_frame, text="Import CSV", command=self.import_csv)
+        self.import_button.pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(input_frame, text="Initial Head Pos:", font=("Segoe UI", 11)).grid(row=1, column=0, padx=(0, 5), pady=5, sticky=tk.W)
+        self.head_entry = ttk.Entry(input_frame, font=("Segoe UI", 11), width=15)
+        self.head_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
+        self.head_entry.insert(0, "53")
+
+        ttk.Label(input_frame, text="Drive Model:", font=("Segoe UI", 11)).grid(row=2, column=0, padx=(0, 5), pady=5, sticky=tk.W)
+        self.drive_model_var = tk.StringVar(value=LINEAR_MODEL)
+        drive_model_box = ttk.Combobox(input_frame, textvariable=self.drive_model_var, state="readonly",
+                                       values=[LINEAR_MODEL] + list(PRESETS), width=15)
+        drive_model_box.grid(row=2, column=1, padx=5, pady=5, sticky=tk.W)
+
+        buttons_frame = ttk.Frame(input_outer_frame)
+        buttons_frame.pack(side=tk.RIGHT, padx=10)
+
+        clear_data_button = ttk.Button(buttons_frame, text="Clear All Data", command=self.clear_input_fields)
+        clear_data_button.pack(pady=5, fill=tk.X)
+
+        # Timers and counters cost almost nothing, but can be switched off entirely
+        self.instrument_var = tk.IntVar(value=1)
+        instrumentation.enable(True)
+        ttk.Checkbutton(buttons_frame, text="Collect timings", variable=self.instrument_var,
+                        command=lambda: instrumentation.enable(self.instrument_var.get() == 1)).pack(pady=5, anchor=tk.W)
+
+        run_button_frame = ttk.Frame(left_frame)
+        run_button_frame.pack(pady=(15, 10), fill=tk.X)
+        self.run_button = ttk.Button(run_button_frame, text="RUN SIMULATION & COMPARE", command=self.run_simulation, style="Accent.TButton")
+        self.run_button.pack(side=tk.LEFT, expand=True, fill=tk.X)
+        self.cancel_button = ttk.Button(run_button_frame, text="Cancel", command=self.cancel_simulation, state='disabled')
+        self.cancel_button.pack(side=tk.LEFT, padx=(10, 0))
+
+        self.progress_bar = ttk.Progressbar(left_frame, mode='determinate')
+        self.progress_bar.pack(fill=tk.X)
+
+        # --- Results Frame ---
+        results_frame = ttk.LabelFrame(left_frame, text="Simulation Comparison Results")
+        results_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+
+        # Create the text widget with scrollbar
+        self.result_text = tk.Text(results_frame, height=10, wrap=tk.WORD, 
+                                 font=("Consolas", 16), bg="#1a1a1a", fg="white",
+                                 insertbackground="white", selectbackground="#4ECDC4",
+                                 padx=10, pady=10)
+        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.result_text.yview)
+        self.result_text.configure(yscrollcommand=scrollbar.set)
+
+        self.result_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.result_text.insert(tk.END, ">> Waiting for simulation...\n")
+        self.result_text.config(state=tk.DISABLED)
+
+        # Right side (Track Positions) with increased width
+        right_frame = ttk.Frame(main_frame)
+        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, padx=(20, 0))
+
+        # Configure weight for the frames
+        main_frame.columnconfigure(0, weight=2)  # Left frame takes 2 parts
+        main_frame.columnconfigure(1, weight=3)  # Right frame takes 3 parts
+
+        # Track Positions Frame with increased width
+        track_frame = ttk.LabelFrame(right_frame, text="Track Positions")
+        track_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Paged viewer: only the visible window of each schedule is rendered
+        self.track_view = TrackPositionsView(track_frame)
+        self.track_view.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Performance Frame: where the time went (parsing, scheduling, plotting) and operation counts
+        perf_frame = ttk.LabelFrame(right_frame, text="Performance")
+        perf_frame.pack(fill=tk.X, pady=(10, 0))
+        perf_controls = ttk.Frame(perf_frame)
+        perf_controls.pack(fill=tk.X, padx=5, pady=(5, 0))
+        self.phase_label = ttk.Label(perf_controls, text="", font=("Segoe UI", 9))
+        self.phase_label.pack(side=tk.LEFT)
+        ttk.Button(perf_controls, text="Reset", command=self.reset_performance).pack(side=tk.RIGHT)
+        self.perf_text = tk.Text(perf_frame, height=8, wrap=tk.NONE,
+                                 font=("Consolas", 10), bg="#1a1a1a", fg="white",
+                                 padx=10, pady=5, width=60)
+        self.perf_text.pack(fill=tk.X, padx=5, pady=5)
+        self.update_performance_panel()
+
+        # --- Visualization Selection Frame ---
+        vis_select_outer_frame = ttk.Frame(left_frame)
+        vis_select_outer_frame.pack(fill=tk.X, pady=5)
+
+        vis_select_frame = ttk.LabelFrame(vis_select_outer_frame, text="Select Algorithms to Visualize")
+        vis_select_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        vis_buttons_frame = ttk.Frame(vis_select_outer_frame)
+        vis_buttons_frame.pack(side=tk.RIGHT, padx=10, fill=tk.Y)
+
+        algorithms = available_algorithms()
+        num_cols = 4
+        for i, algo in enumerate(algorithms):
+            self.algo_vars[algo] = tk.IntVar()
+            cb = ttk.Checkbutton(vis_select_frame, text=algo, variable=self.algo_vars[algo], state='disabled')
+            col = i % num_cols
+            row = i // num_cols
+            cb.grid(row=row, column=col, padx=15, pady=5, sticky=tk.W)
+            self.algo_checkbuttons[algo] = cb
+
+        for i in range(num_cols):
+            vis_select_frame.columnconfigure(i, weight=1)
+
+        select_all_button = ttk.Button(vis_buttons_frame, text="Select All", command=self.select_all_algorithms)
+        select_all_button.pack(pady=5, fill=tk.X)
+
+        clear_selection_button = ttk.Button(vis_buttons_frame, text="Clear Selection", command=self.clear_all_algorithm_selections)
+        clear_selection_button.pack(pady=5, fill=tk.X)
+
+        vis_button_frame = ttk.Frame(left_frame)
+        vis_button_frame.pack(pady=(10, 0), fill=tk.X)
+        self.visualize_button = ttk.Button(vis_button_frame, text="VISUALIZE SELECTED", command=self.show_visualization, state='disabled', style="Accent.TButton")
+        self.visualize_button.pack(expand=True, fill=tk.X)
+
+    def clear_input_fields(self):
+        """Clears the disk requests and initial head position input fields."""
+        self.requests_entry.delete(0, tk.END)
+        self.head_entry.delete(0, tk.END)
+        self.imported_requests = None
+        self.imported_label = None
+
+    def select_all_algorithms(self):
+        """Selects all available disk scheduling algorithms for visualization."""
+        for algo in self.algo_vars:
+            if algo in self.all_results:  # Only select if results are available
+                self.algo_vars[algo].set(1)
+
+    def clear_all_algorithm_selections(self):
+        """Clears the selection of all disk scheduling algorithms for visualization."""
+        for algo in self.algo_vars:
+            self.algo_vars[algo].set(0)
+
+    def import_csv(self):
+        try:
+            file_path = filedialog.askopenfilename(
+                title="Select CSV File",
+                filetypes=[("CSV files", "*.csv *.csv.gz"), ("Text files", "*.txt"), ("All files", "*.*")]
+            )
+            
+            if not file_path:  # User cancelled the dialog
+                return
+
+            # Parsing happens on a worker thread; _poll_import shows progress and the outcome
+            self.import_queue = queue.Queue()
+            self.import_path = file_path
+            self.importer = threading.Thread(target=self._import_worker, args=(self.import_queue, file_path), daemon=True)
+            self.import_button.config(state='disabled')
+            self.run_button.config(state='disabled')
+            self._show_import_progress(file_path, 0, 1)
+            self.importer.start()
+            self.root.after(POLL_MS, self._poll_import)
+
+        except Exception as e:
+            messagebox.showerror("Import Error", f"Error reading CSV file:\n{str(e)}")
+
+    def _import_worker(self, out, file_path):
+        """Runs on a worker thread; talks to the Tk thread only through the out queue."""
+        try:
+            # Keep the trace as a compact array; only a short label goes into the Entry
+            reqs = load_trace(file_path, progress=lambda done, total: out.put(("progress", done, total)))
+            out.put(("imported", file_path, reqs))
+        except Exception as e:
+            out.put(("error", file_path, e))
+
+    def _show_import_progress(self, file_path, done, total):
+        self.requests_entry.delete(0, tk.END)
+        self.requests_entry.insert(0, f"Loading {os.path.basename(file_path)}... {100 * done // max(total, 1)}%")
+
+    def _poll_import(self):
+        """Drain import messages on the Tk thread, then reschedule until the load ends."""
+        finished = None
+        progress = None
+        try:
+            while finished is None:
+                message = self.import_queue.get_nowait()
+                if message[0] == "progress":
+                    progress = message
+                else:
+                    finished = message
+        except queue.Empty:
+            pass
+
+        if finished is None:
+            if progress is not None:
+                self._show_import_progress(self.import_path, progress[1], progress[2])
+            self.root.after(POLL_MS, self._poll_import)
+            return
+
+        self.importer = None
+        self.import_button.config(state='normal')
+        if self.worker is None:
+            self.run_button.config(state='normal')
+        kind, file_path, payload = finished
+        self.requests_entry.delete(0, tk.END)
+        if kind == "imported":
+            self.imported_requests = payload
+            self.imported_label = f"[{payload.size} requests from {os.path.basename(file_path)}]"
+            self.imported_fingerprint = None
+            self.requests_entry.insert(0, self.imported_label)
+            logger.info("Imported %d requests from %s", payload.size, file_path)
+            self.update_performance_panel()
+        elif isinstance(payload, ValueError):
+            self.imported_requests = None
+            messagebox.showerror("Import Error", f"Invalid data in CSV file. Please ensure all values are non-negative integers.\n{payload}")
+        else:
+            self.imported_requests = None
+            messagebox.showerror("Import Error", f"Error reading CSV file:\n{str(payload)}")
+
+    def update_track_positions(self):
+        """Update the track positions display with the current results."""
+        if not self.all_results:
+            return
+        self.track_view.set_results(self.all_results, self.initial_head_pos)
+
+    def update_performance_panel(self):
+        """Show the recorded timers and counters, with a per-phase total on top."""
+        data = instrumentation.snapshot()
+        phases = sorted(data["phases"].items(), key=lambda item: -item[1])
+        self.phase_label.config(text="  ".join(f"{phase}: {seconds * 1000:.1f} ms" for phase, seconds in phases)
+                                if phases else "Timings appear here after a run.")
+        self.perf_text.config(state=tk.NORMAL)
+        self.perf_text.delete(1.0, tk.END)
+        self.perf_text.insert(tk.END, instrumentation.format_report(data))
+        self.perf_text.config(state=tk.DISABLED)
+
+    def reset_performance(self):
+        instrumentation.reset()
+        self.update_performance_panel()
+
+    def run_simulation(self):
+        try:
+            requests_str = self.requests_entry.get()
+            if not requests_str: raise ValueError("Disk Requests cannot be empty.")
+            if self.imported_requests is not None and requests_str == self.imported_label:
+                self.disk_requests_list = self.imported_requests
+                requests_fingerprint = self.imported_fingerprint  # None: hashed on the worker
+            else:
+                self.disk_requests_list = np.array([int(x.strip()) for x in requests_str.split(',')], dtype=np.int64)
+                requests_fingerprint = None
+            if not self.disk_requests_list.size: raise ValueError("No valid disk requests entered.")
+            if self.disk_requests_list.min() < 0: raise ValueError("Disk Requests must be non-negative integers.")
+            head_str = self.head_entry.get()
+            if not head_str: raise ValueError("Initial Head Position cannot be empty.")
+            self.initial_head_pos = int(head_str)
+            if self.initial_head_pos < 0: raise ValueError("Initial Head Position must be non-negative.")
+
+            # Heavy work happens on a worker thread; rows fill in from _poll_worker
+            self.all_results = {}
+            self.pending_algorithms = available_algorithms()
+            self.reset_visualization_options(keep_inputs=True)
+            self.cancel_event.clear()
+            self.worker_queue = queue.Queue()
+            self.worker = threading.Thread(
+                target=self._simulation_worker,
+                args=(self.worker_queue, self.cancel_event, self.disk_requests_list, self.initial_head_pos,
+                      requests_fingerprint, list(self.pending_algorithms), self.drive_model_var.get()),
+                daemon=True)
+            self.run_button.config(state='disabled')
+            self.cancel_button.config(state='normal')
+            self.progress_bar.config(maximum=len(self.pending_algorithms), value=0)
+            self.update_results_display()
+            self.worker.start()
+            self.root.after(POLL_MS, self._poll_worker)
+
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Invalid input:\n{e}\nPlease enter comma-separated non-negative integers for requests and a non-negative integer for the head position.")
+            self.reset_visualization_options()
+        except Exception as e:
+            messagebox.showerror("Simulation Error", f"An unexpected error occurred during simulation:\n{e}")
+            self.reset_visualization_options()
+
+    def _simulation_worker(self, out, cancel, reqs, head, requests_fingerprint, algorithms, drive_model):
+        """Runs on a worker thread; talks to the Tk thread only through the out queue."""
+        try:
+            if requests_fingerprint is None:
+                requests_fingerprint = fingerprint(reqs)
+                out.put(("fingerprint", reqs, requests_fingerprint))
+            model = preset(drive_model, DISK_SIZE) if drive_model != LINEAR_MODEL else None
+
+            def post(algo, result):
+                if model is not None:
+                    apply_drive_model(result, head, model)
+                out.put(("result", algo, result))
+
+            parallel = reqs.size >= PARALLEL_MIN_REQUESTS
+            uncached = []
+            for algo in algorithms:
+                if cancel.is_set():
+                    out.put(("cancelled",))
+                    return
+                if parallel:
+                    # Large traces: collect cache hits here, run the rest side by side below
+                    key = self.result_cache.make_key(requests_fingerprint, algo, head, DISK_SIZE)
+                    result = self.result_cache.get(key, needOrder=True)
+                    if result is None:
+                        uncached.append(algo)
+                        continue
+                else:
+                    result = self.result_cache.run(get_algorithm(algo), reqs, head, DISK_SIZE,
+                                                   fingerprintHex=requests_fingerprint)
+                post(algo, result)
+
+            if uncached:
+                if self.process_pool is None:
+                    self.process_pool = ProcessPoolExecutor(mp_context=get_context("spawn"))
+                # Orders come back as shared-memory views instead of pickled copies
+                shared = iter_shared(reqs, head, DISK_SIZE, uncached, withSeeks=False, pool=self.process_pool)
+                try:
+                    for algo, result in shared:
+                        self.result_cache.put(self.result_cache.make_key(requests_fingerprint, algo, head, DISK_SIZE),
+                                              result)
+                        post(algo, result)
+                        if cancel.is_set():
+                            out.put(("cancelled",))
+                            return
+                finally:
+                    shared.close()
+            out.put(("done",))
+        except Exception as e:
+            out.put(("error", e))
+
+    def _poll_worker(self):
+        """Drain worker messages on the Tk thread, then reschedule until the run ends."""
+        finished = None
+        changed = False
+        try:
+            while True:
+                message = self.worker_queue.get_nowait()
+                kind = message[0]
+                if kind == "result":
+                    _, algo, result = message
+                    self.all_results[algo] = result
+                    self.pending_algorithms.remove(algo)
+                    self.algo_checkbuttons[algo].config(state='normal')
+                    self.progress_bar.step(1)
+                    changed = True
+                elif kind == "fingerprint":
+                    if message[1] is self.imported_requests:
+                        self.imported_fingerprint = message[2]
+                else:
+                    finished = message
+        except queue.Empty:
+            pass
+
+        if finished is None:
+            if changed:
+                self.update_results_display()
+            self.root.after(POLL_MS, self._poll_worker)
+            return
+
+        self.worker = None
+        if self.importer is None:
+            self.run_button.config(state='normal')
+        self.cancel_button.config(state='disabled')
+        if finished[0] == "error":
+            error = finished[1]
+            self.pending_algorithms = []
+            if isinstance(error, ValueError):
+                messagebox.showerror("Input Error", f"Invalid input:\n{error}")
+            else:
+                messagebox.showerror("Simulation Error", f"An unexpected error occurred during simulation:\n{error}")
+        self.update_results_display(cancelled=finished[0] == "cancelled")
+        self.update_track_positions()
+        self.update_performance_panel()
+        if self.all_results:
+            self.visualize_button.config(state='normal')
+
+    def cancel_simulation(self):
+        """Stop the run after the algorithm currently executing."""
+        if self.worker is not None:
+            self.cancel_event.set()
+            self.cancel_button.config(state='disabled')
+
+    def update_results_display(self, cancelled=False):
+        """Update the main results display; algorithms still running are listed as pending."""
+        self.result_text.config(state=tk.NORMAL)
+        self.result_text.delete(1.0, tk.END)
+
+        # Insert results with enhanced formatting
+        if cancelled:
+            status = f">> Simulation Cancelled ({len(self.all_results)} of {len(self.all_results) + len(self.pending_algorithms)} algorithms):"
+        elif self.worker is not None:
+            status = f">> Running Simulation ({len(self.all_results)} of {len(self.all_results) + len(self.pending_algorithms)} algorithms)..."
+        else:
+            status = ">> Simulation Comparison Complete:"
+        self.result_text.insert(tk.END, status + "\n\n", "header")
+        
+        # Configure text tags with larger fonts and modern colors
+        self.result_text.tag_configure("header_cyan", foreground="#4ECDC4", font=("Consolas", 16, "bold"))
+        self.result_text.tag_configure("value_color", foreground="#FF6B6B", font=("Consolas", 16))
+        self.result_text.tag_configure("separator", foreground="#444444", font=("Consolas", 16))
+        
+        # Calculate column widths
+        algo_width = 12
+        move_width = 16
+        seek_width = 14
+        thpt_width = 12
+        pct_width = 8
+        percentiles = ["p50", "p90", "p99", "p99.9"]
+        
+        # Physical units once a drive model has been applied
+        timed = any(result.get('timing') for result in self.all_results.values())
+        seek_label = "Avg Seek (ms)" if timed else "Average Seek"
+        thpt_label = "IOPS" if timed else "Throughput"
+
+        # Create header with proper spacing
+        header = (
+            f"{'Algorithm':<{algo_width}} "
+            f"{'Total Movement':<{move_width}} "
+            f"{seek_label:<{seek_width}} "
+            f"{thpt_label:<{thpt_width}}"
+        )
+        # Seek-distance percentiles (tracks) from each run's streaming sketch
+        header += "".join(f" {label:<{pct_width}}" for label in percentiles)
+        
+        # Insert header with extra spacing for readability
+        self.result_text.insert(tk.END, "\n")  # Extra space at top
+        self.result_text.insert(tk.END, header + "\n", "header_cyan")
+        
+        # Create separator line
+        separator = "-" * (algo_width + move_width + seek_width + thpt_width + 3
+                           + (pct_width + 1) * len(percentiles))
+        self.result_text.insert(tk.END, separator + "\n", "separator")
+
+        # Sort algorithms by total movement
+        sorted_results = sorted(self.all_results.items(), 
+                             key=lambda x: x[1]['head Movement'])
+
+        # Format and insert values with extra line spacing
+        for algo_name, result in sorted_results:
+            mov = str(result.get('head Movement', 'N/A'))
+            seek = f"{result.get('average Seek', 0):.2f}"
+            thpt = f"{result.get('throughput', 0):.4f}"
+            seek_stats = result.get('seek Stats')
+            if seek_stats is not None and not isinstance(seek_stats, dict):
+                seek_stats = seek_stats.summary()
+            
+            # Format each row with proper spacing and left alignment
+            row = (
+                f"{algo_name:<{algo_width}} "
+                f"{mov:<{move_width}} "
+                f"{seek:<{seek_width}} "
+                f"{thpt:<{thpt_width}}"
+            )
+            for label in percentiles:
+                value = f"{seek_stats[label]:.1f}" if seek_stats else "N/A"
+                row += f" {value:<{pct_width}}"
+            self.result_text.insert(tk.END, row + "\n", "value_color")
+            self.result_text.insert(tk.END, "\n")  # Add extra line spacing between rows
+
+        if self.worker is not None or cancelled:
+            for algo_name in self.pending_algorithms:
+                placeholder = "skipped" if cancelled else "running..."
+                self.result_text.insert(tk.END, f"{algo_name:<{algo_width}} {placeholder}\n\n", "separator")
+
+        # Bottom separator
+        self.result_text.insert(tk.END, separator + "\n", "separator")
+        self.result_text.insert(tk.END, "\n")  # Extra space at bottom
+
+        self.result_text.config(state=tk.DISABLED)
+
+    def show_visualization(self):
+        if not self.all_results:
+            messagebox.showwarning("No Data", "Please run the simulation first.")
+            return
+
+        selected_algos = [algo for algo, var in self.algo_vars.items() if var.get() == 1]
+
+        if not selected_algos:
+            messagebox.showwarning("No Selection", "Please select at least one algorithm to visualize using the checkboxes.")
+            return
+
+        results_to_plot = {}
+        for algo_name in selected_algos:
+            if algo_name in self.all_results:
+                if 'order' in self.all_results[algo_name]:
+                    results_to_plot[algo_name] = self.all_results[algo_name]
+                else:
+                    logger.warning("Results for %s missing 'order' data, skipping.", algo_name)
+                    messagebox.showwarning("Missing Data", f"Plotting data ('order') missing for {algo_name}. Skipping.")
+            else:
+                logger.warning("Results for %s not found, skipping.", algo_name)
+
+        if not results_to_plot:
+            messagebox.showerror("Error", "Could not find valid plot data for any selected algorithm.")
+            return
+
+        try:
+            logger.debug("Creating plot for: %s", ", ".join(results_to_plot.keys()))
+            with instrumentation.timer("plot.figure"):
+                plt.style.use('dark_background')
+                fig, ax = plt.subplots(figsize=(12, 7))
+                # Use self.root to get the background color
+                bg_color_hex = self.root.cget("bg")
+                r, g, b = self.root.winfo_rgb(bg_color_hex)
+                fig.patch.set_facecolor((r / 65535.0, g / 65535.0, b / 65535.0))
+                ax.set_facecolor((r / 65535.0, g / 65535.0, b / 65535.0))
+
+                # Get the animation object
+                ani = show_combined_disk_movement(results_to_plot, self.initial_head_pos, ax, DISK_SIZE)
+
+                fig.tight_layout(pad=1.5)
+            self.update_performance_panel()
+            plt.show()
+            logger.debug("plt.show() finished.")
+
+        except Exception as e:
+            messagebox.showerror("Visualization Error", f"An error occurred while generating the combined plot:\n{e}")
+
+    def reset_visualization_options(self, keep_inputs=False):
+        self.visualize_button.config(state='disabled')
+        for algo, cb in self.algo_checkbuttons.items():
+            cb.config(state='disabled')
+            if algo in self.algo_vars:
+                self.algo_vars[algo].set(0)
+        if keep_inputs:
+            return
+        self.all_results = None
+        self.initial_head_pos = None
+        self.disk_requests_list = None
+
+if __name__ == "__main__":
+    # e.g. DISK_SIM_LOG_LEVEL=DEBUG python main.py
+    logging.basicConfig(level=os.environ.get("DISK_SIM_LOG_LEVEL", "WARNING"),
+                        format="%(levelname)s %(name)s: %(message)s")
+    root = tk.Tk()
+    app = DiskSchedulerGUI(root)
+    root.mainloop()
+    if app.process_pool is not None:
+        app.process_pool.shutdown(cancel_futures=True)
+
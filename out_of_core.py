@@ -0,0 +1,376 @@
+import os
+import tempfile
+
+import numpy as np
+
+from instrumentation import count, timer
+from stats_module import SeekStats
+
+OUT_OF_CORE_ALGORITHMS = ("FCFS", "SCAN", "C-SCAN", "LOOK", "C-LOOK")
+DEFAULT_MEMORY = 256 << 20  # Bytes of array data held at once
+MAX_FAN_IN = 64             # Runs merged per pass
+_ITEM = 8                   # Everything spills as int64
+
+def _chunk_size(memoryBytes):
+    # A chunk is split, sorted and copied a few times over, so keep it well under the ceiling
+    return max(1 << 12, memoryBytes // (6 * _ITEM))
+
+def iter_chunks(path, chunkSize, progress=None):
+    """
+    Stream a trace as int64 chunks of at most about chunkSize requests.
+    Binary traces are sliced from their memory map; CSV/text traces are parsed
+    with trace_loader in byte-bounded blocks.
+    """
+    from binary_trace import is_binary_trace, open_trace
+    from trace_loader import iter_trace_chunks
+
+    if is_binary_trace(path):
+        tracks = open_trace(path).tracks
+        for start in range(0, tracks.size, chunkSize):
+            yield tracks[start:start + chunkSize].astype(np.int64)
+            if progress:
+                progress("read", min(start + chunkSize, tracks.size), tracks.size)
+        return
+    # Numbers take at least two bytes of text each (digit and separator)
+    reported = (lambda done, total: progress("read", done, total)) if progress else None
+    for chunk in iter_trace_chunks(path, chunkSize * 2, np.int64, reported):
+        if chunk.size and chunk.min() < 0:
+            raise ValueError("Disk requests must be non-negative integers.")
+        yield chunk
+
+class _Sink:
+    """
+    Consumes the service order block by block: keeps the head position
+    between blocks to total the movement and the seek statistics, and
+    optionally writes the order
+    (text for .csv/.txt paths, a binary trace otherwise).
+    """
+
+    def __init__(self, startHead, orderPath=None, diskSize=200):
+        self.head = startHead
+        self.movement = 0
+        self.steps = 0
+        self.seekStats = SeekStats(diskSize - 1)
+        self._text = None
+        self._writer = None
+        if orderPath is None:
+            return
+        if os.path.splitext(orderPath)[1].lower() in (".csv", ".txt"):
+            self._text = open(orderPath, "w")
+        else:
+            from binary_trace import TraceWriter
+
+            self._writer = TraceWriter(orderPath, diskSize, "int64")
+
+    def write(self, block):
+        if not block.size:
+            return
+        self.movement += self.seekStats.add_path(self.head, block)
+        self.head = int(block[-1])
+        self.steps += block.size
+        if self._writer is not None:
+            self._writer.write(block)
+        elif self._text is not None:
+            np.savetxt(self._text, block, fmt="%d")
+
+    def close(self, failed=False):
+        if self._writer is not None:
+            self._writer.__exit__(ValueError if failed else None, None, None)
+        elif self._text is not None:
+            self._text.close()
+
+class _RunFile:
+    """Sequential reader over one sorted run on disk."""
+
+    def __init__(self, path, blockSize):
+        self.file = open(path, "rb")
+        self.blockSize = blockSize
+        self.buffer = np.empty(0, dtype=np.int64)
+        self.refill()
+
+    def refill(self):
+        if not self.buffer.size:
+            self.buffer = np.fromfile(self.file, dtype=np.int64, count=self.blockSize)
+        return self.buffer.size > 0
+
+    def close(self):
+        self.file.close()
+
+def merge_runs(paths, blockSize):
+    """
+    K-way merge of sorted int64 run files, yielding sorted blocks.
+    Each step takes, from every run's buffer, the values up to the smallest
+    buffer tail (nothing later in any run can be smaller), sorts that slice
+    and emits it, so the work stays vectorized and memory stays at about
+    len(paths) * blockSize values.
+    """
+    runs = [_RunFile(path, blockSize) for path in paths]
+    try:
+        runs = [run for run in runs if run.buffer.size]
+        while runs:
+            bound = min(int(run.buffer[-1]) for run in runs)
+            parts = []
+            for run in runs:
+                cut = np.searchsorted(run.buffer, bound, side="right")
+                parts.append(run.buffer[:cut])
+                run.buffer = run.buffer[cut:]
+            block = np.concatenate(parts)
+            block.sort(kind="stable")
+            yield block
+            alive = []
+            for run in runs:
+                if run.refill():
+                    alive.append(run)
+                else:
+                    run.close()
+            runs = alive
+    finally:
+        for run in runs:
+            run.close()
+
+class ExternalSorter:
+    """
+    Sort more values than fit in memory: sorted runs of at most chunkSize
+    values are spilled to tmpDir, then merged (in passes of MAX_FAN_IN runs
+    when there are more) while being read back.
+    """
+
+    def __init__(self, tmpDir, prefix, chunkSize):
+        self.tmpDir = tmpDir
+        self.prefix = prefix
+        self.chunkSize = chunkSize
+        self.runs = []
+        self.size = 0
+        self.spilled = 0
+        self._pending = []
+        self._pendingSize = 0
+
+    def add(self, values):
+        if not values.size:
+            return
+        self._pending.append(values)
+        self._pendingSize += values.size
+        self.size += values.size
+        if self._pendingSize >= self.chunkSize:
+            self._spill()
+
+    def _new_run(self):
+        path = os.path.join(self.tmpDir, f"{self.prefix}-{len(self.runs)}-{self.spilled}.run")
+        self.spilled += 1
+        return path
+
+    def _spill(self):
+        if not self._pending:
+            return
+        run = np.concatenate(self._pending)
+        run.sort()
+        self._pending, self._pendingSize = [], 0
+        path = self._new_run()
+        run.tofile(path)
+        count("ooc.spilledBytes", run.nbytes)
+        self.runs.append(path)
+
+    def sorted_blocks(self, progress=None):
+        """Yield all values in ascending order, in blocks; run files are deleted as they are used up."""
+        if not self.runs:
+            # Everything fitted in memory: no disk round trip
+            if self._pending:
+                block = np.concatenate(self._pending)
+                block.sort()
+                self._pending, self._pendingSize = [], 0
+                yield block
+            return
+        self._spill()
+        runs = self.runs
+        passes = 0
+        while len(runs) > MAX_FAN_IN:
+            merged = []
+            for i in range(0, len(runs), MAX_FAN_IN):
+                group = runs[i:i + MAX_FAN_IN]
+                path = self._new_run()
+                with open(path, "wb") as out:
+                    for block in merge_runs(group, self._block_size(len(group))):
+                        block.tofile(out)
+                        count("ooc.spilledBytes", block.nbytes)
+                for used in group:
+                    os.remove(used)
+                merged.append(path)
+            runs = merged
+            passes += 1
+        count("ooc.mergePasses", passes + 1)
+        done = 0
+        for block in merge_runs(runs, self._block_size(len(runs))):
+            done += block.size
+            if progress:
+                progress(done, self.size)
+            yield block
+        for used in runs:
+            os.remove(used)
+        self.runs = []
+
+    def _block_size(self, fanIn):
+        return max(1 << 10, self.chunkSize // (2 * fanIn))
+
+def _reversed_blocks(blocks):
+    """Negated ascending blocks come back as descending blocks of the original values."""
+    for block in blocks:
+        yield -block
+
+def simulate_file(path, algorithm, startHead, diskSize=200, memoryBytes=DEFAULT_MEMORY, orderPath=None,
+                  tmpDir=None, progress=None, seekStats=False):
+    """
+    Run a scheduling algorithm on a trace too large for memory.
+    FCFS streams the trace once, carrying the head position between
+    chunks. The elevator algorithms split every chunk at the start head and
+    sort each side with an external merge sort (runs spilled to tmpDir),
+    then sweep the merged streams in service order. When neither an order
+    file nor seek statistics are wanted and every track lies on the disk,
+    their head movement only depends on the extremes of each side, so a
+    single pass suffices.
+    Args:
+        path (str): Trace (binary, CSV or text, may be .gz).
+        algorithm (str): One of OUT_OF_CORE_ALGORITHMS.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num.
+        memoryBytes (int): Ceiling for array data held in memory at once.
+        orderPath (str): Optional file for the service order (.csv/.txt text, else binary trace).
+        tmpDir (str): Where sorted runs are spilled (default: the system temp dir).
+        progress (callable): Optional callback(phase, done, total); phase is
+            "read", "merge right" or "merge left".
+        seekStats (bool): Also summarize the seek distances (see
+            stats_module.SeekStats); FCFS always does.
+    Returns:
+        dict: algorithm, requests, head Movement, average Seek, throughput,
+            plus spilled run count, the order path and, when swept, seek Stats.
+    """
+    name = algorithm.upper()
+    if name not in OUT_OF_CORE_ALGORITHMS:
+        raise ValueError(f"{algorithm} cannot run out of core. Available: {', '.join(OUT_OF_CORE_ALGORITHMS)}")
+    if startHead < 0 or diskSize <= 0:
+        raise ValueError("startHead must be non-negative and diskSize positive.")
+    chunkSize = _chunk_size(memoryBytes)
+    end = diskSize - 1
+    summary = {"algorithm": name, "requests": 0, "runs": 0, "order Path": orderPath}
+
+    with timer("schedule.outOfCore." + name):
+        if name == "FCFS":
+            sink = _Sink(startHead, orderPath, diskSize)
+            try:
+                for chunk in iter_chunks(path, chunkSize, progress):
+                    sink.write(chunk)
+            except BaseException:
+                sink.close(failed=True)
+                raise
+            sink.close()
+            return _finish(summary, sink.steps, sink.movement, sink.seekStats)
+
+        if orderPath is None and not seekStats:
+            extremes = _scan_extremes(path, startHead, chunkSize, progress)
+            if extremes[2] <= end and startHead <= end:
+                return _finish(summary, extremes[0], _closed_form(name, startHead, end, *extremes[1:]))
+
+        circular = name in ("C-SCAN", "C-LOOK")
+        with tempfile.TemporaryDirectory(prefix="disksim-", dir=tmpDir) as spillDir:
+            right = ExternalSorter(spillDir, "right", chunkSize)
+            left = ExternalSorter(spillDir, "left", chunkSize)
+            for chunk in iter_chunks(path, chunkSize, progress):
+                goesRight = chunk >= startHead
+                right.add(chunk[goesRight])
+                # Left requests are served downwards by SCAN/LOOK: sort them negated
+                left.add(chunk[~goesRight] if circular else -chunk[~goesRight])
+            summary["runs"] = len(right.runs) + len(left.runs)
+
+            sink = _Sink(startHead, orderPath, diskSize)
+            try:
+                reported = (lambda done, total: progress("merge right", done, total)) if progress else None
+                for block in right.sorted_blocks(reported):
+                    sink.write(block)
+                if name in ("SCAN", "C-SCAN") and sink.head != end:
+                    sink.write(np.array([end], dtype=np.int64))
+                if name == "C-SCAN":
+                    sink.write(np.array([0], dtype=np.int64))
+                reported = (lambda done, total: progress("merge left", done, total)) if progress else None
+                blocks = left.sorted_blocks(reported)
+                for block in (blocks if circular else _reversed_blocks(blocks)):
+                    sink.write(block)
+            except BaseException:
+                sink.close(failed=True)
+                raise
+            sink.close()
+        return _finish(summary, right.size + left.size, sink.movement, sink.seekStats)
+
+def _scan_extremes(path, startHead, chunkSize, progress):
+    """(count, highest right track, highest track, lowest left track, highest left track) in one pass."""
+    total, rightMax, overallMax, leftMin, leftMax = 0, None, -1, None, None
+    for chunk in iter_chunks(path, chunkSize, progress):
+        total += chunk.size
+        overallMax = max(overallMax, int(chunk.max()))
+        goesRight = chunk >= startHead
+        right, left = chunk[goesRight], chunk[~goesRight]
+        if right.size:
+            rightMax = int(right.max()) if rightMax is None else max(rightMax, int(right.max()))
+        if left.size:
+            leftMin = int(left.min()) if leftMin is None else min(leftMin, int(left.min()))
+            leftMax = int(left.max()) if leftMax is None else max(leftMax, int(left.max()))
+    return total, rightMax, overallMax, leftMin, leftMax
+
+def _closed_form(name, startHead, end, rightMax, overallMax, leftMin, leftMax):
+    # Same totals as the engines' paths (see incremental_engine); all tracks lie within 0..end
+    lastRight = rightMax if rightMax is not None else startHead
+    movement = lastRight - startHead
+    if name == "SCAN":
+        movement += end - lastRight
+        if leftMin is not None:
+            movement += end - leftMin
+    elif name == "C-SCAN":
+        movement += (end - lastRight) + end + (leftMax if leftMax is not None else 0)
+    elif name == "LOOK":
+        if leftMin is not None:
+            movement += lastRight - leftMin
+    elif leftMin is not None:
+        movement += (lastRight - leftMin) + (leftMax - leftMin)
+    return movement
+
+def _finish(summary, requests, movement, seekStats=None):
+    summary.update({
+        "requests": requests,
+        "head Movement": movement,
+        "average Seek": movement / requests if requests else 0,
+        "throughput": requests / movement if movement else 0
+    })
+    if seekStats is not None:
+        summary["seek Stats"] = seekStats.summary()
+    return summary
+
+def main(argv=None):
+    import argparse
+    import json
+    import sys
+
+    parser = argparse.ArgumentParser(description="Simulate FCFS or an elevator algorithm on a trace larger than RAM.")
+    parser.add_argument("trace", help="Binary trace, CSV or text file (may be .gz).")
+    parser.add_argument("--head", type=int, required=True)
+    parser.add_argument("--disk-size", type=int, default=200)
+    parser.add_argument("-a", "--algorithm", choices=OUT_OF_CORE_ALGORITHMS, default="SCAN")
+    parser.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY >> 20, help="Memory ceiling for array data.")
+    parser.add_argument("--order-file", default=None, help="Also write the service order (.csv/.txt or binary trace).")
+    parser.add_argument("--tmp-dir", default=None, help="Directory for spilled sort runs.")
+    parser.add_argument("--seek-stats", action="store_true",
+                        help="Also report seek-distance percentiles (elevators then sweep the sorted trace).")
+    args = parser.parse_args(argv)
+
+    shown = [None]
+
+    def show(phase, done, total):
+        status = f"{phase}: {100 * done // max(total, 1)}%"
+        if status != shown[0]:
+            shown[0] = status
+            print(f"\r{status:<20}", end="", file=sys.stderr, flush=True)
+
+    summary = simulate_file(args.trace, args.algorithm, args.head, args.disk_size, args.memory_mb << 20,
+                            args.order_file, args.tmp_dir, show, args.seek_stats)
+    print(file=sys.stderr)
+    print(json.dumps(summary, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import numpy as np
+
+from result_module import SimulationResult
+
+# Schedules whose cost depends only on where the head falls in the sorted requests
+INDEXED_ALGORITHMS = ("SCAN", "C-SCAN", "LOOK", "C-LOOK", "FSCAN")
+
+class WorkloadIndex:
+    """
+    Sorted requests with prefix sums, answering elevator-schedule costs for
+    any start head in O(log n) (one searchsorted) instead of an O(n) run.
+    Results match vector_engine exactly, including requests beyond the disk
+    end. Every query takes a scalar head or an array of heads; arrays are
+    answered in one vectorized pass.
+    Args:
+        reqs (array-like): Disk reqs as an int array.
+    """
+
+    def __init__(self, reqs):
+        self.sorted = np.sort(np.asarray(reqs, dtype=np.int64).ravel())
+        self.size = self.sorted.size
+        # prefix[k] = sum of the k smallest requests
+        self.prefix = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum(self.sorted, out=self.prefix[1:])
+        self.min = int(self.sorted[0]) if self.size else 0
+        self.max = int(self.sorted[-1]) if self.size else 0
+
+    def split(self, heads):
+        """Number of requests served on the return leg (tracks below each head)."""
+        return np.searchsorted(self.sorted, heads, side="left")
+
+    def _evaluate(self, algorithm, heads, diskSize):
+        name = algorithm.upper()
+        if name not in INDEXED_ALGORITHMS:
+            raise ValueError(f"{algorithm} cannot be answered from the index. "
+                             f"Supported: {', '.join(INDEXED_ALGORITHMS)}")
+        heads = np.asarray(heads, dtype=np.int64)
+        k = self.split(heads)
+        numLeft = k
+        numRight = self.size - k
+        hasLeft = numLeft > 0
+        hasRight = numRight > 0
+        leftSum = self.prefix[k]
+        rightSum = self.prefix[-1] - leftSum
+        # Largest track below the head (only meaningful where hasLeft)
+        leftTop = self.sorted[np.maximum(k - 1, 0)] if self.size else np.zeros_like(k)
+        lo, hi = self.min, self.max
+
+        # Outward leg: every scheme serves the right-hand requests in ascending order
+        rightMovement = np.where(hasRight, hi - heads, 0)
+        rightResponse = rightSum - heads * numRight
+
+        if name in ("SCAN", "FSCAN", "C-SCAN"):
+            end = diskSize - 1
+            lastRight = np.where(hasRight, hi, heads)
+            rightMovement = rightMovement + np.abs(end - lastRight)
+            if name == "C-SCAN":
+                # Jump end -> 0, then climb to the highest left request
+                leftMovement = np.where(hasLeft, end + leftTop, end)
+                leftResponse = numLeft * (rightMovement + end) + leftSum
+            else:
+                # Descend from the end through the left requests
+                leftMovement = np.where(hasLeft, np.abs(end - leftTop) + leftTop - lo, 0)
+                leftResponse = numLeft * (rightMovement + np.abs(end - leftTop) + leftTop) - leftSum
+        elif name == "LOOK":
+            turn = np.where(hasRight, hi, heads)
+            leftMovement = np.where(hasLeft, turn - lo, 0)
+            leftResponse = numLeft * (rightMovement + turn) - leftSum
+        else:  # C-LOOK: jump to the lowest request, then climb to leftTop
+            jump = np.where(hasRight, hi - lo, heads - lo)
+            leftMovement = np.where(hasLeft, jump + leftTop - lo, 0)
+            leftResponse = numLeft * (rightMovement + jump - lo) + leftSum
+
+        headMovement = rightMovement + leftMovement
+        count = max(self.size, 1)
+        return {
+            "head Movement": headMovement,
+            "average Seek": headMovement / count,
+            "throughput": np.divide(self.size, headMovement, out=np.zeros(headMovement.shape),
+                                    where=headMovement != 0),
+            "average Response": (rightResponse + leftResponse) / count,
+            "right Requests": numRight,
+            "left Requests": numLeft,
+            "right Movement": rightMovement,
+            "left Movement": leftMovement
+        }
+
+    def query(self, algorithm, startHead, diskSize=200):
+        """
+        Cost of one schedule in O(log n).
+        Args:
+            algorithm (str): SCAN, C-SCAN, LOOK, C-LOOK or FSCAN.
+            startHead (int or array-like): Initial head pos, or many of them.
+            diskSize (int): Max disk track num.
+        Returns:
+            dict: head Movement, average Seek, throughput, average Response
+                (mean head travel before a request is served), and the
+                right/left split of requests and movement. Values are
+                numpy scalars for a scalar head, arrays otherwise.
+        """
+        data = self._evaluate(algorithm, startHead, diskSize)
+        if np.ndim(startHead) == 0:
+            return {key: value[()] for key, value in data.items()}
+        return data
+
+    def movement(self, algorithm, heads, diskSize=200):
+        """Total head movement for each head (vectorized)."""
+        return self._evaluate(algorithm, heads, diskSize)["head Movement"]
+
+    def result(self, algorithm, startHead, diskSize=200):
+        """Metrics-only SimulationResult, as from vector_engine with keepOrder=False."""
+        headMovement = int(self.movement(algorithm, int(startHead), diskSize))
+        return SimulationResult(None, headMovement, self.size)
+
+    def best_head(self, algorithm, heads=None, diskSize=200):
+        """
+        Start head with the least total movement.
+        Args:
+            heads (array-like): Candidate heads (defaults to every track).
+        Returns:
+            tuple: (head, head Movement).
+        """
+        heads = np.arange(diskSize) if heads is None else np.asarray(heads, dtype=np.int64)
+        if heads.size == 0:
+            raise ValueError("No candidate heads given.")
+        movement = self.movement(algorithm, heads, diskSize)
+        best = int(np.argmin(movement))
+        return int(heads[best]), int(movement[best])
+
+def main(argv=None):
+    import argparse
+
+    from trace_loader import load_trace
+
+    parser = argparse.ArgumentParser(description="Find the start head with the least head movement.")
+    parser.add_argument("trace", help="Request file (CSV, text, .gz or binary trace).")
+    parser.add_argument("--disk-size", type=int, default=200)
+    parser.add_argument("-a", "--algorithms", nargs="+", default=["SCAN", "C-SCAN", "LOOK", "C-LOOK"],
+                        choices=INDEXED_ALGORITHMS)
+    args = parser.parse_args(argv)
+    index = WorkloadIndex(load_trace(args.trace))
+    for algorithm in args.algorithms:
+        head, headMovement = index.best_head(algorithm, diskSize=args.disk_size)
+        print(f"{algorithm}: best start head {head} (head movement {headMovement})")
+
+if __name__ == "__main__":
+    main()
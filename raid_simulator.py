@@ -0,0 +1,225 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from scheduler_registry import get_algorithm
+from stats_module import SeekStats
+
+LEVELS = ("0", "1", "10", "5")
+
+class RaidLayout:
+    """
+    Maps logical block requests onto the devices of an array.
+    Logical blocks are grouped into stripe units of stripeSize blocks.
+    RAID 0 deals units round-robin over all devices; RAID 1 mirrors every
+    block on all devices; RAID 10 stripes over mirrored pairs; RAID 5
+    stripes over devices - 1 data units per row with left-asymmetric
+    rotating parity. Reads touch one copy (mirrors alternate by request);
+    writes touch every copy, and a RAID 5 write is a read-modify-write of
+    the data and parity units (two accesses on each of the two devices).
+    Args:
+        level (str): "0", "1", "10" or "5".
+        devices (int): Number of devices.
+        stripeSize (int): Blocks per stripe unit.
+    """
+
+    def __init__(self, level, devices, stripeSize=1):
+        level = str(level)
+        if level not in LEVELS:
+            raise ValueError(f"Unsupported RAID level {level}. Available: {', '.join(LEVELS)}")
+        minimum = {"0": 1, "1": 2, "10": 4, "5": 3}[level]
+        if devices < minimum:
+            raise ValueError(f"RAID {level} needs at least {minimum} devices.")
+        if level == "10" and devices % 2:
+            raise ValueError("RAID 10 needs an even number of devices.")
+        if stripeSize < 1:
+            raise ValueError("stripeSize must be at least 1.")
+        self.level = level
+        self.devices = devices
+        self.stripeSize = stripeSize
+
+    def __repr__(self):
+        return f"RaidLayout(level={self.level!r}, devices={self.devices}, stripeSize={self.stripeSize})"
+
+    def map(self, reqs, isWrite=None):
+        """
+        Translate logical requests into device accesses.
+        Args:
+            reqs (array-like): Logical block numbers, in arrival order.
+            isWrite (array-like): Optional per-request write flags (default: all reads).
+        Returns:
+            tuple: (device, track, seq) int64 arrays, one entry per device
+                access; seq is the index of the logical request.
+        """
+        reqs = np.asarray(reqs, dtype=np.int64).ravel()
+        seq = np.arange(reqs.size, dtype=np.int64)
+        writes = np.zeros(reqs.size, dtype=bool) if isWrite is None else np.asarray(isWrite, dtype=bool).ravel()
+        if writes.size != reqs.size:
+            raise ValueError("isWrite must have one flag per request.")
+        unit, offset = np.divmod(reqs, self.stripeSize)
+        n = self.devices
+
+        if self.level == "0":
+            device, row = unit % n, unit // n
+            return device, row * self.stripeSize + offset, seq
+
+        if self.level == "1":
+            track = reqs
+            readDevice = seq % n
+            copies = [(np.where(writes, member, readDevice), np.ones(reqs.size, dtype=bool) if member == 0 else writes)
+                      for member in range(n)]
+            return self._gather(copies, track, seq)
+
+        if self.level == "10":
+            pairs = n // 2
+            pair, row = unit % pairs, unit // pairs
+            track = row * self.stripeSize + offset
+            readMember = seq % 2
+            copies = [(2 * pair + np.where(writes, 0, readMember), np.ones(reqs.size, dtype=bool)),
+                      (2 * pair + 1, writes)]
+            return self._gather(copies, track, seq)
+
+        # RAID 5: n - 1 data units per row, parity rotates from the last device down
+        row, dataIndex = np.divmod(unit, n - 1)
+        parity = (n - 1) - row % n
+        data = dataIndex + (dataIndex >= parity)
+        track = row * self.stripeSize + offset
+        copies = [(data, np.ones(reqs.size, dtype=bool)), (data, writes), (parity, writes), (parity, writes)]
+        return self._gather(copies, track, seq)
+
+    @staticmethod
+    def _gather(copies, track, seq):
+        device = np.concatenate([np.broadcast_to(d, track.shape)[mask] for d, mask in copies])
+        tracks = np.concatenate([track[mask] for _, mask in copies])
+        seqs = np.concatenate([seq[mask] for _, mask in copies])
+        return device.astype(np.int64), tracks, seqs
+
+    def split(self, reqs, isWrite=None):
+        """Per-device track arrays, each in logical arrival order."""
+        device, track, seq = self.map(reqs, isWrite)
+        order = np.lexsort((seq, device))
+        counts = np.bincount(device, minlength=self.devices)
+        return np.split(track[order], np.cumsum(counts)[:-1])
+
+def _run_device(task):
+    """
+    Schedule one device's queue (runs in a worker process).
+    A device without requests stays idle: no movement, no time, no seeks.
+    "time" is in ms with a drive model and in tracks without.
+    Returns:
+        tuple: (metrics dict, the device's SeekStats or None).
+    """
+    index, tracks, algorithm, startHead, deviceSize, driveModel = task
+    if not tracks.size:
+        seekStats = SeekStats(deviceSize - 1)
+        return {"device": index, "requests": 0, "head Movement": 0, "average Seek": 0.0, "throughput": 0.0,
+                "time": 0.0, "seek Stats": seekStats.summary()}, seekStats
+    spec = get_algorithm(algorithm)
+    result = spec.run(tracks, startHead, deviceSize, keepOrder=driveModel is not None)
+    row = {
+        "device": index,
+        "requests": int(tracks.size),
+        "head Movement": result.headMovement,
+        "average Seek": float(result.averageSeek),
+        "throughput": float(result.throughput),
+        "time": float(result.headMovement)
+    }
+    if driveModel is not None:
+        from drive_model import preset
+
+        timing = preset(driveModel, deviceSize).evaluate(startHead, result.order, tracks.size)
+        row.update({"average Seek": timing["average Seek"], "throughput": timing["throughput"],
+                    "time": timing["total Time"]})
+    if result.seekStats is not None:
+        row["seek Stats"] = result.seekStats.summary()
+    return row, result.seekStats
+
+def simulate_array(reqs, layout, algorithm="SCAN", startHead=0, deviceSize=None, isWrite=None,
+                   workers=None, driveModel=None):
+    """
+    Simulate an array: map requests to devices and schedule every device's queue in parallel.
+    Devices work independently, so the array finishes when its slowest device does.
+    Args:
+        reqs (array-like): Logical block numbers, in arrival order.
+        layout (RaidLayout): Array layout.
+        algorithm (str): Registered scheduling algorithm used by every device.
+        startHead (int): Initial head pos of every device.
+        deviceSize (int): Tracks per device (default: just enough for the mapped tracks).
+        isWrite (array-like): Optional per-request write flags.
+        workers (int): Worker processes (defaults to all cores; 0 runs in this process).
+        driveModel (str): Optional drive_model preset; times are then ms and throughput IOPS.
+    Returns:
+        dict: "devices" (one metrics dict per device) and "array" (totals,
+            completion time of the slowest device, logical throughput, imbalance
+            and, when the engine walked the paths, the merged seek Stats).
+    """
+    reqs = np.asarray(reqs, dtype=np.int64).ravel()
+    perDevice = layout.split(reqs, isWrite)
+    if deviceSize is None:
+        deviceSize = max([startHead + 1] + [int(t.max()) + 1 for t in perDevice if t.size])
+    tasks = [(i, tracks, algorithm, startHead, deviceSize, driveModel) for i, tracks in enumerate(perDevice)]
+
+    if workers == 0 or len(tasks) == 1:
+        outcomes = [_run_device(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or min(len(tasks), os.cpu_count() or 1)) as pool:
+            outcomes = list(pool.map(_run_device, tasks))
+    devices = [row for row, _ in outcomes]
+    # Array totals only count devices that served requests
+    seekStats = None
+    for row, stats in outcomes:
+        if row["requests"] and stats is not None:
+            seekStats = stats if seekStats is None else seekStats.merge(stats)
+
+    times = np.array([d["time"] for d in devices])
+    makespan = float(times.max()) if times.size else 0.0
+    meanTime = float(times.mean()) if times.size else 0.0
+    # Track units, as in algorithm_engine, or ms -> IOPS with a drive model
+    seconds = makespan / 1000.0 if driveModel is not None else makespan
+    report = {
+        "devices": devices,
+        "array": {
+            "level": layout.level,
+            "devices": layout.devices,
+            "stripeSize": layout.stripeSize,
+            "deviceSize": deviceSize,
+            "requests": int(reqs.size),
+            "device Requests": int(sum(d["requests"] for d in devices)),
+            "head Movement": int(sum(d["head Movement"] for d in devices if d["requests"])),
+            "completion Time": makespan,
+            "time Unit": "ms" if driveModel is not None else "tracks",
+            "slowest Device": int(times.argmax()) if times.size else None,
+            "throughput": reqs.size / seconds if seconds else 0,
+            "imbalance": makespan / meanTime if meanTime else 0
+        }
+    }
+    if seekStats is not None:
+        report["array"]["seek Stats"] = seekStats.summary()
+    return report
+
+def main(argv=None):
+    import argparse
+    import json
+
+    from trace_loader import load_trace
+
+    parser = argparse.ArgumentParser(description="Simulate a RAID array with one scheduler queue per device.")
+    parser.add_argument("trace", help="Logical block requests (CSV, text, .gz or binary trace).")
+    parser.add_argument("--level", choices=LEVELS, default="0")
+    parser.add_argument("--devices", type=int, required=True)
+    parser.add_argument("--stripe-size", type=int, default=1, help="Blocks per stripe unit.")
+    parser.add_argument("-a", "--algorithm", default="SCAN")
+    parser.add_argument("--head", type=int, default=0, help="Initial head position of every device.")
+    parser.add_argument("--device-size", type=int, default=None)
+    parser.add_argument("--drive-model", metavar="PRESET", default=None)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 = serial).")
+    args = parser.parse_args(argv)
+
+    layout = RaidLayout(args.level, args.devices, args.stripe_size)
+    report = simulate_array(load_trace(args.trace), layout, args.algorithm, args.head,
+                            args.device_size, workers=args.workers, driveModel=args.drive_model)
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+import io
+import os
+
+import numpy as np
+from matplotlib.animation import AbstractMovieWriter, FFMpegWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+from instrumentation import timer
+from visualization_module import COLORS, lttb, movement_path, show_combined_disk_movement
+
+# Figures are built on FigureCanvasAgg directly, never through pyplot, so
+# rendering needs no display and leaves the GUI's TkAgg backend alone.
+BACKGROUND = '#1a1a1a'
+GIF_MAX_FRAMES = 200  # GIF frames are held (palettized) until the file is written
+VIDEO_EXTENSIONS = (".mp4", ".mkv", ".webm", ".avi", ".mov")
+
+def new_figure(width=12, height=7, dpi=100):
+    """A headless Agg figure with one dark axes."""
+    fig = Figure(figsize=(width, height), dpi=dpi, facecolor=BACKGROUND)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    return fig, ax
+
+def _style_axes(ax, title):
+    ax.set_facecolor(BACKGROUND)
+    ax.set_title(title, color='white', fontsize=14, fontweight='bold', pad=15)
+    ax.set_xlabel('Request Servicing Step', color='white', fontsize=11)
+    ax.set_ylabel('Track Number', color='white', fontsize=11)
+    ax.grid(True, linestyle=':', linewidth=0.5, color='gray', alpha=0.3)
+    ax.tick_params(axis='x', colors='white')
+    ax.tick_params(axis='y', colors='white')
+    for spine in ax.spines.values():
+        spine.set_color('#444444')
+
+def draw_comparison(ax, results, startHead, diskSize=200, title='Disk Head Movement Comparison'):
+    """
+    Draw every algorithm's full path on ax as one LineCollection.
+    Paths are LTTB-decimated to about two points per horizontal pixel, so
+    drawing time does not grow with the trace length.
+    Args:
+        results (dict): Algorithm name -> result with an "order".
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num (sets the y range).
+    Returns:
+        LineCollection: The drawn paths.
+    """
+    budget = max(500, int(2 * ax.get_window_extent().width))
+    segments, colors, handles = [], [], []
+    maxSteps, yMax = 1, diskSize - 1
+    for i, (name, result) in enumerate(results.items()):
+        path = movement_path(startHead, result.get("order"))
+        if path.size <= 1:
+            continue
+        steps = np.arange(path.size, dtype=np.float64)
+        kept = lttb(steps, path, budget)
+        segments.append(np.column_stack((steps[kept], path[kept])))
+        color = COLORS[i % len(COLORS)]
+        colors.append(color)
+        label = f"{name} (movement {int(result['head Movement'])}, avg seek {float(result['average Seek']):.2f})"
+        handles.append(Line2D([], [], color=color, linewidth=1.5, label=label))
+        maxSteps = max(maxSteps, path.size)
+        yMax = max(yMax, int(path.max()))
+
+    collection = LineCollection(segments, colors=colors, linewidths=1.2)
+    ax.add_collection(collection)
+    ax.set_xlim(-0.5, maxSteps - 0.5)
+    ax.set_ylim(0, yMax + max(5, yMax * 0.1))
+    _style_axes(ax, title)
+    if handles:
+        ax.legend(handles=handles, facecolor='#333333', edgecolor='gray',
+                  fontsize=9, labelcolor='white', framealpha=0.8)
+    return collection
+
+def render_comparison(results, startHead, outPath, diskSize=200, title='Disk Head Movement Comparison',
+                      width=12, height=7, dpi=100):
+    """
+    Write a static comparison plot; the format follows the extension (.png, .svg, .pdf).
+    Returns:
+        str: outPath.
+    """
+    with timer("plot.render"):
+        fig, ax = new_figure(width, height, dpi)
+        draw_comparison(ax, results, startHead, diskSize, title)
+        fig.tight_layout(pad=1.5)
+        fig.savefig(outPath, facecolor=fig.get_facecolor())
+    return outPath
+
+class PNGFrameWriter(AbstractMovieWriter):
+    """
+    Writes each animation frame to its own PNG as it is drawn.
+    outfile is a pattern with one integer field, e.g. "frames/step_%05d.png".
+    """
+
+    def setup(self, fig, outfile, dpi=None):
+        directory = os.path.dirname(outfile)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        super().setup(fig, outfile, dpi)
+        self._index = 0
+
+    def grab_frame(self, **savefig_kwargs):
+        self.fig.savefig(self.outfile % self._index, format='png', dpi=self.dpi, **savefig_kwargs)
+        self._index += 1
+
+    def finish(self):
+        pass
+
+class GIFWriter(AbstractMovieWriter):
+    """
+    Encodes a GIF with Pillow without ffmpeg.
+    Frames are reduced to a 64-colour palette as they arrive (1 byte per
+    pixel), which keeps memory bounded for the GIF_MAX_FRAMES frames used.
+    """
+
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi)
+        self._frames = []
+
+    def grab_frame(self, **savefig_kwargs):
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        self.fig.savefig(buffer, format='rgba', dpi=self.dpi, **savefig_kwargs)
+        image = Image.frombuffer('RGBA', self.frame_size, buffer.getbuffer(), 'raw', 'RGBA', 0, 1)
+        self._frames.append(image.convert('RGB').quantize(64))
+
+    def finish(self):
+        if self._frames:
+            self._frames[0].save(self.outfile, save_all=True, append_images=self._frames[1:],
+                                 duration=int(1000 / self.fps), loop=0)
+        self._frames = []
+
+def _writer_for(outPath, fps):
+    """Pick a streaming writer from the output name."""
+    if '%' in outPath:
+        return PNGFrameWriter(fps=fps), None
+    extension = os.path.splitext(outPath)[1].lower()
+    if extension == ".gif":
+        if FFMpegWriter.isAvailable():
+            return FFMpegWriter(fps=fps), None
+        return GIFWriter(fps=fps), GIF_MAX_FRAMES
+    if extension in VIDEO_EXTENSIONS:
+        if not FFMpegWriter.isAvailable():
+            raise RuntimeError(f"Writing {extension} needs ffmpeg on the PATH; use .gif or a PNG pattern instead.")
+        return FFMpegWriter(fps=fps, bitrate=2000), None
+    raise ValueError(f"Unsupported animation output: {outPath} (use .mp4, .gif or a pattern like frame_%05d.png)")
+
+def render_animation(results, startHead, outPath, diskSize=200, fps=40, maxFrames=None,
+                     width=12, height=7, dpi=100, progress=None):
+    """
+    Encode the GUI's head-movement animation without a display.
+    Frames are drawn one at a time and streamed to the writer: ffmpeg for
+    video (and GIF when available), Pillow for GIF otherwise, or one PNG per
+    frame when outPath contains a %d-style field.
+    Args:
+        results (dict): Algorithm name -> result with an "order".
+        startHead (int): Initial head pos.
+        outPath (str): .mp4/.mkv/.webm/.avi/.mov, .gif, or a PNG pattern.
+        diskSize (int): Max disk track num.
+        fps (int): Frames per second of the output.
+        maxFrames (int): Frame cap (defaults to the GUI's, or GIF_MAX_FRAMES for Pillow GIFs).
+        progress (callable): Optional callback(frame, totalFrames).
+    Returns:
+        str: outPath.
+    """
+    writer, writerCap = _writer_for(outPath, fps)
+    if maxFrames is None:
+        maxFrames = writerCap
+    fig, ax = new_figure(width, height, dpi)
+    kwargs = {} if maxFrames is None else {"max_frames": maxFrames}
+    ani = show_combined_disk_movement(results, startHead, ax, diskSize, **kwargs)
+    fig.tight_layout(pad=1.5)
+    callback = (lambda frame, total: progress(frame + 1, total)) if progress else None
+    with timer("plot.encode"):
+        ani.save(outPath, writer=writer, dpi=dpi, progress_callback=callback,
+                 savefig_kwargs={"facecolor": BACKGROUND})
+    return outPath
+
+def render_trace(path, head, outDir, diskSize=200, algorithms=None, animationFormat=None):
+    """
+    Render one trace file: a comparison PNG and, optionally, an animation.
+    Outputs are named after the trace, e.g. outDir/trace1.png and outDir/trace1.mp4.
+    Returns:
+        list: Paths written.
+    """
+    from scheduler_registry import available_algorithms, get_algorithm
+    from trace_loader import load_trace
+
+    reqs = load_trace(path)
+    algorithms = algorithms or available_algorithms()
+    results = {name: get_algorithm(name).run(reqs, head, diskSize) for name in algorithms}
+    stem = os.path.basename(path).split('.')[0]
+    os.makedirs(outDir, exist_ok=True)
+    written = [render_comparison(results, head, os.path.join(outDir, stem + ".png"), diskSize,
+                                 title=f"Disk Head Movement: {stem}")]
+    if animationFormat:
+        written.append(render_animation(results, head, os.path.join(outDir, f"{stem}.{animationFormat}"), diskSize))
+    return written
+
+def main(argv=None):
+    import argparse
+    from concurrent.futures import ProcessPoolExecutor
+
+    parser = argparse.ArgumentParser(description="Render head-movement plots for many traces without a display.")
+    parser.add_argument("traces", nargs="+", help="Request files (CSV, text, .gz or binary trace).")
+    parser.add_argument("--head", type=int, required=True, help="Initial head position.")
+    parser.add_argument("--disk-size", type=int, default=200)
+    parser.add_argument("-a", "--algorithms", nargs="+", default=None, help="Algorithms (default: all registered).")
+    parser.add_argument("--out-dir", required=True, help="Directory for the rendered files.")
+    parser.add_argument("--animate", choices=["mp4", "gif"], default=None, help="Also encode an animation per trace.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    args = parser.parse_args(argv)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(render_trace, trace, args.head, args.out_dir, args.disk_size,
+                               args.algorithms, args.animate) for trace in args.traces]
+        for future in futures:
+            for written in future.result():
+                print(written)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from instrumentation import count, timer
+from result_module import SimulationResult
+from stats_module import SeekStats
+
+_BLOCK = 1 << 20
+# Rough per-entry overhead of a cached SimulationResult besides its order
+_ENTRY_BYTES = 256
+# Part of every key; bump it whenever an engine's output changes, so stale
+# on-disk entries are no longer found
+ENGINE_VERSION = 2
+
+def fingerprint(reqs):
+    """
+    Fast content hash of a request buffer.
+    Tracks are hashed as little-endian int64 in blocks, so the same requests
+    give the same fingerprint whether they came from a list, an int32 memmap
+    or an int64 array.
+    Returns:
+        str: 32-character hex digest.
+    """
+    reqs = np.asarray(reqs).ravel()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(reqs.size).encode())
+    with timer("cache.fingerprint"):
+        for i in range(0, reqs.size, _BLOCK):
+            digest.update(reqs[i:i + _BLOCK].astype("<i8", copy=False).tobytes())
+    return digest.hexdigest()
+
+def _copy(result, order):
+    seekStats = None if result.seekStats is None else SeekStats.from_dict(result.seekStats.to_dict())
+    copy = SimulationResult(order, result.headMovement, result.requests, seekStats)
+    copy.averageSeek = result.averageSeek
+    copy.throughput = result.throughput
+    return copy
+
+class ResultCache:
+    """
+    Memoize scheduling runs by workload fingerprint and parameters.
+    Entries live in a byte-bounded in-process LRU. With cacheDir set they are
+    also written there as .npz files (atomically, via os.replace), so several
+    processes can share one directory. Cached results are handed out as
+    copies with a read-only order, so callers can adjust metrics (e.g. with
+    drive_model.apply_drive_model) without touching the cache.
+    Args:
+        maxBytes (int): Memory budget for cached orders.
+        cacheDir (str): Optional shared on-disk cache directory.
+    """
+
+    def __init__(self, maxBytes=256 << 20, cacheDir=None):
+        self.maxBytes = maxBytes
+        self.cacheDir = cacheDir
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        if cacheDir:
+            os.makedirs(cacheDir, exist_ok=True)
+
+    @staticmethod
+    def make_key(fingerprintHex, algorithm, startHead, diskSize, params=None):
+        """Cache key for one run; params must be JSON-serializable."""
+        extra = json.dumps(params or {}, sort_keys=True)
+        return f"v{ENGINE_VERSION}:{fingerprintHex}:{algorithm.upper()}:{int(startHead)}:{int(diskSize)}:{extra}"
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _size(result):
+        return _ENTRY_BYTES + (result.order.nbytes if result.order is not None else 0)
+
+    def _path(self, key):
+        name = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cacheDir, name + ".npz")
+
+    def get(self, key, needOrder=True):
+        """
+        Return a cached result or None.
+        A run cached with its order also answers metrics-only lookups.
+        """
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        elif self.cacheDir:
+            result = self._load(key)
+            if result is not None:
+                self._remember(key, result)
+        if result is None or (needOrder and result.order is None):
+            self.misses += 1
+            count("cache.misses")
+            return None
+        self.hits += 1
+        count("cache.hits")
+        return _copy(result, None if not needOrder or result.order is None else result.order.view())
+
+    def put(self, key, result):
+        """
+        Store a result (a metrics-only result never replaces one with an order).
+        A writable order is copied first, so the caller can go on changing its
+        own result (or the requests it may share memory with) without
+        touching the cache.
+        """
+        existing = self._entries.get(key)
+        if existing is not None and existing.order is not None and result.order is None:
+            return
+        order = None
+        if result.order is not None:
+            order = result.order.copy() if result.order.flags.writeable else result.order.view()
+            order.flags.writeable = False
+        stored = _copy(result, order)
+        self._remember(key, stored)
+        if self.cacheDir:
+            self._save(key, stored)
+
+    def _remember(self, key, result):
+        if key in self._entries:
+            self._bytes -= self._size(self._entries.pop(key))
+        size = self._size(result)
+        if size > self.maxBytes:
+            return
+        self._entries[key] = result
+        self._bytes += size
+        while self._bytes > self.maxBytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= self._size(evicted)
+
+    def _save(self, key, result):
+        hasOrder = result.order is not None
+        fd, tmpPath = tempfile.mkstemp(dir=self.cacheDir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                np.savez(file,
+                         key=np.array(key),
+                         ints=np.array([result.headMovement, result.requests, hasOrder], dtype=np.int64),
+                         floats=np.array([result.averageSeek, result.throughput], dtype=np.float64),
+                         seekStats=np.array(json.dumps(result.seekStats.to_dict()) if result.seekStats is not None else ""),
+                         order=result.order if hasOrder else np.empty(0, dtype=np.int32))
+            os.replace(tmpPath, self._path(key))
+        except OSError:
+            # A cache that cannot be written is just a slower cache
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+
+    def _load(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["key"]) != key:
+                    return None
+                headMovement, requests, hasOrder = (int(v) for v in data["ints"])
+                order = data["order"] if hasOrder else None
+                result = SimulationResult(order, headMovement, requests)
+                result.averageSeek, result.throughput = (float(v) for v in data["floats"])
+                # Entries written before seek statistics existed simply lack them
+                if "seekStats" in data.files and str(data["seekStats"]):
+                    result.seekStats = SeekStats.from_dict(json.loads(str(data["seekStats"])))
+        except (OSError, ValueError, KeyError):
+            return None  # Truncated or foreign file; recompute
+        if result.order is not None:
+            result.order.flags.writeable = False
+        return result
+
+    def run(self, spec, reqs, startHead, diskSize=200, keepOrder=True, fingerprintHex=None, **params):
+        """
+        Run a registered algorithm through the cache.
+        Args:
+            spec (AlgorithmSpec): From scheduler_registry.get_algorithm.
+            reqs (array-like): Disk reqs.
+            startHead (int): Initial head pos.
+            diskSize (int): Max disk track num.
+            keepOrder (bool): False for metrics only.
+            fingerprintHex (str): Precomputed fingerprint(reqs), to skip rehashing.
+            **params: Extra algorithm parameters (part of the key).
+        Returns:
+            SimulationResult: Cached or freshly computed.
+        """
+        fingerprintHex = fingerprintHex or fingerprint(reqs)
+        key = self.make_key(fingerprintHex, spec.name, startHead, diskSize, params)
+        result = self.get(key, needOrder=keepOrder)
+        if result is None:
+            result = spec.run(reqs, startHead, diskSize, keepOrder=keepOrder, **params)
+            self.put(key, result)
+        return result
+
+    def clear(self):
+        """Drop the in-process entries (the on-disk directory is left alone)."""
+        self._entries.clear()
+        self._bytes = 0
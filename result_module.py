@@ -0,0 +1,70 @@
+import numpy as np
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+def compact_order(order):
+    """Store a service order as int32 when it fits, else int64."""
+    order = np.asarray(order)
+    if order.size and (order.min() < 0 or order.max() > _INT32_MAX):
+        return order.astype(np.int64, copy=False)
+    return order.astype(np.int32, copy=False)
+
+class SimulationResult:
+    """
+    Compact result of one scheduling run.
+    order is an int32/int64 ndarray, or None in metrics-only mode. averageSeek
+    and throughput are in track units unless a drive model was applied. Reads
+    through result["head Movement"], result.get(...) and "order" in result
+    work like the result dicts returned by algorithm_engine. seekStats is a
+    stats_module.SeekStats with the seek-distance distribution, or None when
+    the engine never walked the path (e.g. prefix_index queries).
+    """
+
+    __slots__ = ("order", "headMovement", "averageSeek", "throughput", "requests", "timing", "seekStats")
+
+    _KEYS = {
+        "order": "order",
+        "head Movement": "headMovement",
+        "average Seek": "averageSeek",
+        "throughput": "throughput",
+        "timing": "timing",
+        "seek Stats": "seekStats"
+    }
+
+    def __init__(self, order, headMovement, requests, seekStats=None):
+        self.order = None if order is None else compact_order(order)
+        self.headMovement = int(headMovement)
+        self.requests = int(requests)
+        self.averageSeek = headMovement / requests if requests else 0
+        time = headMovement
+        self.throughput = requests / time if time else 0
+        self.timing = None  # Physical-time breakdown set by drive_model.apply_drive_model
+        self.seekStats = seekStats
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, self._KEYS[key])
+
+    def __contains__(self, key):
+        return key in self._KEYS and getattr(self, self._KEYS[key]) is not None
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        return [key for key in self._KEYS if key in self]
+
+    def to_dict(self, includeOrder=True):
+        """Plain dict in the algorithm_engine layout (order as a list, seek stats summarized)."""
+        data = {key: self[key] for key in self.keys() if key not in ("order", "seek Stats")}
+        if self.seekStats is not None:
+            data["seek Stats"] = self.seekStats.summary()
+        if includeOrder and self.order is not None:
+            data["order"] = self.order.tolist()
+        return data
+
+    def __repr__(self):
+        size = "None" if self.order is None else f"<{self.order.size} x {self.order.dtype}>"
+        return (f"SimulationResult(order={size}, headMovement={self.headMovement}, "
+                f"averageSeek={self.averageSeek:.4f}, throughput={self.throughput:.6f})")
@@ -0,0 +1,154 @@
+from importlib import import_module
+
+from instrumentation import timer
+from stats_module import SeekStats
+
+class AlgorithmSpec:
+    """
+    Description of one registered scheduling algorithm.
+    Functions are given as "module:attribute" strings and imported on first
+    use, so listing algorithms never pulls in numpy.
+    Args:
+        name (str): Display name, e.g. "C-SCAN".
+        func (str or callable): Vectorized engine, called as
+            func(reqs, startHead, diskSize, keepOrder=..., **params).
+        reference (str or callable): Optional pure-Python engine taking plain
+            lists, called as reference(reqs, startHead[, diskSize]).
+        usesDiskSize (bool): Whether the reference takes diskSize.
+        streaming (bool): Can be computed chunk by chunk without the full request set.
+        policy (str or class): Optional event_engine queue policy for arrival-time runs.
+        incremental (str or class): Optional incremental_engine scheduler for
+            feeding requests in batches.
+        circular (bool): Schedule wraps from the high end back to the low end.
+        description (str): One-line summary.
+    """
+
+    def __init__(self, name, func, reference=None, usesDiskSize=True, streaming=False,
+                 policy=None, circular=False, description="", incremental=None):
+        self.name = name
+        self._func = func
+        self._reference = reference
+        self.usesDiskSize = usesDiskSize
+        self.streaming = streaming
+        self._policy = policy
+        self._incremental = incremental
+        self.circular = circular
+        self.description = description
+
+    @staticmethod
+    def _resolve(target):
+        if isinstance(target, str):
+            moduleName, attr = target.split(":")
+            return getattr(import_module(moduleName), attr)
+        return target
+
+    @property
+    def func(self):
+        return self._resolve(self._func)
+
+    @property
+    def supportsArrivals(self):
+        return self._policy is not None
+
+    @property
+    def supportsIncremental(self):
+        return self._incremental is not None
+
+    @property
+    def hasReference(self):
+        return self._reference is not None
+
+    @property
+    def policy(self):
+        """event_engine policy class, or None if arrival times are unsupported."""
+        return self._resolve(self._policy) if self._policy is not None else None
+
+    def incremental(self, startHead, diskSize=200):
+        """New incremental_engine scheduler for this algorithm."""
+        if self._incremental is None:
+            raise ValueError(f"{self.name} has no incremental scheduler.")
+        return self._resolve(self._incremental)(startHead, diskSize)
+
+    def run(self, reqs, startHead, diskSize=200, keepOrder=True, **params):
+        """Run the vectorized engine; returns a SimulationResult."""
+        with timer("schedule." + self.name):
+            return self.func(reqs, startHead, diskSize, keepOrder=keepOrder, **params)
+
+    def run_reference(self, reqs, startHead, diskSize=200):
+        """
+        Run on a plain list, preferring the pure-Python engine (no numpy import).
+        Returns:
+            dict: The algorithm_engine result layout, plus the "seek Stats"
+                summary of SimulationResult.to_dict.
+        """
+        if self._reference is None:
+            return self.run(reqs, startHead, diskSize).to_dict()
+        reference = self._resolve(self._reference)
+        with timer("schedule." + self.name):
+            if self.usesDiskSize:
+                result = reference(reqs, startHead, diskSize)
+            else:
+                result = reference(reqs, startHead)
+            seekStats = SeekStats(max(diskSize - 1, 0))
+            seekStats.add_path(startHead, result["order"])
+        result["seek Stats"] = seekStats.summary()
+        return result
+
+    def __repr__(self):
+        return f"AlgorithmSpec({self.name!r})"
+
+_registry = {}
+
+def register_algorithm(spec):
+    """Add (or replace) an algorithm; returns the spec."""
+    _registry[spec.name] = spec
+    return spec
+
+def get_algorithm(name):
+    """Look up a registered algorithm by name (case-insensitive)."""
+    for key, spec in _registry.items():
+        if key.upper() == name.upper():
+            return spec
+    raise KeyError(f"Unknown algorithm: {name}. Available: {', '.join(_registry)}")
+
+def available_algorithms(streaming=None, arrivals=None, incremental=None):
+    """Names of registered algorithms, optionally filtered by capability."""
+    return [
+        name for name, spec in _registry.items()
+        if (streaming is None or spec.streaming == streaming)
+        and (arrivals is None or spec.supportsArrivals == arrivals)
+        and (incremental is None or spec.supportsIncremental == incremental)
+    ]
+
+register_algorithm(AlgorithmSpec(
+    "FCFS", "vector_engine:fcfs", "algorithm_engine:fcfs", usesDiskSize=False,
+    streaming=True, policy="event_engine:FCFSPolicy", incremental="incremental_engine:IncrementalFCFS",
+    description="First-come, first-served."))
+register_algorithm(AlgorithmSpec(
+    "SSTF", "vector_engine:sstf", "algorithm_engine:sstf_fast", usesDiskSize=False,
+    policy="event_engine:SSTFPolicy",
+    description="Shortest seek time first."))
+register_algorithm(AlgorithmSpec(
+    "SCAN", "vector_engine:scan", "algorithm_engine:scan",
+    policy="event_engine:SCANPolicy", incremental="incremental_engine:IncrementalSCAN",
+    description="Elevator: sweep to the disk end, then back."))
+register_algorithm(AlgorithmSpec(
+    "C-SCAN", "vector_engine:c_scan", "algorithm_engine:c_scan",
+    policy="event_engine:CSCANPolicy", circular=True, incremental="incremental_engine:IncrementalCSCAN",
+    description="Sweep to the disk end, jump to track 0, sweep again."))
+register_algorithm(AlgorithmSpec(
+    "LOOK", "vector_engine:look",
+    policy="event_engine:LOOKPolicy", incremental="incremental_engine:IncrementalLOOK",
+    description="Elevator that turns at the last request."))
+register_algorithm(AlgorithmSpec(
+    "C-LOOK", "vector_engine:c_look",
+    policy="event_engine:CLOOKPolicy", circular=True, incremental="incremental_engine:IncrementalCLOOK",
+    description="Sweep to the last request, jump to the lowest one."))
+register_algorithm(AlgorithmSpec(
+    "N-STEP-SCAN", "vector_engine:nstep_scan",
+    policy="event_engine:NStepSCANPolicy",
+    description="Elevator passes over fixed-size batches of arrivals."))
+register_algorithm(AlgorithmSpec(
+    "FSCAN", "vector_engine:fscan",
+    policy="event_engine:FSCANPolicy",
+    description="SCAN over a frozen queue; arrivals wait for the next sweep."))
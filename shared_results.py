@@ -0,0 +1,196 @@
+import ctypes
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from result_module import SimulationResult, compact_order
+from scheduler_registry import get_algorithm
+
+# Worker results travel as shared-memory segment names instead of pickled
+# arrays. The parent unlinks each segment as soon as it attaches, so the
+# memory is returned to the OS exactly when the last view of it is dropped,
+# and nothing is left behind in /dev/shm. Windows destroys a segment when
+# its creator closes it, before the parent could attach, so there results
+# are pickled as before.
+TRANSPORT_SUPPORTED = os.name == "posix"
+_BLOCK = 1 << 20
+
+class SharedResult(SimulationResult):
+    """
+    SimulationResult whose order (and per-request seeks) are read-only views
+    of shared memory. seeks[i] is the head movement to serve order[i]; the
+    seek statistics travel pickled, being small.
+    """
+
+    __slots__ = ("seeks",)
+
+    def __init__(self, order, headMovement, requests, seeks=None, seekStats=None):
+        super().__init__(order, headMovement, requests, seekStats)
+        self.seeks = seeks
+
+class _Segment:
+    """
+    An attached segment exposed through __array_interface__. Arrays made
+    from it hold it as their base, so it closes itself once the last of
+    them is garbage-collected.
+    """
+
+    def __init__(self, shm, dtype, size):
+        self.shm = shm
+        self._anchor = ctypes.c_char.from_buffer(shm.buf)
+        self.__array_interface__ = {
+            "shape": (size,),
+            "typestr": np.dtype(dtype).str,
+            "data": (ctypes.addressof(self._anchor), True),
+            "version": 3
+        }
+
+    def __del__(self):
+        self._anchor = None  # Drop the buffer export first, or close() refuses
+        self.shm.close()
+
+def share_array(values):
+    """
+    Copy an array into a new shared segment.
+    Returns:
+        tuple: (SharedMemory, handle); the handle is a small picklable
+            (name, dtype, size) triple for attach_array(). The creator
+            closes the SharedMemory when done and unlinks it if nobody
+            attaches with unlink=True.
+    """
+    values = np.ascontiguousarray(values)
+    shm = SharedMemory(create=True, size=max(values.nbytes, 1))
+    target = np.ndarray(values.shape, values.dtype, buffer=shm.buf)
+    target[...] = values
+    del target
+    return shm, (shm.name, values.dtype.str, int(values.size))
+
+def attach_array(handle, unlink=True):
+    """
+    Zero-copy, read-only view of a shared array.
+    Args:
+        handle (tuple): From share_array(), or None for no array.
+        unlink (bool): Remove the segment's name at once; its memory is then
+            freed when the view (and every view derived from it) is gone.
+    Returns:
+        ndarray: The view, or None.
+    """
+    if handle is None:
+        return None
+    name, dtype, size = handle
+    shm = SharedMemory(name=name)
+    if unlink:
+        shm.unlink()
+    return np.asarray(_Segment(shm, dtype, size))
+
+def _seeks(startHead, order):
+    """Per-request head movement for order, computed in int64 blocks."""
+    seeks = np.empty(order.size, dtype=order.dtype)
+    previous = startHead
+    for i in range(0, order.size, _BLOCK):
+        block = order[i:i + _BLOCK].astype(np.int64)
+        seeks[i:i + _BLOCK] = np.abs(np.diff(block, prepend=previous))
+        previous = int(block[-1])
+    return seeks
+
+def _run_shared(task):
+    """Run one algorithm in a worker and leave its arrays in shared memory."""
+    inputHandle, algorithm, startHead, diskSize, withSeeks = task
+    reqs = attach_array(inputHandle, unlink=False)
+    result = get_algorithm(algorithm).run(reqs, startHead, diskSize)
+    del reqs
+    seeks = _seeks(startHead, result.order) if withSeeks else None
+    if not TRANSPORT_SUPPORTED:
+        return algorithm, result, seeks
+    handles = []
+    for values in (result.order, seeks):
+        handle = None
+        if values is not None:
+            shm, handle = share_array(values)
+            shm.close()  # The parent attaches by name and unlinks
+        handles.append(handle)
+    return algorithm, (handles[0], handles[1], result.headMovement, result.requests, result.seekStats), None
+
+def _attach_result(payload, seeks):
+    if not TRANSPORT_SUPPORTED:
+        return SharedResult(payload.order, payload.headMovement, payload.requests, seeks, payload.seekStats)
+    orderHandle, seeksHandle, headMovement, requests, seekStats = payload
+    return SharedResult(attach_array(orderHandle), headMovement, requests, attach_array(seeksHandle), seekStats)
+
+def _discard(payload):
+    """Free the segments of a result nobody will read."""
+    if TRANSPORT_SUPPORTED:
+        for handle in payload[:2]:
+            attach_array(handle)
+
+def iter_shared(reqs, startHead, diskSize=200, algorithms=None, withSeeks=True, pool=None, workers=None):
+    """
+    Run algorithms in worker processes, yielding results as they finish.
+    The requests are shared once with every worker; each worker writes its
+    order and per-request seeks into new segments, and the parent receives
+    read-only views of them without copying or unpickling the arrays.
+    Closing the generator early cancels the remaining work and frees its
+    segments.
+    Args:
+        reqs (array-like): Disk reqs.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num.
+        algorithms (list): Registered algorithm names (default: FCFS, SSTF, SCAN, C-SCAN).
+        withSeeks (bool): Also return per-request seek distances.
+        pool (Executor): Process pool to use (default: a new one with workers processes).
+    Yields:
+        tuple: (algorithm name, SharedResult).
+    """
+    algorithms = algorithms or ["FCFS", "SSTF", "SCAN", "C-SCAN"]
+    reqs = compact_order(np.asarray(reqs).ravel())
+    inputShm, inputHandle = share_array(reqs)
+    ownPool = pool is None
+    if ownPool:
+        pool = ProcessPoolExecutor(max_workers=workers or min(len(algorithms), os.cpu_count() or 1),
+                                   mp_context=get_context("spawn"))
+    futures = [pool.submit(_run_shared, (inputHandle, name, startHead, diskSize, withSeeks)) for name in algorithms]
+    pending = set(futures)
+    try:
+        for future in as_completed(futures):
+            pending.discard(future)
+            name, payload, seeks = future.result()
+            yield name, _attach_result(payload, seeks)
+    finally:
+        # Work not handed out is cancelled, or freed once its worker finishes
+        for future in pending:
+            if not future.cancel() and future.exception() is None:
+                _discard(future.result()[1])
+        if ownPool:
+            pool.shutdown()
+        inputShm.close()
+        inputShm.unlink()
+
+def run_shared(reqs, startHead, diskSize=200, algorithms=None, withSeeks=True, pool=None, workers=None):
+    """iter_shared() collected into a dict of algorithm name -> SharedResult."""
+    return dict(iter_shared(reqs, startHead, diskSize, algorithms, withSeeks, pool, workers))
+
+def main(argv=None):
+    import argparse
+    import json
+
+    from trace_loader import load_trace
+
+    parser = argparse.ArgumentParser(description="Compare algorithms on one trace in parallel, sharing results through shared memory.")
+    parser.add_argument("trace", help="Request file (CSV, text, .gz or binary trace).")
+    parser.add_argument("--head", type=int, required=True)
+    parser.add_argument("--disk-size", type=int, default=200)
+    parser.add_argument("-a", "--algorithms", nargs="+", default=None, help="Default: FCFS, SSTF, SCAN, C-SCAN.")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    rows = []
+    for name, result in iter_shared(load_trace(args.trace), args.head, args.disk_size, args.algorithms,
+                                    withSeeks=False, workers=args.workers):
+        rows.append({"algorithm": name, **result.to_dict(includeOrder=False)})
+    print(json.dumps(rows, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,429 @@
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import instrumentation
+from result_module import SimulationResult
+from scheduler_registry import available_algorithms, get_algorithm
+from stats_module import SeekStats
+
+# Protocol: one JSON object per line, in both directions.
+#   Job:     {"id": 1, "requests": [98, 183, ...], "head": 53, "diskSize": 200,
+#             "algorithms": ["SCAN", "LOOK"], "order": false}
+#   Binary:  the same header with "binary": nbytes and "dtype": "int32"|"int64"
+#            instead of "requests", followed by exactly nbytes of little-endian tracks.
+#   Command: {"id": 2, "command": "algorithms"} or {"command": "stats"}
+# Replies carry the job id: one line per algorithm as soon as it finishes
+# (result dict plus "id", "algorithm", "requests"), then {"id": ..., "done": true},
+# or {"id": ..., "error": "..."}. Jobs on one connection may be pipelined;
+# their replies interleave.
+
+DEFAULT_PORT = 8765
+HEAVY_REQUESTS = 1 << 17  # Jobs at least this large go to the process pool
+BATCH_WINDOW_MS = 2.0     # How long a small job waits for others to batch with
+MAX_BATCH = 512           # Jobs per batched run
+LINE_LIMIT = 64 << 20     # Longest JSON line accepted
+BATCHED_ALGORITHMS = ("FCFS", "SCAN", "C-SCAN", "LOOK", "C-LOOK")
+
+logger = logging.getLogger(__name__)
+
+def _warm():
+    """Import every engine up front (in the server and in each pool worker)."""
+    for name in available_algorithms():
+        get_algorithm(name).func
+
+def _run_job(reqs, head, diskSize, algorithm, keepOrder):
+    """Run one heavy job (in a pool worker)."""
+    return get_algorithm(algorithm).run(reqs, head, diskSize, keepOrder=keepOrder)
+
+def _batched_result(job, order, movement, size):
+    """SimulationResult for one batched job; the seek statistics are walked from its order, kept only if asked."""
+    seekStats = SeekStats(job[2] - 1)
+    seekStats.add_path(job[1], order)
+    return SimulationResult(order if job[3] else None, int(movement), int(size), seekStats)
+
+def run_batch(algorithm, jobs):
+    """
+    Run many small jobs of one algorithm together.
+    For BATCHED_ALGORITHMS all jobs are concatenated and ordered with a
+    single lexsort; head movement comes from each job's extremes, with no
+    per-job engine call. Other algorithms and jobs with tracks or heads
+    beyond the disk run one by one through the registry.
+    Args:
+        algorithm (str): Registered algorithm name.
+        jobs (list): (reqs int64 array, startHead, diskSize, keepOrder) tuples.
+    Returns:
+        list: One SimulationResult per job, same values as AlgorithmSpec.run.
+    """
+    spec = get_algorithm(algorithm)
+    results = [None] * len(jobs)
+    batched = []
+    for i, (reqs, head, diskSize, keepOrder) in enumerate(jobs):
+        fits = reqs.size and head < diskSize and int(reqs.max()) < diskSize
+        if spec.name in BATCHED_ALGORITHMS and fits:
+            batched.append(i)
+        else:
+            results[i] = spec.run(reqs, head, diskSize, keepOrder=keepOrder)
+    if not batched:
+        return results
+
+    instrumentation.count("service.batchedJobs", len(batched))
+    reqsList = [jobs[i][0] for i in batched]
+    sizes = np.array([reqs.size for reqs in reqsList], dtype=np.int64)
+    heads = np.array([jobs[i][1] for i in batched], dtype=np.int64)
+    ends = np.array([jobs[i][2] - 1 for i in batched], dtype=np.int64)
+    values = np.concatenate(reqsList).astype(np.int64, copy=False)
+    jobIds = np.repeat(np.arange(len(batched)), sizes)
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    starts, stops = offsets[:-1], offsets[1:]
+
+    if spec.name == "FCFS":
+        steps = np.abs(np.diff(values))
+        steps[stops[:-1] - 1] = 0  # No travel between the last request of one job and the next job
+        within = np.add.reduceat(np.append(steps, 0), starts)
+        movement = np.abs(values[starts] - heads) + within
+        for k, i in enumerate(batched):
+            results[i] = _batched_result(jobs[i], values[starts[k]:stops[k]], movement[k], sizes[k])
+        return results
+
+    # Each job's slice of the sorted array is its left requests, then its right ones
+    ordered = values[np.lexsort((values, jobIds))]
+    leftCounts = np.bincount(jobIds[values < heads[jobIds]], minlength=len(batched))
+    hasLeft = leftCounts > 0
+    lastRight = np.where(leftCounts < sizes, ordered[stops - 1], heads)
+    leftMin = np.where(hasLeft, ordered[starts], 0)
+    leftMax = np.where(hasLeft, ordered[np.maximum(starts + leftCounts - 1, 0)], 0)
+
+    movement = lastRight - heads
+    if spec.name == "SCAN":
+        movement += ends - lastRight + np.where(hasLeft, ends - leftMin, 0)
+    elif spec.name == "C-SCAN":
+        movement += ends - lastRight + ends + leftMax
+    elif spec.name == "LOOK":
+        movement += np.where(hasLeft, lastRight - leftMin, 0)
+    else:
+        movement += np.where(hasLeft, (lastRight - leftMin) + (leftMax - leftMin), 0)
+
+    for k, i in enumerate(batched):
+        segment = ordered[starts[k]:stops[k]]
+        left, right = segment[:leftCounts[k]], segment[leftCounts[k]:]
+        end = int(ends[k])
+        if spec.name == "SCAN":
+            stop = [end] if lastRight[k] != end else []
+            order = np.concatenate((right, np.array(stop, dtype=np.int64), left[::-1]))
+        elif spec.name == "C-SCAN":
+            wrap = [end, 0] if lastRight[k] != end else [0]
+            order = np.concatenate((right, np.array(wrap, dtype=np.int64), left))
+        elif spec.name == "LOOK":
+            order = np.concatenate((right, left[::-1]))
+        else:
+            order = np.concatenate((right, left))
+        results[i] = _batched_result(jobs[i], order, movement[k], sizes[k])
+    return results
+
+def _validate_job(header):
+    """
+    Check a job header before anything is dispatched.
+    Returns:
+        tuple: (head, diskSize, algorithm names).
+    Raises:
+        ValueError: With a message naming the missing or bad field, or the unknown algorithm.
+    """
+    for field in ("requests", "head"):
+        if field not in header:
+            raise ValueError(f"missing field '{field}'")
+    values = {}
+    for field, default in (("head", None), ("diskSize", 200)):
+        value = header.get(field, default)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value != int(value):
+            raise ValueError(f"field '{field}' must be an integer")
+        values[field] = int(value)
+    if values["head"] < 0 or values["diskSize"] <= 0:
+        raise ValueError("head must be non-negative and diskSize positive.")
+    names = header.get("algorithms") or available_algorithms()
+    if isinstance(names, str) or not isinstance(names, list):
+        raise ValueError("field 'algorithms' must be a list of algorithm names")
+    algorithms = []
+    for name in names:
+        try:
+            algorithms.append(get_algorithm(name).name)
+        except (KeyError, AttributeError, TypeError):
+            raise ValueError(f"unknown algorithm {name!r}; available: {', '.join(available_algorithms())}") from None
+    return values["head"], values["diskSize"], algorithms
+
+class _Job:
+    __slots__ = ("reqs", "head", "diskSize", "keepOrder")
+
+    def __init__(self, reqs, head, diskSize, keepOrder):
+        self.reqs = reqs
+        self.head = head
+        self.diskSize = diskSize
+        self.keepOrder = keepOrder
+
+class SimulationService:
+    """
+    Long-running local simulation server on asyncio.
+    Engines are imported once at start-up, so a query costs only the
+    scheduling itself. Small jobs wait up to batchWindowMs for other small
+    jobs of the same algorithm and run together through run_batch() on a
+    thread; jobs of heavyRequests or more go to a process pool. Every
+    algorithm's result is sent back as soon as it is ready.
+    Args:
+        workers (int): Pool processes for heavy jobs (defaults to all cores).
+        batchWindowMs (float): Batching delay for small jobs.
+        maxBatch (int): A batch runs at once when it reaches this many jobs.
+        heavyRequests (int): Size from which a job goes to the pool.
+    """
+
+    def __init__(self, workers=None, batchWindowMs=BATCH_WINDOW_MS, maxBatch=MAX_BATCH,
+                 heavyRequests=HEAVY_REQUESTS):
+        self.workers = workers
+        self.batchWindow = batchWindowMs / 1000.0
+        self.maxBatch = maxBatch
+        self.heavyRequests = heavyRequests
+        self.pool = None
+        self.server = None
+        self._pending = {}  # algorithm -> [(job, future)]
+        self._flushers = {}  # algorithm -> scheduled flush handle
+        self.stats = {"jobs": 0, "batches": 0, "batchedJobs": 0, "pooledJobs": 0, "errors": 0}
+
+    async def start(self, path=None, host="127.0.0.1", port=DEFAULT_PORT):
+        """Listen on the Unix socket path, or on host:port when path is None."""
+        _warm()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm)
+        if path is not None:
+            if os.path.exists(path):
+                os.remove(path)
+            self.server = await asyncio.start_unix_server(self._handle, path, limit=LINE_LIMIT)
+        else:
+            self.server = await asyncio.start_server(self._handle, host, port, limit=LINE_LIMIT)
+        logger.info("Listening on %s", path or f"{host}:{port}")
+        return self
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+        self.server = self.pool = None
+
+    # --- Connections ---
+
+    async def _handle(self, reader, writer):
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def send(message):
+            async with lock:
+                writer.write(json.dumps(message).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    header = json.loads(line)
+                    if not isinstance(header, dict):
+                        raise TypeError("each line must be a JSON object")
+                    if "binary" in header:
+                        dtype = np.dtype(header.get("dtype", "int64")).newbyteorder("<")
+                        if dtype.kind not in "iu":
+                            raise ValueError("Binary requests must be an integer dtype.")
+                        data = await reader.readexactly(int(header["binary"]))
+                        header["requests"] = np.frombuffer(data, dtype=dtype)
+                except (ValueError, TypeError) as e:
+                    self.stats["errors"] += 1
+                    await send({"id": None, "error": f"Bad request: {e}"})
+                    continue
+                task = asyncio.ensure_future(self._dispatch(header, send))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError) as e:
+            logger.debug("Connection dropped: %s", e)
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _dispatch(self, header, send):
+        jobId = header.get("id")
+        try:
+            command = header.get("command")
+            if command == "algorithms":
+                await send({"id": jobId, "algorithms": available_algorithms()})
+            elif command == "stats":
+                await send({"id": jobId, "stats": dict(self.stats)})
+            elif command is not None:
+                raise ValueError(f"Unknown command: {command}")
+            else:
+                await self._run(jobId, header, send)
+        except Exception as e:
+            self.stats["errors"] += 1
+            await send({"id": jobId, "error": str(e)})
+
+    async def _run(self, jobId, header, send):
+        head, diskSize, algorithms = _validate_job(header)
+        reqs = np.asarray(header["requests"])
+        if reqs.dtype.kind not in "iuf":
+            raise ValueError("field 'requests' must be a list of integers")
+        if reqs.dtype.kind == "f" and not np.all(np.isfinite(reqs) & (reqs == np.round(reqs))):
+            raise ValueError("Disk requests must be non-negative integers.")
+        if reqs.dtype.kind not in "iu":
+            reqs = reqs.astype(np.int64)
+        reqs = reqs.astype(np.int64, copy=False).ravel()
+        if reqs.size and reqs.min() < 0:
+            raise ValueError("Disk requests must be non-negative integers.")
+        job = _Job(reqs, head, diskSize, bool(header.get("order", False)))
+        self.stats["jobs"] += 1
+
+        loop = asyncio.get_running_loop()
+        if reqs.size >= self.heavyRequests:
+            self.stats["pooledJobs"] += 1
+            futures = [loop.run_in_executor(self.pool, _run_job, reqs, head, diskSize, name, job.keepOrder)
+                       for name in algorithms]
+        else:
+            futures = [self._enqueue(name, job) for name in algorithms]
+
+        async def named(name, future):
+            return name, await future
+
+        for finished in asyncio.as_completed([named(name, f) for name, f in zip(algorithms, futures)]):
+            name, result = await finished
+            message = result.to_dict(includeOrder=job.keepOrder)
+            message.update({"id": jobId, "algorithm": name, "requests": int(reqs.size)})
+            await send(message)
+        await send({"id": jobId, "done": True})
+
+    # --- Batching ---
+
+    def _enqueue(self, algorithm, job):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(algorithm, [])
+        pending.append((job, future))
+        if len(pending) >= self.maxBatch:
+            self._flush(algorithm)
+        elif algorithm not in self._flushers:
+            self._flushers[algorithm] = loop.call_later(self.batchWindow, self._flush, algorithm)
+        return future
+
+    def _flush(self, algorithm):
+        handle = self._flushers.pop(algorithm, None)
+        if handle is not None:
+            handle.cancel()
+        batch = self._pending.pop(algorithm, [])
+        if not batch:
+            return
+        self.stats["batches"] += 1
+        self.stats["batchedJobs"] += len(batch)
+        jobs = [(job.reqs, job.head, job.diskSize, job.keepOrder) for job, _ in batch]
+        work = asyncio.get_running_loop().run_in_executor(None, run_batch, algorithm, jobs)
+
+        def deliver(done):
+            error = done.exception()
+            for k, (_, future) in enumerate(batch):
+                if future.cancelled():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(done.result()[k])
+
+        work.add_done_callback(deliver)
+
+def query(reqs, head, diskSize=200, algorithms=None, order=False, path=None, host="127.0.0.1",
+          port=DEFAULT_PORT, timeout=None):
+    """
+    Blocking client: send one job and collect its streamed results.
+    Uses only the standard library (plus numpy when reqs is an array, which
+    is then sent in binary), so tooling can query without loading the engines.
+    Returns:
+        dict: Algorithm name -> result dict.
+    """
+    import socket
+
+    if path is not None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(path)
+    else:
+        sock = socket.create_connection((host, port), timeout=timeout)
+    header = {"id": 0, "head": head, "diskSize": diskSize, "algorithms": algorithms, "order": order}
+    with sock, sock.makefile("rwb") as stream:
+        if hasattr(reqs, "dtype") and reqs.dtype.kind in "iu":
+            data = reqs.astype(reqs.dtype.newbyteorder("<"), copy=False).tobytes()
+            header.update({"binary": len(data), "dtype": reqs.dtype.newbyteorder("<").str})
+            stream.write(json.dumps(header).encode() + b"\n" + data)
+        else:
+            header["requests"] = list(reqs)
+            stream.write(json.dumps(header).encode() + b"\n")
+        stream.flush()
+        results = {}
+        for line in stream:
+            message = json.loads(line)
+            if "error" in message:
+                raise ValueError(message["error"])
+            if message.get("done"):
+                return results
+            results[message.pop("algorithm")] = message
+    raise ConnectionError("Connection closed before the job finished.")
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local simulation server (and client) over a Unix socket or localhost TCP.")
+    parser.add_argument("--socket", metavar="PATH", default=None, help="Unix socket path (default: TCP).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="Run the server.")
+    serve.add_argument("--workers", type=int, default=None, help="Pool processes for heavy jobs.")
+    serve.add_argument("--batch-window-ms", type=float, default=BATCH_WINDOW_MS)
+    serve.add_argument("--heavy-requests", type=int, default=HEAVY_REQUESTS)
+    serve.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], default="INFO")
+    send = commands.add_parser("query", help="Send one trace to a running server.")
+    send.add_argument("trace", help="Request file (CSV, text, .gz or binary trace).")
+    send.add_argument("--head", type=int, required=True)
+    send.add_argument("--disk-size", type=int, default=200)
+    send.add_argument("-a", "--algorithms", nargs="+", default=None)
+    send.add_argument("--order", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "query":
+        from trace_loader import load_trace
+
+        results = query(load_trace(args.trace), args.head, args.disk_size, args.algorithms, args.order,
+                        args.socket, args.host, args.port)
+        print(json.dumps(results, indent=2))
+        return
+
+    logging.basicConfig(level=args.log_level, format="%(levelname)s %(name)s: %(message)s")
+    service = SimulationService(args.workers, args.batch_window_ms, heavyRequests=args.heavy_requests)
+
+    async def serve():
+        await service.start(args.socket, args.host, args.port)
+        try:
+            await service.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
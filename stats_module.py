@@ -0,0 +1,277 @@
+import math
+
+class LogHistogram:
+    """
+    Mergeable quantile sketch with bounded relative error.
+    Non-negative values are counted in logarithmic buckets, so memory depends
+    on the value range rather than the number of samples, and two sketches
+    built on separate chunks or processes can be merged exactly.
+    """
+
+    def __init__(self, relativeAccuracy=0.01):
+        if not 0 < relativeAccuracy < 1:
+            raise ValueError("relativeAccuracy must be between 0 and 1.")
+        self.relativeAccuracy = relativeAccuracy
+        self._gamma = (1 + relativeAccuracy) / (1 - relativeAccuracy)
+        self._logGamma = math.log(self._gamma)
+        self.buckets = {}
+        self.zeroCount = 0
+        self.count = 0
+
+    def add(self, value, weight=1):
+        """Add one non-negative value (weight times)."""
+        if value < 0:
+            raise ValueError("LogHistogram only accepts non-negative values.")
+        if value == 0:
+            self.zeroCount += weight
+        else:
+            key = math.ceil(math.log(value) / self._logGamma)
+            self.buckets[key] = self.buckets.get(key, 0) + weight
+        self.count += weight
+
+    def add_many(self, values):
+        """Add an array of non-negative values in one vectorized pass."""
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        if values.min() < 0:
+            raise ValueError("LogHistogram only accepts non-negative values.")
+        positive = np.count_nonzero(values)
+        self.zeroCount += int(values.size - positive)
+        self.count += int(values.size)
+        if positive:
+            keys = np.log(values[values > 0] if positive < values.size else values)
+            keys /= self._logGamma
+            keys = np.ceil(keys, out=keys).astype(np.int64)
+            # Keys span only a few hundred buckets, so counting beats sorting
+            lowest = int(keys.min())
+            counts = np.bincount(keys - lowest)
+            for offset in np.flatnonzero(counts).tolist():
+                key = lowest + offset
+                self.buckets[key] = self.buckets.get(key, 0) + int(counts[offset])
+
+    def merge(self, other):
+        """Fold another sketch with the same accuracy into this one."""
+        if other.relativeAccuracy != self.relativeAccuracy:
+            raise ValueError("Cannot merge sketches with different accuracy.")
+        for key, cnt in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + cnt
+        self.zeroCount += other.zeroCount
+        self.count += other.count
+        return self
+
+    def quantile(self, q, nearestRank=False):
+        """
+        Estimate the q-th quantile (0 <= q <= 1), or 0 when empty.
+        By default this is the lower value at rank q * (count - 1). With
+        nearestRank, it is the ceil(q * count)-th smallest value, so high
+        quantiles of small samples reach the largest values.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+        if self.count == 0:
+            return 0
+        rank = max(math.ceil(q * self.count), 1) - 1 if nearestRank else q * (self.count - 1)
+        seen = self.zeroCount
+        if rank < seen:
+            return 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self.buckets) / (self._gamma + 1)
+
+    def to_dict(self):
+        return {
+            "relativeAccuracy": self.relativeAccuracy,
+            "zeroCount": self.zeroCount,
+            "buckets": {str(k): v for k, v in self.buckets.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data["relativeAccuracy"])
+        sketch.zeroCount = data["zeroCount"]
+        sketch.buckets = {int(k): v for k, v in data["buckets"].items()}
+        sketch.count = sketch.zeroCount + sum(sketch.buckets.values())
+        return sketch
+
+class SeekStats:
+    """
+    Seek-distance summary built in a single streaming pass.
+    Keeps the count, total, min, max, a running mean and variance, a
+    fixed-bucket histogram over 0..maxSeek and a LogHistogram for
+    percentiles. Memory does not depend on the number of seeks, and
+    summaries of separate chunks or processes merge exactly (percentiles to
+    within the sketch's relative accuracy).
+    One sample is one leg of the head path, i.e. one entry of a service
+    order (SCAN's end stop and C-SCAN's wrap included), so total equals the
+    run's head movement.
+    Args:
+        maxSeek (int): Upper edge of the histogram, normally diskSize - 1;
+            longer seeks are counted in the last bucket.
+        bins (int): Number of histogram buckets.
+        relativeAccuracy (float): Accuracy of the percentile sketch.
+    """
+
+    PERCENTILES = (50, 90, 99, 99.9)
+    _BLOCK = 1 << 20
+
+    def __init__(self, maxSeek=199, bins=20, relativeAccuracy=0.01):
+        if maxSeek < 0 or bins < 1:
+            raise ValueError("maxSeek must be non-negative and bins at least 1.")
+        self.maxSeek = int(maxSeek)
+        self.bins = int(bins)
+        self.histogram = [0] * self.bins
+        self.sketch = LogHistogram(relativeAccuracy)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._mean = 0.0
+        self._m2 = 0.0  # Sum of squared deviations from the mean
+
+    @property
+    def bucketWidth(self):
+        return (self.maxSeek + 1) / self.bins
+
+    @property
+    def mean(self):
+        return self._mean
+
+    @property
+    def stddev(self):
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+
+    def _combine(self, n, mean, m2):
+        # Chan et al.'s pairwise update, so merged variances stay exact
+        total = self.count + n
+        delta = mean - self._mean
+        self._mean += delta * n / total
+        self._m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    def _extend(self, low, high):
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    def add(self, value, weight=1):
+        """Add one non-negative seek distance (weight times)."""
+        if weight <= 0:
+            return
+        self.sketch.add(value, weight)
+        self.histogram[min(int(value * self.bins // (self.maxSeek + 1)), self.bins - 1)] += weight
+        self.total += value * weight
+        self._extend(value, value)
+        self._combine(weight, float(value), 0.0)
+
+    def add_many(self, values):
+        """Add an array of non-negative seek distances in one vectorized pass."""
+        import numpy as np
+
+        values = np.asarray(values).ravel()
+        if values.size == 0:
+            return
+        floats = values.astype(np.float64, copy=False)
+        self.sketch.add_many(floats)
+        buckets = np.minimum(values * self.bins // (self.maxSeek + 1), self.bins - 1).astype(np.intp, copy=False)
+        for bucket, cnt in enumerate(np.bincount(buckets, minlength=self.bins).tolist()):
+            self.histogram[bucket] += cnt
+        total = values.sum().item()
+        mean = total / values.size
+        deviations = floats - mean
+        self.total += total
+        self._extend(values.min().item(), values.max().item())
+        self._combine(values.size, mean, float(np.dot(deviations, deviations)))
+
+    def add_path(self, startHead, order):
+        """
+        Add the seeks of serving order from startHead, differenced in int64
+        blocks so per-request seeks are never held whole. Plain lists (the
+        algorithm_engine orders) are walked without importing numpy.
+        Returns:
+            int: Head movement along the path.
+        """
+        if isinstance(order, list):
+            movement = 0
+            previous = startHead
+            for track in order:
+                seek = abs(track - previous)
+                self.add(seek)
+                movement += seek
+                previous = track
+            return movement
+
+        import numpy as np
+
+        movement = 0
+        previous = int(startHead)
+        for i in range(0, len(order), self._BLOCK):
+            block = np.asarray(order[i:i + self._BLOCK]).astype(np.int64)
+            seeks = np.abs(np.diff(block, prepend=previous))
+            self.add_many(seeks)
+            movement += int(seeks.sum())
+            previous = int(block[-1])
+        return movement
+
+    def merge(self, other):
+        """Fold in another summary with the same histogram layout and accuracy."""
+        if (other.maxSeek, other.bins) != (self.maxSeek, self.bins):
+            raise ValueError("Cannot merge seek statistics with different histogram buckets.")
+        self.sketch.merge(other.sketch)
+        if other.count:
+            self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+            self.total += other.total
+            self._extend(other.min, other.max)
+            self._combine(other.count, other._mean, other._m2)
+        return self
+
+    def percentile(self, p):
+        """Estimated nearest-rank p-th percentile (0 <= p <= 100), clamped to the exact min and max."""
+        if not self.count:
+            return 0
+        return min(max(self.sketch.quantile(p / 100, nearestRank=True), self.min), self.max)
+
+    def summary(self):
+        """Plain dict for tables and JSON: count, min, max, mean, stddev, p50...p99.9 and the histogram."""
+        data = {
+            "count": self.count,
+            "min": self.min if self.count else 0,
+            "max": self.max if self.count else 0,
+            "mean": self.mean,
+            "stddev": self.stddev
+        }
+        for p in self.PERCENTILES:
+            data[f"p{p:g}"] = self.percentile(p)
+        data["bucket Width"] = self.bucketWidth
+        data["histogram"] = list(self.histogram)
+        return data
+
+    def to_dict(self):
+        return {
+            "maxSeek": self.maxSeek,
+            "bins": self.bins,
+            "histogram": list(self.histogram),
+            "sketch": self.sketch.to_dict(),
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self._mean,
+            "m2": self._m2
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(data["maxSeek"], data["bins"], data["sketch"]["relativeAccuracy"])
+        stats.histogram = list(data["histogram"])
+        stats.sketch = LogHistogram.from_dict(data["sketch"])
+        stats.count = data["count"]
+        stats.total = data["total"]
+        stats.min = data["min"]
+        stats.max = data["max"]
+        stats._mean = data["mean"]
+        stats._m2 = data["m2"]
+        return stats
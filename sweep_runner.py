@@ -0,0 +1,215 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from prefix_index import INDEXED_ALGORITHMS, WorkloadIndex
+from result_cache import ResultCache, fingerprint
+from scheduler_registry import available_algorithms, get_algorithm
+from trace_loader import load_trace
+
+FIELDS = ["workload", "startHead", "diskSize", "algorithm", "requests",
+          "head Movement", "average Seek", "throughput"]
+
+# Per-process caches so a worker loads and hashes each workload file only once
+_workloads = {}
+_indexes = {}
+_results = {}
+
+def _load_workload(path):
+    if path not in _workloads:
+        if len(_workloads) >= 8:
+            _workloads.clear()
+        reqs = load_trace(path)
+        _workloads[path] = (reqs, fingerprint(reqs))
+    return _workloads[path]
+
+def _workload_index(path):
+    # Sorted once per workload, so each further head costs O(log n)
+    if path not in _indexes:
+        if len(_indexes) >= 8:
+            _indexes.clear()
+        _indexes[path] = WorkloadIndex(_load_workload(path)[0])
+    return _indexes[path]
+
+def _result_cache(cacheDir):
+    if cacheDir not in _results:
+        _results[cacheDir] = ResultCache(cacheDir=cacheDir)
+    return _results[cacheDir]
+
+def _run_algorithm(cache, algorithm, reqs, startHead, diskSize, fingerprintHex):
+    # Sweeps only need metrics, so never materialize the service order
+    return cache.run(get_algorithm(algorithm), reqs, startHead, diskSize, keepOrder=False,
+                     fingerprintHex=fingerprintHex)
+
+def run_cells(cells, cacheDir=None):
+    """
+    Run a batch of sweep cells in the current process.
+    Elevator schedules are answered from a per-workload prefix_index; other
+    identical (requests, head, diskSize, algorithm) cells are memoized, even
+    across workload files with the same content.
+    Args:
+        cells (list): (workload, startHead, diskSize, algorithm) tuples.
+        cacheDir (str): Optional result cache directory shared by all workers and runs.
+    Returns:
+        list: One summary row (dict with FIELDS keys) per cell; no service order.
+    """
+    cache = _result_cache(cacheDir)
+    rows = []
+    for workload, startHead, diskSize, algorithm in cells:
+        reqs, fingerprintHex = _load_workload(workload)
+        if algorithm.upper() in INDEXED_ALGORITHMS:
+            result = _workload_index(workload).result(algorithm, startHead, diskSize)
+        else:
+            result = _run_algorithm(cache, algorithm, reqs, startHead, diskSize, fingerprintHex)
+        rows.append({
+            "workload": workload,
+            "startHead": startHead,
+            "diskSize": diskSize,
+            "algorithm": algorithm,
+            "requests": int(reqs.size),
+            "head Movement": int(result["head Movement"]),
+            "average Seek": float(result["average Seek"]),
+            "throughput": float(result["throughput"])
+        })
+    return rows
+
+def build_grid(workloads, heads, diskSizes, algorithms=None):
+    """Return every (workload, startHead, diskSize, algorithm) combination."""
+    algorithms = available_algorithms() if algorithms is None else algorithms
+    return list(itertools.product(workloads, heads, diskSizes, algorithms))
+
+def _cell_key(workload, startHead, diskSize, algorithm):
+    return (str(workload), int(startHead), int(diskSize), str(algorithm))
+
+def _row_key(row):
+    return _cell_key(row["workload"], row["startHead"], row["diskSize"], row["algorithm"])
+
+def _is_csv(path):
+    return path.lower().endswith(".csv")
+
+def _drop_partial_line(path):
+    """Cut off a last line left unterminated by an interrupted run, so new rows start on a fresh line."""
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb+') as file:
+        size = file.seek(0, os.SEEK_END)
+        end = size
+        while end > 0:
+            start = max(0, end - 65536)
+            file.seek(start)
+            block = file.read(end - start)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                end = start + newline + 1
+                break
+            end = start
+        if end != size:
+            file.truncate(end)
+
+def _complete_key(row):
+    """Cell key of a fully written row, or None for a damaged one."""
+    if not isinstance(row, dict) or any(row.get(field) in (None, "") for field in FIELDS):
+        return None
+    try:
+        return _row_key(row)
+    except (TypeError, ValueError):
+        return None
+
+def _read_rows(file, csvFormat):
+    if csvFormat:
+        yield from csv.DictReader(file)
+        return
+    for line in file:
+        line = line.strip()
+        if line:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+def _completed_cells(outPath):
+    """Keys of cells already fully written to an existing output file; damaged rows are run again."""
+    if not os.path.exists(outPath) or os.path.getsize(outPath) == 0:
+        return set()
+    with open(outPath, 'r', newline='') as file:
+        keys = map(_complete_key, _read_rows(file, _is_csv(outPath)))
+        return {key for key in keys if key is not None}
+
+def run_sweep(grid, outPath, workers=None, batchSize=16, progress=None, cacheDir=None):
+    """
+    Run a parameter sweep across a process pool, streaming rows to outPath.
+    Cells already present in outPath are skipped, so an interrupted sweep can
+    be resumed by running it again with the same output file.
+    Args:
+        grid (list): (workload, startHead, diskSize, algorithm) tuples.
+        outPath (str): Output file; .csv writes CSV, anything else JSON lines.
+        workers (int): Worker processes (defaults to all cores).
+        batchSize (int): Cells sent to a worker per task.
+        progress (callable): Optional callback(doneCells, totalCells).
+        cacheDir (str): Optional shared result cache directory (see result_cache).
+    Returns:
+        int: Number of cells run in this call.
+    """
+    _drop_partial_line(outPath)
+    done = _completed_cells(outPath)
+    pending = [cell for cell in grid if _cell_key(*cell) not in done]
+    if not pending:
+        return 0
+
+    # Keep cells of the same workload together so workers reuse loaded data
+    pending.sort(key=lambda cell: cell[0])
+    batches = [pending[i:i + batchSize] for i in range(0, len(pending), batchSize)]
+
+    writeHeader = not os.path.exists(outPath) or os.path.getsize(outPath) == 0
+    finished = 0
+    with open(outPath, 'a', newline='') as out, ProcessPoolExecutor(max_workers=workers) as pool:
+        writer = csv.DictWriter(out, fieldnames=FIELDS) if _is_csv(outPath) else None
+        if writer and writeHeader:
+            writer.writeheader()
+        futures = [pool.submit(run_cells, batch, cacheDir) for batch in batches]
+        for future in as_completed(futures):
+            rows = future.result()
+            for row in rows:
+                if writer:
+                    writer.writerow(row)
+                else:
+                    out.write(json.dumps(row) + "\n")
+            out.flush()
+            finished += len(rows)
+            if progress:
+                progress(finished, len(pending))
+    return finished
+
+def _int_list(values):
+    """Parse ints, allowing start:stop[:step] ranges."""
+    result = []
+    for value in values:
+        if ':' in value:
+            parts = [int(p) for p in value.split(':')]
+            result.extend(range(*parts))
+        else:
+            result.append(int(value))
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a disk scheduling parameter sweep.")
+    parser.add_argument("--workloads", nargs="+", required=True, help="Request files (CSV, text or .gz).")
+    parser.add_argument("--heads", nargs="+", required=True, help="Start heads; ranges like 0:200:10 allowed.")
+    parser.add_argument("--disk-sizes", nargs="+", default=["200"], help="Disk sizes; ranges allowed.")
+    parser.add_argument("--algorithms", nargs="+", default=available_algorithms(), choices=available_algorithms())
+    parser.add_argument("--out", required=True, help="Output .csv or .jsonl file.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    parser.add_argument("--cache-dir", default=None, help="Result cache directory shared across runs and processes.")
+    args = parser.parse_args(argv)
+
+    grid = build_grid(args.workloads, _int_list(args.heads), _int_list(args.disk_sizes), args.algorithms)
+    ran = run_sweep(grid, args.out, workers=args.workers,
+                    progress=lambda done, total: print(f"\r{done}/{total} cells", end="", flush=True),
+                    cacheDir=args.cache_dir)
+    print(f"\nRan {ran} of {len(grid)} cells; results in {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# The modules live flat at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def make_workloads(seed, cases=40):
+    """
+    Fixed-seed (reqs, head, diskSize) cases for cross-engine checks: an empty
+    queue, tracks drawn from a narrow band so they repeat, and heads at both
+    disk edges as well as in between.
+    """
+    rng = np.random.default_rng(seed)
+    workloads = []
+    for _ in range(cases):
+        diskSize = int(rng.integers(1, 400))
+        size = int(rng.integers(0, 60))
+        band = int(rng.choice([diskSize, max(diskSize // 10, 1)]))
+        reqs = rng.integers(0, band, size).tolist()
+        for head in (0, diskSize - 1, int(rng.integers(0, diskSize))):
+            workloads.append((reqs, head, diskSize))
+    workloads.append(([], 0, 200))
+    workloads.append(([], 199, 200))
+    return workloads
+
+@pytest.fixture(params=[1, 2, 3])
+def workloads(request):
+    return make_workloads(request.param)
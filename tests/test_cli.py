@@ -0,0 +1,18 @@
+import io
+import json
+
+import pytest
+
+import cli
+from input_module import parse_requests
+
+@pytest.mark.parametrize("text", ["track\n98\n183\n37\n", "track;size\n98\n183\n37", "98, 183, 37\n"])
+def test_parse_requests_skips_a_header_row(text):
+    assert parse_requests(text) == [98, 183, 37]
+
+def test_cli_reads_a_csv_with_a_header_row(tmp_path):
+    trace = tmp_path / "trace.csv"
+    trace.write_text("track\n98\n183\n37\n")
+    out = io.StringIO()
+    assert cli.main([str(trace), "--head", "53", "-a", "FCFS"], stdout=out) == 0
+    assert json.loads(out.getvalue())[0]["requests"] == 3
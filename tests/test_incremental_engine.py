@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import algorithm_engine
+import incremental_engine
+import vector_engine
+
+SCHEDULERS = [
+    (incremental_engine.IncrementalFCFS, vector_engine.fcfs),
+    (incremental_engine.IncrementalSCAN, vector_engine.scan),
+    (incremental_engine.IncrementalCSCAN, vector_engine.c_scan),
+    (incremental_engine.IncrementalLOOK, vector_engine.look),
+    (incremental_engine.IncrementalCLOOK, vector_engine.c_look),
+]
+
+REFERENCES = {
+    incremental_engine.IncrementalFCFS: lambda reqs, head, diskSize: algorithm_engine.fcfs(reqs, head),
+    incremental_engine.IncrementalSCAN: algorithm_engine.scan,
+    incremental_engine.IncrementalCSCAN: algorithm_engine.c_scan,
+}
+
+@pytest.mark.parametrize("scheduler, engine", SCHEDULERS)
+def test_batches_match_a_single_run(workloads, scheduler, engine):
+    rng = np.random.default_rng(18)
+    for reqs, head, diskSize in workloads:
+        incremental = scheduler(head, diskSize)
+        cuts = np.sort(rng.integers(0, len(reqs) + 1, 3))
+        for batch in np.split(np.array(reqs, dtype=np.int64), cuts):
+            incremental.add(batch)
+        result = incremental.result()
+        expected = engine(np.array(reqs, dtype=np.int64), head, diskSize)
+        assert result.order.tolist() == expected.order.tolist(), (reqs, head, diskSize)
+        assert incremental.headMovement == expected.headMovement
+        assert incremental.metrics()["head Movement"] == expected.headMovement
+        assert result.seekStats.summary()["count"] == expected.seekStats.summary()["count"]
+
+        reference = REFERENCES.get(scheduler)
+        if reference is not None:
+            assert result.order.tolist() == reference(list(reqs), head, diskSize)["order"]
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        incremental_engine.IncrementalScheduler(0)
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+import algorithm_engine
+import vector_engine
+from out_of_core import OUT_OF_CORE_ALGORITHMS, simulate_file
+from trace_loader import load_trace
+
+def _engine(name):
+    return getattr(vector_engine, name.lower().replace("-", "_"))
+
+def _write(path, reqs):
+    path.write_text("track\n" + "\n".join(map(str, reqs)) + "\n")
+    return str(path)
+
+@pytest.mark.parametrize("name", OUT_OF_CORE_ALGORITHMS)
+def test_out_of_core_matches_in_memory_engines(tmp_path, workloads, name):
+    for reqs, head, diskSize in workloads[::4]:
+        trace = _write(tmp_path / "trace.csv", reqs)
+        orderPath = str(tmp_path / "order.csv")
+        expected = _engine(name)(np.array(reqs, dtype=np.int64), head, diskSize)
+        swept = simulate_file(trace, name, head, diskSize, orderPath=orderPath, seekStats=True)
+        assert swept["head Movement"] == expected.headMovement, (reqs, head, diskSize)
+        assert load_trace(orderPath).tolist() == expected.order.tolist()
+        assert swept["seek Stats"]["count"] == expected.seekStats.count
+        assert simulate_file(trace, name, head, diskSize)["head Movement"] == expected.headMovement
+        if name in ("FCFS", "SCAN", "C-SCAN"):
+            reference = getattr(algorithm_engine, name.lower().replace("-", "_"))
+            args = (list(reqs), head) if name == "FCFS" else (list(reqs), head, diskSize)
+            assert swept["head Movement"] == reference(*args)["head Movement"]
+
+@pytest.mark.parametrize("name", OUT_OF_CORE_ALGORITHMS)
+def test_spilled_runs_merge_into_the_same_schedule(tmp_path, name):
+    reqs = np.random.default_rng(24).integers(0, 1000, 20000)
+    trace = _write(tmp_path / "trace.csv", reqs.tolist())
+    orderPath = str(tmp_path / "order.bin")
+    expected = _engine(name)(reqs, 500, 1000)
+    summary = simulate_file(trace, name, 500, 1000, memoryBytes=1 << 12, orderPath=orderPath, tmpDir=str(tmp_path))
+    if name != "FCFS":
+        assert summary["runs"] > 2
+    assert summary["head Movement"] == expected.headMovement
+    assert load_trace(orderPath).tolist() == expected.order.tolist()
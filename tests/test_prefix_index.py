@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import algorithm_engine
+import vector_engine
+from prefix_index import INDEXED_ALGORITHMS, WorkloadIndex
+
+def _walk(order, head):
+    movement = 0
+    for track in order:
+        movement += abs(track - head)
+        head = track
+    return movement
+
+def _reference_movement(name, reqs, head, diskSize):
+    """algorithm_engine where it has the schedule; LOOK and C-LOOK are walked here."""
+    if name in ("SCAN", "FSCAN"):
+        return algorithm_engine.scan(list(reqs), head, diskSize)["head Movement"]
+    if name == "C-SCAN":
+        return algorithm_engine.c_scan(list(reqs), head, diskSize)["head Movement"]
+    right = sorted(r for r in reqs if r >= head)
+    left = sorted(r for r in reqs if r < head)
+    return _walk(right + (left if name == "C-LOOK" else left[::-1]), head)
+
+@pytest.mark.parametrize("name", INDEXED_ALGORITHMS)
+def test_index_matches_reference_for_every_head(workloads, name):
+    engine = getattr(vector_engine, name.lower().replace("-", "_"))
+    for reqs, head, diskSize in workloads:
+        index = WorkloadIndex(reqs)
+        heads = np.unique([0, diskSize - 1, head])
+        movement = index.movement(name, heads, diskSize)
+        for h, moved in zip(heads.tolist(), movement.tolist()):
+            expected = _reference_movement(name, reqs, h, diskSize)
+            assert moved == expected, (name, reqs, h, diskSize)
+            assert engine(np.array(reqs, dtype=np.int64), h, diskSize).headMovement == expected
+        assert index.result(name, head, diskSize).headMovement == _reference_movement(name, reqs, head, diskSize)
+
+@pytest.mark.parametrize("name", INDEXED_ALGORITHMS)
+def test_best_head_is_the_minimum_over_all_heads(name):
+    reqs = np.random.default_rng(13).integers(0, 100, 50)
+    index = WorkloadIndex(reqs)
+    head, moved = index.best_head(name, diskSize=100)
+    every = [_reference_movement(name, reqs.tolist(), h, 100) for h in range(100)]
+    assert moved == min(every)
+    assert every[head] == moved
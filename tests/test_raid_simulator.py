@@ -0,0 +1,25 @@
+import pytest
+
+from raid_simulator import RaidLayout, simulate_array
+
+@pytest.mark.parametrize("driveModel", [None, "hdd7200"])
+def test_idle_devices_do_not_move_or_take_time(driveModel):
+    report = simulate_array([0, 1, 2], RaidLayout("0", 4), "SCAN", 0, deviceSize=1000,
+                            workers=0, driveModel=driveModel)
+    idle = report["devices"][3]
+    assert idle["requests"] == 0
+    assert idle["head Movement"] == 0
+    assert idle["time"] == 0
+    assert idle["seek Stats"]["count"] == 0
+
+    busy = [device for device in report["devices"] if device["requests"]]
+    array = report["array"]
+    assert array["slowest Device"] != 3
+    assert array["completion Time"] == max(device["time"] for device in busy)
+    assert array["head Movement"] == sum(device["head Movement"] for device in busy)
+
+def test_array_seek_stats_cover_busy_devices_only():
+    report = simulate_array([0, 1, 2], RaidLayout("0", 4), "LOOK", 0, deviceSize=1000, workers=0)
+    stats = report["array"]["seek Stats"]
+    assert stats["count"] == 3
+    assert stats["max"] < 999
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+import incremental_engine
+import vector_engine
+
+def _same_stats(a, b):
+    assert a.keys() == b.keys()
+    for key in a:
+        assert a[key] == pytest.approx(b[key])
+
+@pytest.mark.parametrize("func", [vector_engine.scan, vector_engine.c_scan])
+@pytest.mark.parametrize("diskSize", [50, 5000])  # Dense (bincount) and sparse (unique) track sets
+def test_metrics_only_sweep_keeps_seek_stats(func, diskSize):
+    rng = np.random.default_rng(25)
+    reqs = rng.integers(0, diskSize, 200)
+    for head in (0, diskSize // 3, diskSize - 1):
+        full = func(reqs, head, diskSize)
+        metrics = func(reqs, head, diskSize, keepOrder=False)
+        assert metrics.order is None
+        assert metrics.headMovement == full.headMovement
+        _same_stats(metrics.seekStats.summary(), full.seekStats.summary())
+
+def test_incremental_metrics_only_result_keeps_seek_stats():
+    scheduler = incremental_engine.IncrementalCSCAN(50, 200).add([10, 120, 120]).add([60, 3])
+    full = scheduler.result()
+    metrics = scheduler.result(keepOrder=False)
+    assert metrics.order is None
+    _same_stats(metrics.seekStats.summary(), full.seekStats.summary())
@@ -0,0 +1,16 @@
+import pytest
+
+from simulation_service import _validate_job
+
+@pytest.mark.parametrize("header, message", [
+    ({"head": 5}, "missing field 'requests'"),
+    ({"requests": [1]}, "missing field 'head'"),
+    ({"requests": [1], "head": "a"}, "field 'head' must be an integer"),
+    ({"requests": [1], "head": 5, "algorithms": ["X"]}, "unknown algorithm 'X'; available: FCFS"),
+])
+def test_bad_jobs_name_the_problem(header, message):
+    with pytest.raises(ValueError, match=message):
+        _validate_job(header)
+
+def test_valid_job_resolves_algorithm_names():
+    assert _validate_job({"requests": [1], "head": 5, "algorithms": ["scan"]}) == (5, 200, ["SCAN"])
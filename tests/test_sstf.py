@@ -0,0 +1,11 @@
+import algorithm_engine
+
+def test_two_cursor_sstf_matches_reference(workloads):
+    for reqs, head, _ in workloads:
+        expected = algorithm_engine.sstf(list(reqs), head)
+        assert algorithm_engine.sstf_fast(reqs, head) == expected, (reqs, head)
+
+def test_ties_go_to_the_earliest_request():
+    # 40 and 60 are equally far from 50; 60 was requested first
+    assert algorithm_engine.sstf_fast([60, 40], 50)["order"] == [60, 40]
+    assert algorithm_engine.sstf_fast([40, 60], 50)["order"] == [40, 60]
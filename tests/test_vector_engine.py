@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+import algorithm_engine
+import vector_engine
+
+ENGINES = [
+    ("fcfs", lambda reqs, head, diskSize: algorithm_engine.fcfs(reqs, head)),
+    ("sstf", lambda reqs, head, diskSize: algorithm_engine.sstf(reqs, head)),
+    ("scan", algorithm_engine.scan),
+    ("c_scan", algorithm_engine.c_scan),
+]
+
+@pytest.mark.parametrize("name, reference", ENGINES)
+def test_vector_engines_match_reference(workloads, name, reference):
+    engine = getattr(vector_engine, name)
+    for reqs, head, diskSize in workloads:
+        expected = reference(list(reqs), head, diskSize)
+        result = engine(np.array(reqs, dtype=np.int64), head, diskSize)
+        assert result.order.tolist() == expected["order"], (reqs, head, diskSize)
+        assert result.headMovement == expected["head Movement"]
+        assert result.averageSeek == pytest.approx(expected["average Seek"])
+        assert result.throughput == pytest.approx(expected["throughput"])
+
+        metrics = engine(np.array(reqs, dtype=np.int64), head, diskSize, keepOrder=False)
+        assert metrics.order is None
+        assert metrics.headMovement == expected["head Movement"]
+
+@pytest.mark.parametrize("name", ["scan", "c_scan"])
+def test_narrow_dtype_input_does_not_overflow(name):
+    reqs = np.array([60000, 10, 65000, 3], dtype=np.uint16)
+    expected = getattr(algorithm_engine, name)(reqs.tolist(), 30000, 65536)
+    assert getattr(vector_engine, name)(reqs, 30000, 65536).headMovement == expected["head Movement"]
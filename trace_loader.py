@@ -0,0 +1,119 @@
+import gzip
+import os
+import re
+import warnings
+
+import numpy as np
+
+from input_module import is_header
+from instrumentation import count, timer
+
+DEFAULT_CHUNK_BYTES = 8 << 20
+_SEPARATORS = bytes.maketrans(b",;\t\r", b"    ")
+_NUMBER = re.compile(rb"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
+def open_trace_file(path):
+    """Open a trace for binary reading, transparently decompressing gzip."""
+    with open(path, 'rb') as probe:
+        isGzip = probe.read(2) == b"\x1f\x8b"
+    return gzip.open(path, 'rb') if isGzip else open(path, 'rb')
+
+def _is_header(line):
+    """A header line has fields but none of them is a number (see input_module.is_header)."""
+    return is_header(line.decode(errors="replace"))
+
+def _parse_block(data, dtype):
+    """Parse separator-delimited numbers from a bytes block into an array."""
+    data = data.translate(_SEPARATORS)
+    if not data.strip():
+        return np.empty(0, dtype=dtype)
+    with warnings.catch_warnings():
+        # numpy only warns when it stops early on a malformed value
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(data, dtype=dtype, sep=" ")
+        except (DeprecationWarning, ValueError):
+            bad = next((f for f in data.split() if not _NUMBER.fullmatch(f)), data.split()[0])
+            raise ValueError(f"Invalid value in trace: {bad[:20].decode(errors='replace')!r}") from None
+
+def iter_trace_chunks(path, chunkBytes=DEFAULT_CHUNK_BYTES, dtype=np.int64, progress=None):
+    """
+    Stream numbers from a CSV/text trace in compact array chunks.
+    Works for single-row, multi-row and single-column files, skips a text
+    header line, and reads .gz input transparently.
+    Args:
+        path (str): Trace file path.
+        chunkBytes (int): Bytes read per chunk.
+        dtype: Output dtype (int64 for tracks, float64 for timestamps).
+        progress (callable): Optional callback(bytesRead, totalBytes) on the
+            on-disk (possibly compressed) file.
+    Yields:
+        ndarray: The next chunk of values.
+    """
+    totalBytes = os.path.getsize(path)
+    with open_trace_file(path) as file:
+        raw = getattr(file, "fileobj", file)
+        carry = b""
+        firstBlock = True
+        while True:
+            block = file.read(chunkBytes)
+            data = carry + block
+            if firstBlock and block and b"\n" not in data:
+                # The header check needs the whole first line, unless a
+                # complete number already shows that it holds data
+                fields = data.translate(_SEPARATORS).split()[:-1]
+                if not any(_NUMBER.fullmatch(f) for f in fields):
+                    carry = data
+                    continue
+                firstBlock = False
+            if not block:
+                carry = b""
+            else:
+                # Only parse up to the last separator so no number is split
+                cut = max(data.rfind(b"\n"), data.rfind(b","), data.rfind(b" "))
+                if cut < 0:
+                    carry = data
+                    continue
+                data, carry = data[:cut + 1], data[cut + 1:]
+            if firstBlock:
+                firstBlock = False
+                lineEnd = data.find(b"\n")
+                firstLine = data if lineEnd < 0 else data[:lineEnd]
+                if _is_header(firstLine):
+                    data = b"" if lineEnd < 0 else data[lineEnd + 1:]
+            values = _parse_block(data, dtype)
+            if values.size:
+                yield values
+            if progress:
+                progress(raw.tell() if block else totalBytes, totalBytes)
+            if not block:
+                break
+
+def load_trace(path, chunkBytes=DEFAULT_CHUNK_BYTES, dtype=np.int64, progress=None):
+    """
+    Load a whole CSV/text trace into one compact array.
+    Binary traces (see binary_trace) are memory-mapped instead of parsed.
+    Args:
+        path (str): Trace file path.
+        chunkBytes (int): Bytes read per chunk.
+        dtype: Output dtype.
+        progress (callable): Optional callback(bytesRead, totalBytes).
+    Returns:
+        ndarray: All values in file order.
+    Raises:
+        ValueError: If the file holds a non-numeric value or a negative track.
+    """
+    from binary_trace import is_binary_trace, open_trace
+
+    if is_binary_trace(path):
+        with timer("parse.binaryTrace"):
+            return open_trace(path).tracks
+
+    with timer("parse.trace"):
+        chunks = list(iter_trace_chunks(path, chunkBytes, dtype, progress))
+        values = np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+        if np.issubdtype(values.dtype, np.integer) and values.size and values.min() < 0:
+            raise ValueError("Disk requests must be non-negative integers.")
+    count("parse.bytes", os.path.getsize(path))
+    count("alloc.traceBytes", values.nbytes)
+    return values
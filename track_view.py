@@ -0,0 +1,212 @@
+import tkinter as tk
+from tkinter import ttk
+
+import numpy as np
+
+COLUMNS = 5          # Positions per row, as in the original listing
+ROWS_PER_PAGE = 40   # Rows rendered at a time
+PAGE_SIZE = COLUMNS * ROWS_PER_PAGE
+
+class TrackPositionsView(ttk.Frame):
+    """
+    Paged viewer for the track positions of each algorithm.
+    Only the visible page (PAGE_SIZE steps) is ever formatted and inserted
+    into the Text widget; everything else stays in the compact order arrays,
+    so a 5M-step schedule opens as fast as an 8-step one.
+    Step 0 is the initial head position, step i the i-th serviced track.
+    """
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.results = {}
+        self.summaries = {}
+        self.start_head = 0
+        self.algo_name = None
+        self.page = 0
+        self.highlight_step = None
+        self.search_track = None
+
+        controls = ttk.Frame(self)
+        controls.pack(fill=tk.X, pady=(0, 5))
+
+        self.algo_var = tk.StringVar()
+        self.algo_box = ttk.Combobox(controls, textvariable=self.algo_var, state="readonly", width=12)
+        self.algo_box.pack(side=tk.LEFT, padx=(0, 5))
+        self.algo_box.bind("<<ComboboxSelected>>", lambda event: self.show_algorithm(self.algo_var.get()))
+
+        ttk.Button(controls, text="<<", width=3, command=lambda: self.show_page(0)).pack(side=tk.LEFT)
+        ttk.Button(controls, text="<", width=3, command=lambda: self.show_page(self.page - 1)).pack(side=tk.LEFT)
+        ttk.Button(controls, text=">", width=3, command=lambda: self.show_page(self.page + 1)).pack(side=tk.LEFT)
+        ttk.Button(controls, text=">>", width=3, command=lambda: self.show_page(self.page_count() - 1)).pack(side=tk.LEFT)
+
+        ttk.Label(controls, text="Step:").pack(side=tk.LEFT, padx=(10, 2))
+        self.step_entry = ttk.Entry(controls, width=9)
+        self.step_entry.pack(side=tk.LEFT)
+        self.step_entry.bind("<Return>", lambda event: self.jump_to_step())
+
+        ttk.Label(controls, text="Track:").pack(side=tk.LEFT, padx=(10, 2))
+        self.track_entry = ttk.Entry(controls, width=7)
+        self.track_entry.pack(side=tk.LEFT)
+        self.track_entry.bind("<Return>", lambda event: self.find_track())
+        ttk.Button(controls, text="Find Next", command=self.find_track).pack(side=tk.LEFT, padx=(2, 0))
+
+        self.status_label = ttk.Label(self, text="", font=("Segoe UI", 9))
+        self.status_label.pack(fill=tk.X)
+
+        text_frame = ttk.Frame(self)
+        text_frame.pack(fill=tk.BOTH, expand=True)
+        self.text = tk.Text(text_frame, height=10, wrap=tk.NONE,
+                            font=("Consolas", 12), bg="#1a1a1a", fg="white",
+                            insertbackground="white", selectbackground="#4ECDC4",
+                            padx=10, pady=10, width=60)
+        scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.text.yview)
+        self.text.configure(yscrollcommand=scrollbar.set)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.text.tag_configure("header", foreground="#4ECDC4", font=("Consolas", 12, "bold"))
+        self.text.tag_configure("algo_name", foreground="#FF6B6B", font=("Consolas", 12, "bold"))
+        self.text.tag_configure("positions", foreground="white", font=("Consolas", 12))
+        self.text.tag_configure("step", foreground="#888888", font=("Consolas", 12))
+        self.text.tag_configure("match", background="#A78BFA", foreground="black")
+        self.text.tag_configure("current", background="#FFD93D", foreground="black")
+        self.text.tag_configure("separator", foreground="#444444", font=("Consolas", 12))
+
+        self.show_message(">> Track positions will appear here after simulation...")
+
+    # --- Data access (never materializes the whole path) ---
+
+    def _order(self):
+        result = self.results.get(self.algo_name)
+        order = result.get("order") if result is not None else None
+        return np.asarray(order) if order is not None else np.empty(0, dtype=np.int64)
+
+    def step_count(self):
+        return self._order().size + 1
+
+    def page_count(self):
+        return max(1, -(-self.step_count() // PAGE_SIZE))
+
+    def positions(self, start, stop):
+        """Track at each step in [start, stop) as a list of ints."""
+        order = self._order()
+        stop = min(stop, order.size + 1)
+        head = [self.start_head] if start == 0 and stop > 0 else []
+        return head + order[max(start - 1, 0):max(stop - 1, 0)].tolist()
+
+    # --- Public API ---
+
+    def set_results(self, results, start_head):
+        """Show new results; keeps the selected algorithm when it is still present."""
+        self.results = results or {}
+        self.summaries = {}
+        self.start_head = start_head
+        names = list(self.results)
+        self.algo_box.config(values=names)
+        if not names:
+            self.algo_name = None
+            self.show_message(">> Track positions will appear here after simulation...")
+            return
+        self.show_algorithm(self.algo_name if self.algo_name in self.results else names[0])
+
+    def show_algorithm(self, algo_name):
+        self.algo_name = algo_name
+        self.algo_var.set(algo_name)
+        self.highlight_step = None
+        self.show_page(0)
+
+    def show_message(self, message):
+        self.text.config(state=tk.NORMAL)
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, message + "\n")
+        self.text.config(state=tk.DISABLED)
+        self.status_label.config(text="")
+
+    def jump_to_step(self):
+        try:
+            step = int(self.step_entry.get())
+        except ValueError:
+            self.status_label.config(text="Enter a step number.")
+            return
+        if not 0 <= step < self.step_count():
+            self.status_label.config(text=f"Step must be between 0 and {self.step_count() - 1}.")
+            return
+        self.highlight_step = step
+        self.show_page(step // PAGE_SIZE)
+
+    def find_track(self):
+        """Jump to the next step (after the highlighted one) that visits the entered track."""
+        try:
+            track = int(self.track_entry.get())
+        except ValueError:
+            self.status_label.config(text="Enter a track number.")
+            return
+        if track != self.search_track:
+            self.search_track = track
+            self.highlight_step = None
+        start = 0 if self.highlight_step is None else self.highlight_step + 1
+        step = self._find(track, start)
+        if step is None and start > 0:
+            step = self._find(track, 0)  # Wrap around
+        if step is None:
+            self.status_label.config(text=f"Track {track} is never visited by {self.algo_name}.")
+            return
+        self.highlight_step = step
+        self.show_page(step // PAGE_SIZE)
+
+    def _find(self, track, start):
+        if start == 0 and self.start_head == track:
+            return 0
+        order = self._order()
+        hits = np.flatnonzero(order[max(start - 1, 0):] == track)
+        return int(hits[0]) + max(start - 1, 0) + 1 if hits.size else None
+
+    # --- Rendering ---
+
+    def _summary(self):
+        # Cached per algorithm: min/max scan the whole order once
+        if self.algo_name in self.summaries:
+            return self.summaries[self.algo_name]
+        result = self.results[self.algo_name]
+        order = self._order()
+        lines = [
+            f"Requests: {getattr(result, 'requests', order.size)}    Steps: {self.step_count()}",
+            f"Total Movement: {result.get('head Movement', 'N/A')}    "
+            f"Avg Seek: {result.get('average Seek', 0):.2f}",
+        ]
+        if order.size:
+            lines.append(f"Tracks: {int(order.min())}-{int(order.max())}    "
+                         f"Start: {self.start_head}    End: {int(order[-1])}")
+        self.summaries[self.algo_name] = lines
+        return lines
+
+    def show_page(self, page):
+        if self.algo_name is None:
+            return
+        self.page = min(max(page, 0), self.page_count() - 1)
+        first = self.page * PAGE_SIZE
+        values = self.positions(first, first + PAGE_SIZE)
+
+        self.text.config(state=tk.NORMAL)
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, f"{self.algo_name}:\n", "algo_name")
+        for line in self._summary():
+            self.text.insert(tk.END, line + "\n", "header")
+        self.text.insert(tk.END, "-" * 40 + "\n", "separator")
+
+        step_width = len(str(self.step_count() - 1))
+        for row_start in range(0, len(values), COLUMNS):
+            step = first + row_start
+            self.text.insert(tk.END, f"{step:>{step_width}} | ", "step")
+            for offset, track in enumerate(values[row_start:row_start + COLUMNS]):
+                tags = ("positions",)
+                if step + offset == self.highlight_step:
+                    tags = ("positions", "current")
+                elif self.search_track is not None and track == self.search_track:
+                    tags = ("positions", "match")
+                self.text.insert(tk.END, str(track).rjust(6), tags)
+            self.text.insert(tk.END, "\n")
+        self.text.config(state=tk.DISABLED)
+
+        last = first + len(values) - 1
+        self.status_label.config(text=f"Page {self.page + 1} of {self.page_count()}  (steps {first}-{last})")
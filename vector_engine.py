@@ -0,0 +1,276 @@
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+from algorithm_engine import sstf_walk
+from instrumentation import count
+from result_module import SimulationResult
+from stats_module import SeekStats
+
+def _as_array(reqs):
+    """Return reqs as a 1-D integer array without copying when possible."""
+    reqs = np.asarray(reqs)
+    if reqs.dtype.kind not in "iu":
+        reqs = reqs.astype(np.int64)
+    return reqs.ravel()
+
+_SEEK_BLOCK = 1 << 16  # SSTF seeks buffered per SeekStats update
+
+def _seek_stats(diskSize):
+    return SeekStats(max(int(diskSize) - 1, 0))
+
+def _add_moves(seekStats, moves):
+    """Feed a block of seeks to seekStats; returns their total."""
+    if moves:
+        seekStats.add_many(np.array(moves, dtype=np.int64))
+    return sum(moves)
+
+def _sorted(values):
+    count("sort.elements", values.size)
+    return np.sort(values)
+
+def _result(order, headMovement, numReqs, keepOrder, seekStats=None):
+    if keepOrder and order is not None:
+        count("alloc.orderBytes", np.asarray(order).nbytes)
+    return SimulationResult(order if keepOrder else None, headMovement, numReqs, seekStats)
+
+def _walk(order, startHead, diskSize, numReqs, keepOrder):
+    """
+    Result for serving order from startHead. Head movement and the seek
+    statistics come from the same blocked pass over the order, so narrow
+    (e.g. memory-mapped int32) inputs cannot overflow and are never copied whole.
+    """
+    seekStats = _seek_stats(diskSize)
+    return _result(order, seekStats.add_path(startHead, order), numReqs, keepOrder, seekStats)
+
+def _sweep(order, startHead, diskSize, numReqs, keepOrder, repeats=0):
+    """
+    _walk for an elevator order. A metrics-only order may hold each track
+    once; the repeats it dropped are served without moving (zero-length seeks).
+    """
+    result = _walk(order, startHead, diskSize, numReqs, keepOrder)
+    result.seekStats.add(0, repeats)
+    return result
+
+def _fits_disk(reqs, startHead, end):
+    """True when every track and the head lie within 0..end."""
+    return 0 <= startHead <= end and (reqs.size == 0 or (int(reqs.min()) >= 0 and int(reqs.max()) <= end))
+
+def _distinct_tracks(reqs, diskSize):
+    """
+    Sorted distinct tracks of reqs, which must fit the disk. A dense workload
+    is counted with bincount (O(n + diskSize), no sort); a sparse one uses np.unique.
+    """
+    if diskSize <= 4 * reqs.size:
+        return np.flatnonzero(np.bincount(reqs, minlength=diskSize))
+    count("sort.elements", reqs.size)
+    return np.unique(reqs)
+
+def fcfs(reqs, startHead, diskSize=200, keepOrder=True):
+    """
+    Vectorized FCFS disk scheduling algo.
+    Args:
+        reqs (array-like): Disk reqs as an int array.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num (sets the seek histogram range).
+        keepOrder (bool): False for metrics only (order is None).
+    Returns:
+        SimulationResult: Same fields as algorithm_engine.fcfs, order as an int array.
+    """
+    order = _as_array(reqs)
+    return _walk(order, startHead, diskSize, order.size, keepOrder)
+
+def sstf(reqs, startHead, diskSize=200, keepOrder=True):
+    """
+    Vectorized SSTF disk scheduling algo.
+    np.unique does the sort and duplicate counting; only the distinct tracks
+    are walked in Python (see algorithm_engine.sstf_walk).
+    Args:
+        reqs (array-like): Disk reqs as an int array.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num (sets the seek histogram range).
+        keepOrder (bool): False for metrics only (order is None).
+    Returns:
+        SimulationResult: Same fields as algorithm_engine.sstf, order as an int array.
+    """
+    reqs = _as_array(reqs)
+    count("sort.elements", reqs.size)
+    tracks, firstSeen, counts = np.unique(reqs, return_index=True, return_counts=True)
+    positions = [] if keepOrder else None  # Metrics-only runs never hold the service order
+    moves = []
+    headMovement = 0
+    seekStats = _seek_stats(diskSize)
+    for pos, move in sstf_walk(tracks.tolist(), firstSeen.tolist(), startHead):
+        if keepOrder:
+            positions.append(pos)
+        moves.append(move)
+        if len(moves) == _SEEK_BLOCK:
+            headMovement += _add_moves(seekStats, moves)
+            moves = []
+    headMovement += _add_moves(seekStats, moves)
+    seekStats.add(0, reqs.size - tracks.size)  # Repeats of a track are served without moving
+
+    order = None
+    if keepOrder:
+        positions = np.array(positions, dtype=np.int64)
+        order = np.repeat(tracks[positions], counts[positions])
+    return _result(order, headMovement, reqs.size, keepOrder, seekStats)
+
+def scan(reqs, startHead, diskSize=200, keepOrder=True):
+    """
+    Vectorized SCAN disk scheduling algo.
+    Args:
+        reqs (array-like): Disk reqs as an int array.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num.
+        keepOrder (bool): False for metrics only; sweeps the distinct tracks without a full sort.
+    Returns:
+        SimulationResult: Same fields as algorithm_engine.scan, order as an int array.
+    """
+    reqs = _as_array(reqs)
+    end = diskSize - 1
+
+    if not keepOrder and _fits_disk(reqs, startHead, end):
+        # Only the distinct tracks shape the sweep; repeats are zero-length seeks
+        tracks = _distinct_tracks(reqs, diskSize)
+        split = np.searchsorted(tracks, startHead)
+        right, left = tracks[split:], tracks[:split][::-1]
+        repeats = reqs.size - tracks.size
+    else:
+        goesRight = reqs >= startHead
+        right = _sorted(reqs[goesRight])
+        left = _sorted(reqs[~goesRight])[::-1]
+        repeats = 0
+
+    lastRight = right[-1] if right.size else startHead
+    endStop = [end] if lastRight != end else []
+    order = np.concatenate((right, np.array(endStop, dtype=np.int64), left))
+    return _sweep(order, startHead, diskSize, reqs.size, keepOrder, repeats)
+
+def c_scan(reqs, startHead, diskSize=200, keepOrder=True):
+    """
+    Vectorized C-SCAN disk scheduling algo.
+    Args:
+        reqs (array-like): Disk reqs as an int array.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num.
+        keepOrder (bool): False for metrics only; sweeps the distinct tracks without a full sort.
+    Returns:
+        SimulationResult: Same fields as algorithm_engine.c_scan, order as an int array.
+    """
+    reqs = _as_array(reqs)
+    end = diskSize - 1
+
+    if not keepOrder and _fits_disk(reqs, startHead, end):
+        # Only the distinct tracks shape the sweep; repeats are zero-length seeks
+        tracks = _distinct_tracks(reqs, diskSize)
+        split = np.searchsorted(tracks, startHead)
+        right, left = tracks[split:], tracks[:split]
+        repeats = reqs.size - tracks.size
+    else:
+        goesRight = reqs >= startHead
+        right = _sorted(reqs[goesRight])
+        left = _sorted(reqs[~goesRight])
+        repeats = 0
+
+    lastRight = right[-1] if right.size else startHead
+    # Travel to the end (if needed), then jump back to track 0
+    wrap = [end, 0] if lastRight != end else [0]
+    order = np.concatenate((right, np.array(wrap, dtype=np.int64), left))
+    return _sweep(order, startHead, diskSize, reqs.size, keepOrder, repeats)
+
+def look(reqs, startHead, diskSize=200, keepOrder=True):
+    """
+    Vectorized LOOK disk scheduling algo.
+    Like SCAN, but the head only travels as far as the last request in each
+    direction instead of to the edge of the disk.
+    Args:
+        reqs (array-like): Disk reqs as an int array.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num (sets the seek histogram range).
+        keepOrder (bool): False for metrics only (order is None).
+    Returns:
+        SimulationResult: Service order, total head movement, avg seek time, and throughput.
+    """
+    reqs = _as_array(reqs)
+    goesRight = reqs >= startHead
+    order = np.concatenate((_sorted(reqs[goesRight]), _sorted(reqs[~goesRight])[::-1]))
+    return _walk(order, startHead, diskSize, reqs.size, keepOrder)
+
+def c_look(reqs, startHead, diskSize=200, keepOrder=True):
+    """
+    Vectorized C-LOOK disk scheduling algo.
+    Sweeps up to the last request, jumps to the lowest pending request and
+    sweeps up again; the jump is counted as head movement, as in c_scan.
+    Args:
+        reqs (array-like): Disk reqs as an int array.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num (sets the seek histogram range).
+        keepOrder (bool): False for metrics only (order is None).
+    Returns:
+        SimulationResult: Service order, total head movement, avg seek time, and throughput.
+    """
+    reqs = _as_array(reqs)
+    goesRight = reqs >= startHead
+    order = np.concatenate((_sorted(reqs[goesRight]), _sorted(reqs[~goesRight])))
+    return _walk(order, startHead, diskSize, reqs.size, keepOrder)
+
+def nstep_scan(reqs, startHead, diskSize=200, keepOrder=True, batchSize=10):
+    """
+    Vectorized N-step SCAN disk scheduling algo.
+    Requests are split into batches of batchSize in arrival order. Each batch is
+    served by one elevator pass that continues in the current direction and
+    reverses (LOOK-style) only when the batch has requests behind the head.
+    One lexsort orders every batch, so the cost is O(n log n).
+    Args:
+        reqs (array-like): Disk reqs as an int array.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num (sets the seek histogram range).
+        keepOrder (bool): False for metrics only (order is None).
+        batchSize (int): N, the number of requests per batch.
+    Returns:
+        SimulationResult: Service order, total head movement, avg seek time, and throughput.
+    """
+    if batchSize < 1:
+        raise ValueError("batchSize must be at least 1.")
+    reqs = _as_array(reqs)
+    batchIds = np.arange(reqs.size) // batchSize
+    count("sort.elements", reqs.size)
+    batched = reqs[np.lexsort((reqs, batchIds))].tolist()
+
+    order = []
+    head = startHead
+    movingUp = True
+    for i in range(0, len(batched), batchSize):
+        batch = batched[i:i + batchSize]
+        if movingUp:
+            split = bisect_left(batch, head)
+            order.extend(batch[split:])
+            order.extend(reversed(batch[:split]))
+            movingUp = split == 0
+        else:
+            split = bisect_right(batch, head)
+            order.extend(reversed(batch[:split]))
+            order.extend(batch[split:])
+            movingUp = split < len(batch)
+        head = order[-1]
+
+    order = np.array(order, dtype=np.int64)
+    return _walk(order, startHead, diskSize, reqs.size, keepOrder)
+
+def fscan(reqs, startHead, diskSize=200, keepOrder=True):
+    """
+    Vectorized FSCAN disk scheduling algo.
+    FSCAN freezes the queue at the start of each sweep and defers new arrivals
+    to the next one. Without arrival times every request is in the first
+    frozen queue, so the batch schedule equals SCAN; use event_engine's FSCAN
+    policy to see the difference under load.
+    Args:
+        reqs (array-like): Disk reqs as an int array.
+        startHead (int): Initial head pos.
+        diskSize (int): Max disk track num.
+        keepOrder (bool): False for metrics only (order is None).
+    Returns:
+        SimulationResult: Service order, total head movement, avg seek time, and throughput.
+    """
+    return scan(reqs, startHead, diskSize, keepOrder)
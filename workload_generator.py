@@ -0,0 +1,233 @@
+import os
+
+import numpy as np
+
+DISTRIBUTIONS = ("uniform", "zipf", "sequential")
+ARRIVALS = ("poisson", "bursty")
+DEFAULT_CHUNK = 1 << 20  # Requests generated (and held) at a time
+
+class _Uniform:
+    """Every track equally likely."""
+
+    def __init__(self, rng, diskSize, **params):
+        self.rng = rng
+        self.diskSize = diskSize
+
+    def draw(self, n):
+        return self.rng.integers(0, self.diskSize, n, dtype=np.int64)
+
+class _Zipf:
+    """
+    Hot spots whose popularity follows a bounded Zipf law: spot k (1-based
+    rank) is picked with probability proportional to 1 / k**zipfExponent,
+    then a track is drawn uniformly within the spot's hotSpotWidth tracks.
+    Spot positions are fixed by the seed.
+    """
+
+    def __init__(self, rng, diskSize, zipfExponent=1.1, hotSpots=32, hotSpotWidth=None, **params):
+        if zipfExponent <= 0 or hotSpots < 1:
+            raise ValueError("zipfExponent must be positive and hotSpots at least 1.")
+        self.rng = rng
+        self.width = max(1, min(diskSize, hotSpotWidth or diskSize // (4 * hotSpots)))
+        self.starts = rng.integers(0, diskSize - self.width + 1, hotSpots, dtype=np.int64)
+        weights = 1.0 / np.arange(1, hotSpots + 1, dtype=np.float64) ** zipfExponent
+        self.cdf = np.cumsum(weights / weights.sum())
+        self.cdf[-1] = 1.0
+        # Offsets get their own stream, so output does not depend on the chunk size
+        self.offsets = np.random.default_rng(rng.integers(0, 1 << 63))
+
+    def draw(self, n):
+        spots = np.searchsorted(self.cdf, self.rng.random(n), side="right")
+        return self.starts[spots] + self.offsets.integers(0, self.width, n, dtype=np.int64)
+
+class _Sequential:
+    """
+    Runs of runLength consecutive tracks from random start tracks, wrapping
+    at the disk end. A run left unfinished at a chunk boundary carries on in
+    the next chunk.
+    """
+
+    def __init__(self, rng, diskSize, runLength=64, **params):
+        if runLength < 1:
+            raise ValueError("runLength must be at least 1.")
+        self.rng = rng
+        self.diskSize = diskSize
+        self.runLength = runLength
+        self.position = 0  # Requests produced so far
+        self.runStart = 0  # Start track of the current run
+
+    def draw(self, n):
+        index = self.position + np.arange(n, dtype=np.int64)
+        run, offset = np.divmod(index, self.runLength)
+        firstRun = self.position // self.runLength
+        continuing = self.position % self.runLength != 0
+        newRuns = int(run[-1]) - firstRun + (0 if continuing else 1) if n else 0
+        starts = self.rng.integers(0, self.diskSize, newRuns, dtype=np.int64)
+        if continuing:
+            starts = np.concatenate(([self.runStart], starts))
+        if n:
+            self.runStart = int(starts[-1])
+        self.position += n
+        return (starts[run - firstRun] + offset) % self.diskSize
+
+_COMPONENTS = {"uniform": _Uniform, "zipf": _Zipf, "sequential": _Sequential}
+
+class _Arrivals:
+    """
+    Arrival timestamps in ms. "poisson" draws exponential gaps at rate
+    requests per second. "bursty" is an on/off source: the same Poisson
+    stream runs only during onMs-long ON periods, each followed by an offMs
+    OFF period without arrivals.
+    """
+
+    def __init__(self, rng, kind, rate=1000.0, onMs=100.0, offMs=400.0, **params):
+        if kind not in ARRIVALS:
+            raise ValueError(f"Unknown arrival process: {kind}. Available: {', '.join(ARRIVALS)}")
+        if rate <= 0 or onMs <= 0 or offMs < 0:
+            raise ValueError("rate and onMs must be positive and offMs non-negative.")
+        self.rng = rng
+        self.kind = kind
+        self.meanGap = 1000.0 / rate
+        self.onMs = onMs
+        self.offMs = offMs
+        self.active = 0.0  # Time spent in ON periods so far
+
+    def draw(self, n):
+        active = self.active + np.cumsum(self.rng.exponential(self.meanGap, n))
+        if n:
+            self.active = float(active[-1])
+        if self.kind == "poisson":
+            return active
+        # Every completed ON period is followed by one OFF period
+        return active + np.floor(active / self.onMs) * self.offMs
+
+def _weights(mix):
+    if isinstance(mix, str):
+        mix = {mix: 1.0}
+    for name in mix:
+        if name not in _COMPONENTS:
+            raise ValueError(f"Unknown distribution: {name}. Available: {', '.join(DISTRIBUTIONS)}")
+    names = list(mix)
+    weights = np.array([float(mix[name]) for name in names])
+    if np.any(weights < 0) or weights.sum() <= 0:
+        raise ValueError("Mixture weights must be non-negative and not all zero.")
+    return names, weights / weights.sum()
+
+def generate(count, diskSize, mix="uniform", seed=0, arrivals=None, chunkSize=DEFAULT_CHUNK, **params):
+    """
+    Generate a reproducible workload chunk by chunk.
+    Only one chunk is ever in memory, so count can be far larger than RAM
+    allows. Each component (and the mixture choice and arrival process) has
+    its own child stream of the seed, so the same seed and parameters
+    always give the same requests, whatever the chunk size.
+    Args:
+        count (int): Number of requests.
+        diskSize (int): Max disk track num (tracks are 0..diskSize - 1).
+        mix (str or dict): A name from DISTRIBUTIONS, or name -> weight for a mixture.
+        seed (int): RNG seed.
+        arrivals (str): Optional arrival process from ARRIVALS.
+        chunkSize (int): Requests per chunk.
+        **params: zipfExponent, hotSpots, hotSpotWidth (zipf); runLength
+            (sequential); rate, onMs, offMs (arrivals).
+    Yields:
+        tuple: (tracks int64 array, timestamps float64 array in ms or None).
+    """
+    if count < 0 or diskSize <= 0 or chunkSize < 1:
+        raise ValueError("count must be non-negative, diskSize and chunkSize positive.")
+    names, weights = _weights(mix)
+    streams = np.random.SeedSequence(seed).spawn(len(names) + 2)
+    components = [_COMPONENTS[name](np.random.default_rng(stream), diskSize, **params)
+                  for name, stream in zip(names, streams)]
+    picker = np.random.default_rng(streams[-2])
+    clock = _Arrivals(np.random.default_rng(streams[-1]), arrivals, **params) if arrivals else None
+
+    for start in range(0, count, chunkSize):
+        n = min(chunkSize, count - start)
+        if len(components) == 1:
+            tracks = components[0].draw(n)
+        else:
+            choice = np.searchsorted(np.cumsum(weights)[:-1], picker.random(n), side="right")
+            tracks = np.empty(n, dtype=np.int64)
+            for i, component in enumerate(components):
+                mask = choice == i
+                tracks[mask] = component.draw(int(np.count_nonzero(mask)))
+        yield tracks, clock.draw(n) if clock else None
+
+def write_workload(path, count, diskSize, mix="uniform", seed=0, arrivals=None, chunkSize=DEFAULT_CHUNK,
+                   dtype="int32", progress=None, **params):
+    """
+    Stream a generated workload to disk.
+    Files ending in .csv (or .txt) get one request per line, "timestamp,
+    track" with arrivals; anything else is written as a binary trace (see
+    binary_trace), which loads memory-mapped.
+    Args:
+        path (str): Output file.
+        dtype (str): Binary track storage type, int32 or int64.
+        progress (callable): Optional callback(written, count).
+        Other args as for generate().
+    Returns:
+        int: Number of requests written.
+    """
+    chunks = generate(count, diskSize, mix, seed, arrivals, chunkSize, **params)
+    written = 0
+    if os.path.splitext(path)[1].lower() in (".csv", ".txt"):
+        with open(path, "w") as file:
+            for tracks, times in chunks:
+                if times is None:
+                    np.savetxt(file, tracks, fmt="%d")
+                else:
+                    np.savetxt(file, np.column_stack((times, tracks)), fmt=("%.3f", "%d"), delimiter=",")
+                written += tracks.size
+                if progress:
+                    progress(written, count)
+        return written
+
+    from binary_trace import TraceWriter
+
+    with TraceWriter(path, diskSize, dtype, timestamps=arrivals is not None) as writer:
+        for tracks, times in chunks:
+            writer.write(tracks, times)
+            written += tracks.size
+            if progress:
+                progress(written, count)
+    return written
+
+def _parse_mix(items):
+    """["zipf=0.7", "sequential=0.3"] -> {"zipf": 0.7, "sequential": 0.3}; a bare name has weight 1."""
+    mix = {}
+    for item in items:
+        name, _, weight = item.partition("=")
+        mix[name] = float(weight) if weight else 1.0
+    return mix
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a reproducible synthetic workload and stream it to disk.")
+    parser.add_argument("out", help="Output file: .csv/.txt for text, anything else for a binary trace.")
+    parser.add_argument("-n", "--count", type=int, required=True, help="Number of requests.")
+    parser.add_argument("--disk-size", type=int, default=200)
+    parser.add_argument("--mix", nargs="+", default=["uniform"], metavar="NAME[=WEIGHT]",
+                        help=f"Distribution or weighted mixture of: {', '.join(DISTRIBUTIONS)}.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--zipf-exponent", type=float, default=1.1)
+    parser.add_argument("--hot-spots", type=int, default=32)
+    parser.add_argument("--hot-spot-width", type=int, default=None, help="Tracks per hot spot.")
+    parser.add_argument("--run-length", type=int, default=64, help="Requests per sequential run.")
+    parser.add_argument("--arrivals", choices=ARRIVALS, default=None, help="Also write arrival timestamps (ms).")
+    parser.add_argument("--rate", type=float, default=1000.0, help="Arrivals per second (while ON for bursty).")
+    parser.add_argument("--on-ms", type=float, default=100.0)
+    parser.add_argument("--off-ms", type=float, default=400.0)
+    parser.add_argument("--dtype", choices=["int32", "int64"], default="int32")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    args = parser.parse_args(argv)
+
+    written = write_workload(
+        args.out, args.count, args.disk_size, _parse_mix(args.mix), args.seed, args.arrivals, args.chunk_size,
+        args.dtype, progress=lambda done, total: print(f"\r{done}/{total} requests", end="", flush=True),
+        zipfExponent=args.zipf_exponent, hotSpots=args.hot_spots, hotSpotWidth=args.hot_spot_width,
+        runLength=args.run_length, rate=args.rate, onMs=args.on_ms, offMs=args.off_ms)
+    print(f"\nWrote {written} requests to {args.out}")
+
+if __name__ == "__main__":
+    main()